@@ -0,0 +1,139 @@
+"""
+경매 종료 스케줄러
+
+활성 경매의 종료 시간을 최소 힙에 넣어 두고, 가장 이른 종료 시간까지 잠들었다가
+종료 시간이 되면 해당 경매만 즉시 종료 처리합니다.
+새 경매는 OceanTradeService.register_auction의 경매 등록 알림으로 등록되며 (API 스레드에서 호출되므로 스레드 안전),
+다른 프로세스에서 등록된 경매는 리더 프로세스가 주기적으로 새 경매를 읽어 등록합니다.
+주기적인 DB 점검(finalize_expired_auctions)이 누락된 경매를 보완합니다.
+스케줄러가 실행 중이지 않은 프로세스(리더가 아닌 워커)에서는 등록을 무시합니다.
+"""
+
+import asyncio
+import heapq
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.ocean_trade.application.auction_events import add_auction_registered_listener
+
+
+class AuctionExpiryScheduler:
+    """
+    최소 힙 기반 경매 종료 스케줄러
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_loaded_auction_id = 0
+
+    def schedule(self, auction_id: int, end_time: datetime) -> None:
+        """
+        경매 종료 시간을 등록합니다. 어느 스레드에서든 호출할 수 있습니다.
+
+        Args:
+            auction_id: 경매 ID
+            end_time: 경매 종료 예정 시간
+        """
+        if self._task is None:
+            return
+
+        due_at = end_time.timestamp()
+        with self._lock:
+            if self._scheduled.get(auction_id) == due_at:
+                return
+            self._scheduled[auction_id] = due_at
+            heapq.heappush(self._heap, (due_at, auction_id))
+            is_earliest = self._heap[0] == (due_at, auction_id)
+
+        # 가장 이른 종료 시간이 바뀐 경우에만 대기 중인 루프를 깨운다
+        if is_earliest and self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def schedule_all(self, auctions: List[Tuple[int, datetime]]) -> None:
+        """
+        여러 경매의 종료 시간을 등록합니다.
+
+        Args:
+            auctions: (경매 ID, 종료 예정 시간) 목록
+        """
+        for auction_id, end_time in auctions:
+            self.schedule(auction_id, end_time)
+            self.last_loaded_auction_id = max(self.last_loaded_auction_id, auction_id)
+
+    def _seconds_until_next(self) -> Optional[float]:
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - datetime.now().timestamp())
+
+    def _pop_due(self) -> List[int]:
+        now = datetime.now().timestamp()
+        due_ids = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_at, auction_id = heapq.heappop(self._heap)
+                # 종료 시간이 바뀌어 다시 등록된 경매의 이전 항목은 무시
+                if self._scheduled.get(auction_id) == due_at:
+                    del self._scheduled[auction_id]
+                    due_ids.append(auction_id)
+        return due_ids
+
+    async def _run(self) -> None:
+        from app.background.metrics import instrument
+        from app.background.tasks import finalize_auctions_by_ids
+
+        finalize = instrument("auction_expiry", finalize_auctions_by_ids)
+
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._seconds_until_next())
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            due_ids = self._pop_due()
+            if not due_ids:
+                continue
+
+            try:
+                await finalize(due_ids)
+            except Exception as e:
+                print(f"경매 종료 스케줄러 오류: {e}")
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 스케줄러를 시작합니다."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """스케줄러를 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+        self._wakeup = None
+        with self._lock:
+            self._heap.clear()
+            self._scheduled.clear()
+        self.last_loaded_auction_id = 0
+
+
+# 싱글톤 인스턴스
+auction_expiry_scheduler = AuctionExpiryScheduler()
+
+# 새로 등록된 경매를 종료 시간에 맞춰 예약
+add_auction_registered_listener(auction_expiry_scheduler.schedule)
@@ -0,0 +1,51 @@
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, status
+
+from app.config import get_settings
+from app.core.security.jwt import get_current_username
+from app.background.leader import leader_election
+from app.background.metrics import job_metrics
+from app.background.scheduler import job_policy, scheduler
+
+settings = get_settings()
+
+# 내부 운영 정보이므로 로그인한 사용자만 조회 가능
+router = APIRouter(prefix="/internal", tags=["Internal"], dependencies=[Depends(get_current_username)])
+
+
+@router.get(
+    "/jobs",
+    status_code=status.HTTP_200_OK,
+    summary="백그라운드 작업 상태 조회",
+    description="현재 프로세스의 스케줄 작업별 실행 지표(실행 시간 히스토그램, 처리 행 수, 외부 호출 수, 누락/중복 실행/취소 횟수, 마지막 오류 종류)와 스케줄 정책을 조회합니다."
+)
+def get_jobs() -> Dict[str, Any]:
+    """
+    백그라운드 작업 상태 조회 엔드포인트 (읽기 전용, 인증 필요)
+
+    오류 메시지에는 내부 정보가 포함될 수 있으므로 마지막 오류는 예외 종류만 노출합니다.
+
+    지표는 프로세스 메모리에 기록되므로 API 전용 모드(RUN_BACKGROUND_JOBS=false)에서는
+    작업을 실행하는 워커 프로세스의 지표가 아닌 빈 값이 조회됩니다.
+
+    Returns:
+        Dict[str, Any]: 리더 여부, 스케줄러 상태, 작업별 지표
+    """
+    scheduled = {job.id: job for job in scheduler.get_jobs()} if scheduler.running else {}
+
+    jobs = []
+    for metrics in job_metrics.snapshot():
+        job = scheduled.get(metrics["job_id"])
+        jobs.append({
+            **metrics,
+            "scheduled": job is not None,
+            "next_run_time": job.next_run_time if job is not None else None,
+            "policy": job_policy(metrics["job_id"]) if job is not None else None
+        })
+
+    return {
+        "run_background_jobs": settings.RUN_BACKGROUND_JOBS,
+        "is_leader": leader_election.is_leader,
+        "scheduler_running": scheduler.running,
+        "jobs": jobs
+    }
@@ -0,0 +1,99 @@
+"""
+백그라운드 작업 실행기
+
+동기 SQLAlchemy 세션을 사용하는 DB 작업을 이벤트 루프 밖의 제한된 스레드 풀에서 실행합니다.
+HTTP/AI 호출처럼 await 가능한 작업만 이벤트 루프에 남겨 API 요청 처리가 지연되지 않도록 합니다.
+같은 행(해양 시세 등)을 갱신하는 작업은 run_serialized로 전용 단일 스레드에서 순서대로 실행합니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+from app.config import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_serial_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    백그라운드 DB 작업용 스레드 풀을 반환합니다.
+
+    Returns:
+        ThreadPoolExecutor: BACKGROUND_DB_WORKERS 크기의 스레드 풀
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.BACKGROUND_DB_WORKERS,
+            thread_name_prefix="background-db"
+        )
+    return _executor
+
+
+def get_serial_executor() -> ThreadPoolExecutor:
+    """
+    순서대로 실행해야 하는 DB 작업용 단일 스레드 풀을 반환합니다.
+
+    Returns:
+        ThreadPoolExecutor: 스레드 1개짜리 풀
+    """
+    global _serial_executor
+    if _serial_executor is None:
+        _serial_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background-db-serial")
+    return _serial_executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 함수를 백그라운드 스레드 풀에서 실행하고 결과를 기다립니다.
+    호출한 쪽의 컨텍스트 변수(작업 지표 등)를 복사해 스레드에서도 그대로 사용합니다.
+
+    Args:
+        func: 실행할 동기 함수
+        *args: 함수 위치 인자
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        함수 실행 결과
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+async def run_serialized(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 함수를 전용 단일 스레드에서 실행하고 결과를 기다립니다.
+
+    해양 시세처럼 여러 작업이 같은 행을 읽고 고쳐 쓰는 DB 작업에 사용합니다.
+    제출된 순서대로 하나씩 실행되며, 기다리던 쪽이 취소되어도 이미 시작된 작업과 겹치지 않습니다.
+
+    Args:
+        func: 실행할 동기 함수
+        *args: 함수 위치 인자
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        함수 실행 결과
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_serial_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+def shutdown_executor() -> None:
+    """스레드 풀을 종료합니다. 실행 중인 작업은 완료될 때까지 기다립니다."""
+    global _executor, _serial_executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    if _serial_executor is not None:
+        _serial_executor.shutdown(wait=True)
+        _serial_executor = None
@@ -0,0 +1,198 @@
+"""
+백그라운드 작업 리더 선출
+
+여러 API 워커 프로세스 중 하나만 스케줄 작업을 실행하도록 잠금을 잡은 프로세스를 리더로 정합니다.
+- MySQL: 전용 커넥션에서 GET_LOCK (커넥션이 끊기면 자동으로 해제되어 다른 프로세스가 이어받음)
+- 그 외(SQLite 등): 잠금 파일에 fcntl.flock (프로세스가 종료되면 자동 해제, 같은 호스트에서만 유효)
+리더가 아닌 프로세스는 주기적으로 잠금을 다시 시도해 리더가 죽으면 자동으로 이어받습니다.
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.database import engine
+from app.background.executor import run_blocking
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class LeaderElection:
+    """
+    잠금 기반 리더 선출
+    """
+
+    def __init__(self, lock_name: str, lock_file: str):
+        self.lock_name = lock_name
+        self.lock_file = lock_file
+        self._connection: Optional[Connection] = None
+        self._file_descriptor: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._term = 0
+
+    @property
+    def is_leader(self) -> bool:
+        """현재 프로세스가 리더인지 여부"""
+        return self._connection is not None or self._file_descriptor is not None
+
+    @property
+    def term(self) -> int:
+        """리더 임기 번호 (잠금을 새로 얻을 때마다 1 증가)"""
+        return self._term
+
+    def try_acquire(self) -> bool:
+        """
+        리더 잠금을 시도합니다. (블로킹)
+
+        Returns:
+            bool: 리더가 되었는지 여부
+        """
+        if self.is_leader:
+            return True
+        if engine.dialect.name == "mysql":
+            acquired = self._acquire_mysql_lock()
+        else:
+            acquired = self._acquire_file_lock()
+        if acquired:
+            self._term += 1
+        return acquired
+
+    def verify(self) -> bool:
+        """
+        리더 잠금을 아직 보유하고 있는지 확인합니다. (블로킹)
+
+        Returns:
+            bool: 리더 잠금 보유 여부 - 잃었다면 내부 상태도 정리됨
+        """
+        if self._connection is None:
+            return self._file_descriptor is not None
+
+        try:
+            holder = self._connection.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"),
+                {"name": self.lock_name}
+            ).scalar()
+            self._connection.commit()
+            if holder:
+                return True
+        except Exception as e:
+            print(f"⚠️  리더 잠금 확인 오류: {e}")
+
+        self._close_connection()
+        return False
+
+    def release(self) -> None:
+        """리더 잠금을 해제합니다. (블로킹)"""
+        if self._connection is not None:
+            try:
+                self._connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.lock_name})
+            except Exception:
+                pass
+            self._close_connection()
+
+        if self._file_descriptor is not None:
+            import fcntl
+
+            fcntl.flock(self._file_descriptor, fcntl.LOCK_UN)
+            os.close(self._file_descriptor)
+            self._file_descriptor = None
+
+    def _acquire_mysql_lock(self) -> bool:
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT GET_LOCK(:name, 0)"),
+                {"name": self.lock_name}
+            ).scalar()
+            # GET_LOCK은 트랜잭션과 무관하게 커넥션에 묶이므로 자동 시작된 트랜잭션만 정리
+            connection.commit()
+        except Exception as e:
+            print(f"⚠️  리더 잠금 획득 오류: {e}")
+            connection.close()
+            return False
+
+        if acquired != 1:
+            connection.close()
+            return False
+
+        self._connection = connection
+        return True
+
+    def _acquire_file_lock(self) -> bool:
+        import fcntl
+
+        file_descriptor = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(file_descriptor)
+            return False
+
+        os.ftruncate(file_descriptor, 0)
+        os.write(file_descriptor, str(os.getpid()).encode())
+        self._file_descriptor = file_descriptor
+        return True
+
+    def _close_connection(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            # 풀로 돌려보내지 않고 실제 커넥션을 닫아 서버 측 잠금도 확실히 해제
+            self._connection.invalidate()
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    async def _monitor(
+        self,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]]
+    ) -> None:
+        while True:
+            await asyncio.sleep(settings.LEADER_CHECK_INTERVAL_SECONDS)
+            try:
+                if self.is_leader:
+                    if not await run_blocking(self.verify):
+                        print("⚠️  백그라운드 작업 리더 잠금을 잃었습니다. 스케줄 작업을 중지합니다.")
+                        await on_demoted()
+                elif await run_blocking(self.try_acquire):
+                    print(f"👑 백그라운드 작업 리더로 선출되었습니다. (pid={os.getpid()})")
+                    await on_elected()
+            except Exception as e:
+                print(f"⚠️  리더 선출 오류: {e}")
+
+    def start_monitor(
+        self,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        리더 잠금을 주기적으로 확인/재시도하는 작업을 시작합니다.
+
+        Args:
+            on_elected: 리더가 되었을 때 실행할 함수
+            on_demoted: 리더 잠금을 잃었을 때 실행할 함수
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._monitor(on_elected, on_demoted))
+
+    async def stop(self) -> None:
+        """확인 작업을 중지하고 리더 잠금을 해제합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await run_blocking(self.release)
+
+
+# 싱글톤 인스턴스
+leader_election = LeaderElection(
+    lock_name=settings.LEADER_LOCK_NAME,
+    lock_file=settings.LEADER_LOCK_FILE
+)
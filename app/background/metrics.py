@@ -0,0 +1,235 @@
+"""
+백그라운드 작업 실행 지표
+
+작업별 실행 시간 히스토그램, 처리한 행 수, 외부 호출 수, 누락(misfire)/중복 실행(overlap)/취소 횟수,
+마지막 오류 종류를 프로세스 메모리에 기록합니다. /internal/jobs 엔드포인트에서 조회합니다.
+오류 메시지에는 URL, 키, SQL 등이 섞일 수 있으므로 예외 클래스 이름만 보관합니다. (상세 내용은 로그 출력)
+
+작업 안에서는 record_rows / record_external_call / record_failure로 현재 실행 중인 작업의 지표를 올립니다.
+(run_blocking은 컨텍스트를 복사하므로 스레드 풀 안에서 호출해도 같은 실행에 기록됩니다)
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+# 실행 시간 히스토그램 구간 상한 (초)
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class _JobRun:
+    """한 번의 작업 실행 중 누적되는 값"""
+
+    def __init__(self):
+        self.rows_touched = 0
+        self.external_calls = 0
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add_rows(self, count: int) -> None:
+        with self._lock:
+            self.rows_touched += count
+
+    def add_external_calls(self, count: int) -> None:
+        with self._lock:
+            self.external_calls += count
+
+
+_current_run: contextvars.ContextVar[Optional[_JobRun]] = contextvars.ContextVar("current_job_run", default=None)
+
+
+def record_rows(count: int) -> None:
+    """
+    현재 실행 중인 작업이 처리한 행 수를 기록합니다.
+
+    Args:
+        count: 처리한 행 수
+    """
+    run = _current_run.get()
+    if run is not None and count:
+        run.add_rows(count)
+
+
+def record_failure(error: BaseException) -> None:
+    """
+    현재 실행 중인 작업 안에서 처리(출력 후 무시)된 오류를 기록합니다.
+
+    Args:
+        error: 발생한 예외
+    """
+    run = _current_run.get()
+    if run is not None:
+        run.error = type(error).__name__
+
+
+def record_external_call(count: int = 1) -> None:
+    """
+    현재 실행 중인 작업의 외부 호출(HTTP/AI) 수를 기록합니다.
+
+    Args:
+        count: 외부 호출 수
+    """
+    run = _current_run.get()
+    if run is not None and count:
+        run.add_external_calls(count)
+
+
+class JobMetrics:
+    """작업 하나의 누적 지표"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.runs = 0
+        self.failures = 0
+        self.cancellations = 0
+        self.running = 0
+        self.misfires = 0
+        self.overlaps = 0
+        self.rows_touched = 0
+        self.external_calls = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration: Optional[float] = None
+        self.duration_buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.last_started_at: Optional[datetime] = None
+        self.last_finished_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        histogram = {f"le_{bound}": count for bound, count in zip(DURATION_BUCKETS, self.duration_buckets)}
+        histogram["le_inf"] = self.duration_buckets[-1]
+        return {
+            "job_id": self.job_id,
+            "runs": self.runs,
+            "failures": self.failures,
+            "cancellations": self.cancellations,
+            "running": self.running,
+            "misfires": self.misfires,
+            "overlaps": self.overlaps,
+            "rows_touched": self.rows_touched,
+            "external_calls": self.external_calls,
+            "average_duration": round(self.total_duration / self.runs, 4) if self.runs else None,
+            "max_duration": round(self.max_duration, 4),
+            "last_duration": round(self.last_duration, 4) if self.last_duration is not None else None,
+            "duration_histogram": histogram,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at
+        }
+
+
+class JobMetricsRegistry:
+    """작업별 지표 저장소"""
+
+    def __init__(self):
+        self._metrics: Dict[str, JobMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, job_id: str) -> JobMetrics:
+        metrics = self._metrics.get(job_id)
+        if metrics is None:
+            metrics = self._metrics[job_id] = JobMetrics(job_id)
+        return metrics
+
+    def register(self, job_id: str) -> None:
+        """작업을 등록합니다. (한 번도 실행되지 않은 작업도 조회되도록)"""
+        with self._lock:
+            self._get(job_id)
+
+    def record_started(self, job_id: str) -> None:
+        with self._lock:
+            metrics = self._get(job_id)
+            metrics.running += 1
+            metrics.last_started_at = datetime.now(ZoneInfo("Asia/Seoul"))
+
+    def record_finished(self, job_id: str, duration: float, run: _JobRun, error: Optional[BaseException]) -> None:
+        with self._lock:
+            metrics = self._get(job_id)
+            metrics.running -= 1
+            metrics.runs += 1
+            metrics.total_duration += duration
+            metrics.max_duration = max(metrics.max_duration, duration)
+            metrics.last_duration = duration
+            metrics.rows_touched += run.rows_touched
+            metrics.external_calls += run.external_calls
+            metrics.last_finished_at = datetime.now(ZoneInfo("Asia/Seoul"))
+
+            bucket = len(DURATION_BUCKETS)
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    bucket = index
+                    break
+            metrics.duration_buckets[bucket] += 1
+
+            # 시간 초과 등으로 취소된 실행 (초기 작업 제한 시간 초과, 종료 시 취소)
+            if isinstance(error, asyncio.CancelledError):
+                metrics.cancellations += 1
+                return
+
+            error_message = type(error).__name__ if error is not None else run.error
+            if error_message is not None:
+                metrics.failures += 1
+                metrics.last_error = error_message
+                metrics.last_error_at = metrics.last_finished_at
+
+    def record_misfire(self, job_id: str) -> None:
+        with self._lock:
+            self._get(job_id).misfires += 1
+
+    def record_overlap(self, job_id: str) -> None:
+        with self._lock:
+            self._get(job_id).overlaps += 1
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        모든 작업의 지표를 조회합니다.
+
+        Returns:
+            List[Dict[str, Any]]: 작업 ID 순으로 정렬된 지표 목록
+        """
+        with self._lock:
+            return [self._metrics[job_id].to_dict() for job_id in sorted(self._metrics)]
+
+
+# 싱글톤 인스턴스
+job_metrics = JobMetricsRegistry()
+
+
+def instrument(job_id: str, job: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """
+    비동기 작업을 지표 기록 래퍼로 감쌉니다.
+
+    Args:
+        job_id: 작업 ID
+        job: 비동기 작업 함수
+
+    Returns:
+        지표를 기록하는 비동기 함수
+    """
+    job_metrics.register(job_id)
+
+    @functools.wraps(job)
+    async def wrapper(*args, **kwargs):
+        run = _JobRun()
+        token = _current_run.set(run)
+        job_metrics.record_started(job_id)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return await job(*args, **kwargs)
+        except BaseException as e:
+            # CancelledError는 Exception이 아니므로 BaseException으로 받아 취소 횟수로 기록
+            error = e
+            raise
+        finally:
+            job_metrics.record_finished(job_id, time.perf_counter() - started, run, error)
+            _current_run.reset(token)
+
+    return wrapper
@@ -0,0 +1,243 @@
+"""
+백그라운드 작업 스케줄러
+
+APScheduler 작업 등록, 서버 시작 시 초기 작업, 리더 선출에 따른 작업 시작/중지를 담당합니다.
+API 프로세스(app.main, RUN_BACKGROUND_JOBS=true)와 전용 워커(app.background.worker) 모두 이 모듈로 작업을 실행합니다.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, JobEvent
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.config import get_settings
+from app.background import tasks
+from app.background.executor import run_blocking, shutdown_executor
+from app.background.auction_scheduler import auction_expiry_scheduler
+from app.background.leader import leader_election
+from app.background.metrics import instrument, job_metrics
+from app.background.warmup import run_warmup, warmup_state
+from app.domain.article.application.url_filter import known_article_urls
+
+settings = get_settings()
+scheduler = AsyncIOScheduler()
+_startup_task: Optional[asyncio.Task] = None
+
+# 실행 지표를 기록하도록 감싼 작업 (스케줄 실행과 서버 시작 시 초기 실행 모두 기록)
+fetch_and_update_articles = instrument("fetch_articles", tasks.fetch_and_update_articles)
+update_ocean_prices_by_garbage = instrument("update_prices_by_garbage", tasks.update_ocean_prices_by_garbage)
+generate_building_income = instrument("generate_building_income", tasks.generate_building_income)
+fetch_and_update_ocean_data = instrument("fetch_ocean_data", tasks.fetch_and_update_ocean_data)
+finalize_expired_auctions = instrument("finalize_expired_auctions", tasks.finalize_expired_auctions)
+load_new_auctions = instrument("load_new_auctions", tasks.load_new_auctions)
+
+
+def job_policy(job_id: str) -> Dict[str, Any]:
+    """
+    설정에 정의된 작업별 스케줄 정책을 반환합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        Dict[str, Any]: add_job에 전달할 max_instances, coalesce, misfire_grace_time
+    """
+    return {
+        "max_instances": settings.JOB_MAX_INSTANCES.get(job_id, 1),
+        "coalesce": settings.JOB_COALESCE.get(job_id, True),
+        "misfire_grace_time": settings.JOB_MISFIRE_GRACE_SECONDS.get(job_id, 1)
+    }
+
+
+def _on_job_skipped(event: JobEvent) -> None:
+    if event.code == EVENT_JOB_MISSED:
+        job_metrics.record_misfire(event.job_id)
+    elif event.code == EVENT_JOB_MAX_INSTANCES:
+        job_metrics.record_overlap(event.job_id)
+
+
+scheduler.add_listener(_on_job_skipped, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+
+
+def _rebuild_income_rate_rollups():
+    from app.database import SessionLocal
+    from app.domain.ocean_management.domain.repository import OceanManagementRepository
+
+    db = SessionLocal()
+    try:
+        OceanManagementRepository(db).rebuild_income_rate_rollups(datetime.now(ZoneInfo("Asia/Seoul")))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _generate_missions():
+    from app.database import SessionLocal
+    from app.domain.mission.application.service import MissionService
+
+    db = SessionLocal()
+    try:
+        mission_service = MissionService(db)
+        await mission_service.check_and_generate_missions()
+    finally:
+        db.close()
+
+
+async def run_startup_jobs():
+    """
+    서버 시작 시 백그라운드 작업을 즉시 한 번 실행합니다. (리더 프로세스에서만)
+
+    외부 API를 호출하는 초기 작업은 동시에 실행하며, 작업별로 STARTUP_WARMUP_TIMEOUT_SECONDS를 넘기면 포기합니다.
+    """
+    # 건물 수익률 집계값을 buildings 테이블 기준으로 맞춤
+    try:
+        await run_blocking(_rebuild_income_rate_rollups)
+    except Exception as e:
+        print(f"⚠️  건물 수익률 집계 재계산 오류: {e}")
+
+    # 서버 시작 시 백그라운드 작업 즉시 한 번 실행
+    print("🚀 서버 시작 시 백그라운드 작업 초기 실행 중...")
+
+    # generate_building_income은 매 초마다 실행되므로 초기 실행 생략
+    await run_warmup(
+        [
+            ("기사 수집", fetch_and_update_articles),
+            ("쓰레기 수집 기반 시세 업데이트", update_ocean_prices_by_garbage),
+            ("해양 관측소 데이터 수집", fetch_and_update_ocean_data),
+            # 미션 자동 생성 (5개 유지)
+            ("미션 자동 생성", _generate_missions)
+        ],
+        timeout=settings.STARTUP_WARMUP_TIMEOUT_SECONDS
+    )
+
+
+def register_jobs():
+    """백그라운드 작업을 스케줄러에 등록합니다."""
+    # 1. 주기적으로 기사 수집 및 시세 업데이트 (1시간마다)
+    scheduler.add_job(
+        fetch_and_update_articles,
+        'interval',
+        minutes=settings.ARTICLE_FETCH_INTERVAL_MINUTES,
+        id='fetch_articles',
+        **job_policy('fetch_articles')
+    )
+
+    # 2. 쓰레기 수집 횟수에 따른 시세 업데이트 (10분마다)
+    scheduler.add_job(
+        update_ocean_prices_by_garbage,
+        'interval',
+        minutes=settings.PRICE_UPDATE_INTERVAL_MINUTES,
+        id='update_prices_by_garbage',
+        **job_policy('update_prices_by_garbage')
+    )
+
+    # 3. 빌딩/음식점 수익금 지급 (1초마다)
+    scheduler.add_job(
+        generate_building_income,
+        'interval',
+        seconds=settings.INCOME_GENERATION_INTERVAL_SECONDS,
+        id='generate_building_income',
+        **job_policy('generate_building_income')
+    )
+
+    # 4. 해양 관측소 데이터 수집 및 시세 업데이트 (30분마다)
+    scheduler.add_job(
+        fetch_and_update_ocean_data,
+        'interval',
+        minutes=settings.OCEAN_DATA_FETCH_INTERVAL_MINUTES,
+        id='fetch_ocean_data',
+        **job_policy('fetch_ocean_data')
+    )
+
+    # 5. 경매 자동 종료 누락 점검 (10분마다, 평소에는 경매 종료 스케줄러가 종료 시간에 맞춰 처리)
+    scheduler.add_job(
+        finalize_expired_auctions,
+        'interval',
+        minutes=settings.AUCTION_SWEEP_INTERVAL_MINUTES,
+        id='finalize_expired_auctions',
+        **job_policy('finalize_expired_auctions')
+    )
+
+    # 6. 다른 워커에서 등록된 새 경매를 경매 종료 스케줄러에 등록 (10초마다)
+    scheduler.add_job(
+        load_new_auctions,
+        'interval',
+        seconds=settings.AUCTION_RELOAD_INTERVAL_SECONDS,
+        id='load_new_auctions',
+        **job_policy('load_new_auctions')
+    )
+
+
+async def on_elected():
+    """리더가 되었을 때: 기사 URL 필터 무효화, 경매 종료 스케줄러 시작 및 스케줄 작업 재개"""
+    # 리더가 아니던 동안 다른 프로세스가 저장한 기사 URL을 다시 읽도록 필터를 비움
+    known_article_urls.invalidate()
+    auction_expiry_scheduler.start()
+    try:
+        # 밀린 경매 종료 처리 및 활성 경매 등록
+        await finalize_expired_auctions()
+    except Exception as e:
+        print(f"⚠️  경매 종료 스케줄러 초기화 오류: {e}")
+    scheduler.resume()
+    print("📅 백그라운드 작업 스케줄러 시작됨\n")
+
+
+async def on_demoted():
+    """리더 잠금을 잃었을 때: 스케줄 작업 중지"""
+    scheduler.pause()
+    await auction_expiry_scheduler.stop()
+
+
+async def _start_as_leader():
+    term = leader_election.term
+    await run_startup_jobs()
+
+    # 초기 작업 중 리더 잠금을 잃었거나 (다시 얻어 모니터가 이미 재개한 경우 포함) 임기가 바뀌었으면 재개하지 않음
+    if leader_election.term != term or not await run_blocking(leader_election.verify):
+        print("⚠️  초기 작업 중 리더 잠금을 잃어 스케줄 작업을 재개하지 않습니다.")
+        return
+    await on_elected()
+
+
+async def start_background_jobs():
+    """
+    백그라운드 작업을 시작합니다.
+
+    모든 작업을 일시 정지 상태로 등록한 뒤, 리더 잠금을 얻은 경우에만 초기 작업을 실행하고 재개합니다.
+    리더가 아니면 리더 잠금을 주기적으로 재시도하며, 리더가 종료되면 이어받습니다.
+    """
+    global _startup_task
+    register_jobs()
+    scheduler.start(paused=True)
+
+    if await run_blocking(leader_election.try_acquire):
+        print(f"👑 백그라운드 작업 리더로 선출되었습니다. (pid={os.getpid()})")
+        if settings.STARTUP_WARMUP_MODE == "blocking":
+            await _start_as_leader()
+        else:
+            # 초기 작업을 기다리지 않고 바로 요청을 받음 (진행 상태는 /ready로 확인)
+            warmup_state.begin()
+            _startup_task = asyncio.get_running_loop().create_task(_start_as_leader())
+    else:
+        print("⏸️  다른 프로세스가 백그라운드 작업을 실행 중입니다. 리더 잠금을 기다립니다.\n")
+
+    leader_election.start_monitor(on_elected, on_demoted)
+
+
+async def stop_background_jobs():
+    """백그라운드 작업을 중지하고 리더 잠금을 해제합니다."""
+    global _startup_task
+    if _startup_task is not None:
+        _startup_task.cancel()
+        try:
+            await _startup_task
+        except asyncio.CancelledError:
+            pass
+        _startup_task = None
+    scheduler.shutdown()
+    await auction_expiry_scheduler.stop()
+    await leader_election.stop()
+    shutdown_executor()
@@ -8,199 +8,491 @@
 4. 해양 관측소 데이터 수집 및 시세 업데이트
 """
 
+import asyncio
+import hashlib
 import httpx
 import math
 import random
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
+from app.background.executor import run_blocking, run_serialized
+from app.background.auction_scheduler import auction_expiry_scheduler
+from app.background.metrics import record_external_call, record_failure, record_rows
 from app.domain.article.domain.entity import Article, ArticleSentiment
-from app.domain.ocean.domain.entity import Ocean, WaterQuality, WaterQualityStatus
-from app.domain.ocean.domain.repository import OceanRepository
+from app.domain.article.domain.repository import ArticleRepository, ArticleSentimentCacheRepository, NewsFetchWatermarkRepository
+from app.domain.article.application.sentiment_cache import make_sentiment_cache_key, sentiment_lru_cache
+from app.domain.article.application.ocean_matcher import get_ocean_matcher
+from app.domain.article.application.url_filter import known_article_urls
+from app.domain.ocean.domain.entity import Ocean, WaterQualityStatus
+from app.domain.ocean.domain.repository import OceanRepository, WaterQualityRepository
 from app.domain.ocean_management.domain.entity import Building, BuildingType
+from app.domain.ocean_management.domain.repository import OceanManagementRepository
 from app.domain.auth.domain.entity import User
 from app.config import get_settings
 from app.core.ai.ai_client import ai_client
+from app.core.geo import GeoKDTree
+from app.core.http import CachedResponse, cached_get
 
 settings = get_settings()
 
+# 같은 프로세스에서 경매 정산이 동시에 실행되지 않도록 보호
+_auction_finalize_lock = threading.Lock()
+
+# 부산 지역 해양 관련 의미있는 키워드로 검색
+NEWS_QUERY_KEYWORDS = (
+    "(부산 OR 해운대 OR 광안리 OR 송정 OR 영도 OR 다대포 OR 기장 OR 오륙도 OR 수영만 OR 부산항) "
+    "AND "
+    "(해양 OR 수질 OR 바다 OR 해수욕장 OR 해양오염 OR 해양환경 OR 해양보호 OR "
+    "수질개선 OR 해양쓰레기 OR 해양생태 OR 해양보전 OR 적조 OR 녹조 OR "
+    "해양관리 OR 수산 OR 어업 OR 해양생물 OR 해수 OR 연안)"
+)
+NEWS_QUERY_LANGUAGE = "ko"
+NEWS_QUERY_HASH = hashlib.sha256(f"{NEWS_QUERY_LANGUAGE}\n{NEWS_QUERY_KEYWORDS}".encode("utf-8")).hexdigest()
+
+# 쓰레기 수집 횟수 구간별 가격 변동 (수집 횟수 하한(초과), 가격 변동량)
+GARBAGE_PRICE_TIERS = [
+    (100, 500),  # 많이 수집: +500
+    (50, 300),  # 보통 수집: +300
+    (20, 100),  # 조금 수집: +100
+    (0, 0),  # 최소 수집: 유지
+]
+GARBAGE_NO_COLLECTION_PRICE_CHANGE = -200  # 수집 없음: -200
+
+# 해양-관측소 매칭 최대 거리 (km)
+STATION_MATCH_RADIUS_KM = 200
+
+# 마지막 관측소 매칭 결과 (key: (관측소 응답 본문 해시, 해양 좌표 해시), matches: (해양 ID, 관측소 유형, 거리) 목록)
+_station_match_cache: Dict[str, Any] = {}
+
 
 def _record_ocean_price_history(repo: OceanRepository, ocean: Ocean, previous_price: int) -> None:
     if ocean.current_price != previous_price:
-        repo.add_price_history(ocean.ocean_id, ocean.current_price)
+        repo.add_price_history(ocean)
 
 
 async def fetch_and_update_articles():
     """
     주기적으로 뉴스 기사를 수집하고 시세를 업데이트합니다.
 
-    1. 뉴스 API에서 해양 관련 기사 조회
+    1. 뉴스 API에서 워터마크 이후 발행된 해양 관련 기사 조회 (페이지 동시 요청)
     2. 기사 제목에 해양 이름이 포함된 기사만 필터링
     3. 기사 내용을 기반으로 감성 분석 (긍정/부정/중립)
     4. 기사에 따라 해양 시세 업데이트
     5. DB에 기사 저장 (이미지 포함)
+
+    HTTP/AI 호출은 이벤트 루프에서, DB 작업은 백그라운드 스레드 풀에서 실행됩니다.
     """
+    try:
+        # 마지막으로 수집한 기사 이후만 조회 (워터마크)
+        watermark = await run_blocking(_load_news_watermark)
+
+        articles_data, complete = await _fetch_news_since(watermark)
+
+        if articles_data is None:
+            return
+
+        print(f"📰 뉴스 API에서 {len(articles_data)}개 기사 조회 완료")
+
+        # 모든 페이지를 받은 경우에만 워터마크 전진 (실패한 페이지는 다음 주기에 다시 조회)
+        new_watermark = _latest_published_at(articles_data) if complete else None
+
+        # 중복 확인 및 해양 매칭 (DB 작업)
+        matched_articles = await run_blocking(_match_new_articles, articles_data)
+
+        # AI로 감성 분석 (이벤트 루프, 동시 실행)
+        await _analyze_article_sentiments(matched_articles)
+
+        # 기사 저장 및 시세 반영 (DB 작업, 한 번에 커밋, 다른 시세 갱신 작업과 순서대로)
+        await run_serialized(_save_analyzed_articles, matched_articles, new_watermark)
+        print(f"✅ 총 {len(matched_articles)}개 기사 매칭 및 저장 완료")
+
+    except Exception as e:
+        print(f"기사 수집 오류: {e}")
+        record_failure(e)
+
+
+def _load_news_watermark() -> Optional[datetime]:
     db: Session = SessionLocal()
+    try:
+        return NewsFetchWatermarkRepository(db).find_last_published_at(NEWS_QUERY_HASH)
+    finally:
+        db.close()
+
 
+def _parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """뉴스 API의 publishedAt(ISO 8601)을 UTC naive datetime으로 변환합니다."""
+    if not value:
+        return None
     try:
-        # 모든 해양 조회
-        ocean_repository = OceanRepository(db)
-        oceans = db.query(Ocean).all()
+        published_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at
+
+
+def _latest_published_at(articles_data: List[Dict[str, Any]]) -> Optional[datetime]:
+    published = [_parse_published_at(article.get("publishedAt")) for article in articles_data]
+    published = [value for value in published if value is not None]
+    return max(published) if published else None
+
+
+async def _fetch_news_page(
+    page: int,
+    since: Optional[datetime],
+    ttl_seconds: float
+) -> Optional[CachedResponse]:
+    params = {
+        "apiKey": settings.NEWS_API_KEY,
+        "q": NEWS_QUERY_KEYWORDS,
+        "language": NEWS_QUERY_LANGUAGE,
+        "sortBy": "publishedAt",
+        "pageSize": settings.NEWS_FETCH_PAGE_SIZE,
+        "page": page
+    }
+    if since is not None:
+        params["from"] = since.strftime("%Y-%m-%dT%H:%M:%S")
 
-        # 전체 해양 관련 뉴스를 한 번에 검색
-        try:
-            async with httpx.AsyncClient() as client:
-                # 부산 지역 해양 관련 의미있는 키워드로 검색
-                query_keywords = (
-                    "(부산 OR 해운대 OR 광안리 OR 송정 OR 영도 OR 다대포 OR 기장 OR 오륙도 OR 수영만 OR 부산항) "
-                    "AND "
-                    "(해양 OR 수질 OR 바다 OR 해수욕장 OR 해양오염 OR 해양환경 OR 해양보호 OR "
-                    "수질개선 OR 해양쓰레기 OR 해양생태 OR 해양보전 OR 적조 OR 녹조 OR "
-                    "해양관리 OR 수산 OR 어업 OR 해양생물 OR 해수 OR 연안)"
-                )
+    try:
+        response = await cached_get(settings.NEWS_API_URL, params=params, ttl_seconds=ttl_seconds)
+    except httpx.HTTPError as e:
+        record_external_call()
+        print(f"뉴스 API 요청 오류 (page={page}): {e}")
+        record_failure(e)
+        return None
+
+    if not response.from_cache:
+        record_external_call()
 
-                response = await client.get(
-                    settings.NEWS_API_URL,
-                    params={
-                        "apiKey": settings.NEWS_API_KEY,
-                        "q": query_keywords,
-                        "language": "ko",
-                        "sortBy": "publishedAt",
-                        "pageSize": 100  # 더 많은 기사 가져오기
-                    },
-                    timeout=10.0
+    if response.status_code != 200:
+        print(f"뉴스 API 오류 (page={page}): HTTP {response.status_code}")
+        return None
+
+    return response
+
+
+async def _fetch_news_since(
+    since: Optional[datetime]
+) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """
+    워터마크 이후 발행된 기사를 페이지 단위로 조회합니다.
+
+    첫 페이지의 totalResults로 필요한 페이지 수를 계산하고,
+    나머지 페이지는 동시에 요청합니다. (최대 NEWS_FETCH_MAX_PAGES)
+    첫 페이지를 새로 받았으면 나머지 페이지도 캐시 TTL 없이 조건부 요청으로 받아
+    페이지마다 다른 시점의 결과가 섞이지 않게 합니다.
+
+    Args:
+        since: 워터마크 (마지막 수집 기사 발행 시각, UTC) - None이면 최신 기사부터
+
+    Returns:
+        Tuple[Optional[List[Dict[str, Any]]], bool]:
+            (기사 목록 - 첫 페이지 실패 시 None,
+             필요한 모든 페이지를 받았는지 여부 - 페이지 실패나 최대 페이지 수 초과 시 False)
+    """
+    first_response = await _fetch_news_page(1, since, settings.NEWS_API_CACHE_TTL_SECONDS)
+    if first_response is None:
+        return None, False
+
+    first_page = first_response.json()
+    page_ttl_seconds = settings.NEWS_API_CACHE_TTL_SECONDS if first_response.from_cache else 0
+    articles_data = list(first_page.get("articles", []))
+    total_results = first_page.get("totalResults") or len(articles_data)
+    needed_pages = math.ceil(total_results / settings.NEWS_FETCH_PAGE_SIZE)
+    page_count = min(needed_pages, settings.NEWS_FETCH_MAX_PAGES)
+
+    # 최대 페이지 수에서 잘린 경우 워터마크를 옮기면 그 사이 기사가 영영 빠지므로 미완료로 처리
+    complete = needed_pages <= page_count
+    if not complete:
+        print(f"⚠️ 새 기사 {total_results}개 중 최근 {page_count}페이지만 수집합니다 (워터마크 유지)")
+
+    if page_count > 1:
+        responses = await asyncio.gather(*[
+            _fetch_news_page(page, since, page_ttl_seconds)
+            for page in range(2, page_count + 1)
+        ])
+        for response in responses:
+            if response is None:
+                complete = False
+                continue
+            articles_data.extend(response.json().get("articles", []))
+
+    # API가 from 이전 기사를 돌려주는 경우를 대비해 한 번 더 거른다
+    if since is not None:
+        articles_data = [
+            article for article in articles_data
+            if (_parse_published_at(article.get("publishedAt")) or since) >= since
+        ]
+
+    return articles_data, complete
+
+
+def _match_new_articles(articles_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    아직 저장되지 않은 기사 중 해양 이름과 매칭되는 기사를 찾습니다.
+
+    Args:
+        articles_data: 뉴스 API 응답의 기사 목록
+
+    Returns:
+        List[Dict[str, Any]]: 매칭된 기사 정보 (ocean_id, ocean_name, title, content, url, image_url)
+    """
+    db: Session = SessionLocal()
+
+    try:
+        # 해양 목록으로 키워드 매칭기 준비 (해양 목록이 바뀐 경우에만 재생성)
+        oceans = db.query(Ocean.ocean_id, Ocean.ocean_name).order_by(Ocean.ocean_id).all()
+        matcher = get_ocean_matcher([(ocean_id, ocean_name) for ocean_id, ocean_name in oceans])
+
+        # 이미 저장된 기사 URL을 한 번에 확인 (블룸 필터 + IN 쿼리)
+        existing_urls = known_article_urls.find_existing(
+            db, [article_data.get("url") for article_data in articles_data if article_data.get("url")]
+        )
+
+        matched_articles = []
+        for article_data in articles_data:
+            url = article_data.get("url")
+            title = article_data.get("title") or ""
+            description = article_data.get("description", "")
+            content = article_data.get("content", "")
+            image_url = article_data.get("urlToImage")
+
+            if not url or not title:
+                continue
+
+            # 이미 저장된 기사이거나 이번 응답에서 이미 본 기사인지 확인
+            if url in existing_urls:
+                continue
+            existing_urls.add(url)
+
+            full_text = (title + " " + description).lower()
+
+            # 해양 관련 키워드가 있는지 먼저 확인 (필터링)
+            ocean_keywords = ["해양", "바다", "수질", "해수욕장", "해안", "연안", "항구", "어업", "수산"]
+            has_ocean_context = any(kw in full_text for kw in ocean_keywords)
+
+            if not has_ocean_context:
+                # 해양과 무관한 기사는 스킵
+                continue
+
+            # 제목과 내용에서 해양 이름 매칭 확인 (한 번의 선형 탐색)
+            match = matcher.match(full_text)
+
+            # 매칭되는 해양이 없으면 스킵
+            if not match:
+                continue
+
+            matched_ocean_id, matched_ocean_name, matched_keyword = match
+            print(f"  ✅ 기사 매칭: [{matched_ocean_name}] 키워드: '{matched_keyword}' | {title[:40]}...")
+
+            matched_articles.append({
+                "ocean_id": matched_ocean_id,
+                "ocean_name": matched_ocean_name,
+                "title": title,
+                # 기사 내용 준비 (description이나 content 사용)
+                "content": description or content or "",
+                "url": url,
+                "image_url": image_url,
+                "cache_key": make_sentiment_cache_key(matched_ocean_name, title, description)
+            })
+
+        # 감성 분석 캐시 조회 (캐시에 있는 기사는 AI 호출 생략)
+        _apply_cached_sentiments(db, matched_articles)
+
+        return matched_articles
+
+    finally:
+        db.close()
+
+
+def _apply_cached_sentiments(db: Session, matched_articles: List[Dict[str, Any]]) -> None:
+    """
+    프로세스 내 LRU 캐시와 DB 캐시에서 감성 분석 결과를 찾아 sentiment에 기록합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        matched_articles: 매칭된 기사 목록
+    """
+    cache_keys = {matched["cache_key"] for matched in matched_articles}
+    cached = sentiment_lru_cache.get_many(cache_keys)
+
+    missing_keys = [cache_key for cache_key in cache_keys if cache_key not in cached]
+    if missing_keys:
+        since = datetime.now() - timedelta(hours=settings.SENTIMENT_CACHE_TTL_HOURS)
+        db_cached = ArticleSentimentCacheRepository(db).find_valid_by_hashes(missing_keys, since)
+        db_sentiments = {cache_key: sentiment for cache_key, (sentiment, _) in db_cached.items()}
+        # DB에 저장된 시각을 그대로 넘겨 LRU 캐시도 같은 시각에 만료
+        sentiment_lru_cache.put_many(
+            db_sentiments,
+            cached_at={cache_key: cached_at for cache_key, (_, cached_at) in db_cached.items()}
+        )
+        cached.update(db_sentiments)
+
+    hit_count = 0
+    for matched in matched_articles:
+        sentiment = cached.get(matched["cache_key"])
+        if sentiment:
+            matched["sentiment"] = sentiment
+            hit_count += 1
+
+    if hit_count:
+        print(f"  💾 감성 분석 캐시 적중: {hit_count}/{len(matched_articles)}개 기사")
+
+
+async def _analyze_article_sentiments(matched_articles: List[Dict[str, Any]]) -> None:
+    """
+    캐시에 없는 기사들의 감성을 분석하여 각 항목의 sentiment에 기록합니다.
+
+    같은 캐시 키를 가진 기사는 한 번만 분석합니다.
+    ARTICLE_SENTIMENT_BATCH_SIZE개씩 묶어 일괄 분석 API로 요청하고,
+    묶음 요청은 ARTICLE_SENTIMENT_CONCURRENCY개까지 동시에 실행합니다.
+    ARTICLE_SENTIMENT_TIMEOUT_SECONDS를 넘긴 묶음은 중립으로 처리하며 캐시하지 않습니다.
+
+    Args:
+        matched_articles: 매칭된 기사 목록
+    """
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    for matched in matched_articles:
+        if "sentiment" not in matched:
+            pending.setdefault(matched["cache_key"], []).append(matched)
+
+    if not pending:
+        return
+
+    semaphore = asyncio.Semaphore(settings.ARTICLE_SENTIMENT_CONCURRENCY)
+    batch_size = max(1, settings.ARTICLE_SENTIMENT_BATCH_SIZE)
+    unique_articles = [group[0] for group in pending.values()]
+    batches = [
+        unique_articles[start:start + batch_size]
+        for start in range(0, len(unique_articles), batch_size)
+    ]
+
+    async def analyze(batch: List[Dict[str, Any]]) -> Tuple[List[str], bool]:
+        async with semaphore:
+            record_external_call()
+            try:
+                sentiments = await asyncio.wait_for(
+                    ai_client.analyze_articles_sentiment_batch([
+                        (matched["ocean_name"], matched["title"], matched["content"])
+                        for matched in batch
+                    ]),
+                    timeout=settings.ARTICLE_SENTIMENT_TIMEOUT_SECONDS
                 )
+                return sentiments, True
+            except asyncio.TimeoutError:
+                print(f"  ⏱️  감성 분석 시간 초과 (중립 처리): {len(batch)}개 기사")
+                return ["neutral"] * len(batch), False
+
+    batch_results = await asyncio.gather(*(analyze(batch) for batch in batches))
+    for batch, (sentiments, cacheable) in zip(batches, batch_results):
+        for representative, sentiment in zip(batch, sentiments):
+            for matched in pending[representative["cache_key"]]:
+                matched["sentiment"] = sentiment
+            # 캐시에 새로 저장할 결과는 대표 기사에만 표시
+            representative["cache_new"] = cacheable
+
+
+def _save_analyzed_articles(
+    matched_articles: List[Dict[str, Any]],
+    watermark: Optional[datetime] = None
+) -> None:
+    """
+    감성 분석이 끝난 기사를 저장하고 해양 시세에 반영합니다.
+    뉴스 수집 워터마크도 같은 트랜잭션에서 전진시킵니다.
 
-                if response.status_code != 200:
-                    print(f"뉴스 API 오류: HTTP {response.status_code}")
-                    return
-
-                data = response.json()
-                articles_data = data.get("articles", [])
-
-                print(f"📰 뉴스 API에서 {len(articles_data)}개 기사 조회 완료")
-
-                matched_count = 0
-                for article_data in articles_data:
-                    url = article_data.get("url")
-                    title = article_data.get("title") or ""
-                    description = article_data.get("description", "")
-                    content = article_data.get("content", "")
-                    image_url = article_data.get("urlToImage")
-
-                    if not url or not title:
-                        continue
-
-                    # 이미 저장된 기사인지 확인
-                    existing = db.query(Article).filter(Article.url == url).first()
-                    if existing:
-                        continue
-
-                    # 제목과 내용에서 해양 이름 매칭 확인
-                    matched_ocean = None
-                    matched_keyword = None
-                    full_text = (title + " " + description).lower()
-
-                    # 해양 관련 키워드가 있는지 먼저 확인 (필터링)
-                    ocean_keywords = ["해양", "바다", "수질", "해수욕장", "해안", "연안", "항구", "어업", "수산"]
-                    has_ocean_context = any(kw in full_text for kw in ocean_keywords)
-
-                    if not has_ocean_context:
-                        # 해양과 무관한 기사는 스킵
-                        continue
-
-                    # 각 해양에 대해 키워드 매칭 시도
-                    for ocean in oceans:
-                        # 해양 이름에서 키워드 추출
-                        ocean_name_clean = ocean.ocean_name.replace(" 앞바다", "").replace(" 해역", "").strip()
-
-                        # 여러 키워드 생성
-                        keywords = []
-
-                        # 1. 전체 해양 이름
-                        keywords.append(ocean.ocean_name)
-
-                        # 2. 공백 제거한 이름
-                        keywords.append(ocean_name_clean)
-
-                        # 3. 공백으로 분리된 각 단어 (3글자 이상만)
-                        if " " in ocean_name_clean:
-                            for word in ocean_name_clean.split():
-                                if len(word) >= 3:  # 3글자 이상만
-                                    keywords.append(word)
-
-                        # 키워드가 제목이나 내용에 있는지 확인
-                        for keyword in keywords:
-                            if keyword in full_text:
-                                matched_ocean = ocean
-                                matched_keyword = keyword
-                                break
-
-                        if matched_ocean:
-                            break
-
-                    # 매칭되는 해양이 없으면 스킵
-                    if not matched_ocean:
-                        continue
-
-                    matched_count += 1
-                    print(f"  ✅ 기사 매칭: [{matched_ocean.ocean_name}] 키워드: '{matched_keyword}' | {title[:40]}...")
-
-                    # 기사 내용 준비 (description이나 content 사용)
-                    article_content = description or content or ""
-
-                    # AI로 감성 분석
-                    sentiment_str = await ai_client.analyze_article_sentiment(
-                        ocean_name=matched_ocean.ocean_name,
-                        article_title=title,
-                        article_content=article_content
-                    )
-
-                    # 문자열을 Enum으로 변환
-                    if sentiment_str == "positive":
-                        sentiment = ArticleSentiment.POSITIVE
-                    elif sentiment_str == "negative":
-                        sentiment = ArticleSentiment.NEGATIVE
-                    else:
-                        sentiment = ArticleSentiment.NEUTRAL
-
-                    # 가격 변동량 계산
-                    price_change = 0
-                    if sentiment == ArticleSentiment.POSITIVE:
-                        price_change = 150  # 긍정 기사: +150
-                    elif sentiment == ArticleSentiment.NEGATIVE:
-                        price_change = -150  # 부정 기사: -150
-
-                    # 기사 저장 (content 필드 제외 - DB에 컬럼 없음)
-                    new_article = Article(
-                        ocean_id=matched_ocean.ocean_id,
-                        ocean_name=matched_ocean.ocean_name,
-                        title=title,
-                        # content=article_content,  # 임시 제거
-                        url=url,
-                        image_url=image_url,
-                        sentiment=sentiment,
-                        price_change=price_change
-                    )
-                    db.add(new_article)
-
-                    # 해양 시세 업데이트
-                    previous_price = matched_ocean.current_price
-                    matched_ocean.current_price += price_change
-                    if matched_ocean.current_price < 100:  # 최소 가격 보장
-                        matched_ocean.current_price = 100
-                    _record_ocean_price_history(ocean_repository, matched_ocean, previous_price)
-
-                db.commit()
-                print(f"✅ 총 {matched_count}개 기사 매칭 및 저장 완료")
+    Args:
+        matched_articles: 감성 분석 결과(sentiment)가 포함된 매칭 기사 목록
+        watermark: 이번 수집에서 본 가장 최근 기사 발행 시각 (UTC)
+    """
+    if not matched_articles and watermark is None:
+        return
 
-        except Exception as e:
-            print(f"기사 수집 오류: {e}")
-            db.rollback()
+    db: Session = SessionLocal()
+
+    try:
+        ocean_repository = OceanRepository(db)
+        ocean_ids = {matched["ocean_id"] for matched in matched_articles}
+        oceans = {
+            ocean.ocean_id: ocean
+            for ocean in db.query(Ocean).filter(Ocean.ocean_id.in_(ocean_ids)).all()
+        }
+
+        # 블룸 필터가 오래되어 이미 저장된 URL을 놓쳤더라도 유니크 키 충돌로 배치 전체가 롤백되지 않도록
+        # 저장 직전에 DB에서 한 번 더 확인
+        saved_urls = ArticleRepository(db).find_existing_urls([matched["url"] for matched in matched_articles])
+        if saved_urls:
+            print(f"  ⚠️  이미 저장된 기사 {len(saved_urls)}개는 건너뜁니다")
+
+        for matched in matched_articles:
+            matched_ocean = oceans.get(matched["ocean_id"])
+            if not matched_ocean or matched["url"] in saved_urls:
+                continue
+            saved_urls.add(matched["url"])
+
+            # 문자열을 Enum으로 변환
+            sentiment_str = matched["sentiment"]
+            if sentiment_str == "positive":
+                sentiment = ArticleSentiment.POSITIVE
+            elif sentiment_str == "negative":
+                sentiment = ArticleSentiment.NEGATIVE
+            else:
+                sentiment = ArticleSentiment.NEUTRAL
+
+            # 가격 변동량 계산
+            price_change = 0
+            if sentiment == ArticleSentiment.POSITIVE:
+                price_change = 150  # 긍정 기사: +150
+            elif sentiment == ArticleSentiment.NEGATIVE:
+                price_change = -150  # 부정 기사: -150
+
+            # 기사 저장 (content 필드 제외 - DB에 컬럼 없음)
+            new_article = Article(
+                ocean_id=matched_ocean.ocean_id,
+                ocean_name=matched_ocean.ocean_name,
+                title=matched["title"],
+                # content=article_content,  # 임시 제거
+                url=matched["url"],
+                image_url=matched["image_url"],
+                sentiment=sentiment,
+                price_change=price_change
+            )
+            db.add(new_article)
+
+            # 해양 시세 업데이트
+            previous_price = matched_ocean.current_price
+            matched_ocean.current_price += price_change
+            if matched_ocean.current_price < 100:  # 최소 가격 보장
+                matched_ocean.current_price = 100
+            _record_ocean_price_history(ocean_repository, matched_ocean, previous_price)
+
+        # 새 감성 분석 결과를 캐시에 저장하고 만료된 캐시 정리
+        new_sentiments = {
+            matched["cache_key"]: matched["sentiment"]
+            for matched in matched_articles
+            if matched.get("cache_new")
+        }
+        now = datetime.now()
+        cache_repository = ArticleSentimentCacheRepository(db)
+        cache_repository.delete_expired(now - timedelta(hours=settings.SENTIMENT_CACHE_TTL_HOURS))
+        cache_repository.save_all(new_sentiments, cached_at=now)
+
+        if watermark is not None:
+            NewsFetchWatermarkRepository(db).save(NEWS_QUERY_HASH, watermark)
+
+        db.commit()
+        record_rows(len(matched_articles))
+        sentiment_lru_cache.put_many(new_sentiments)
+        known_article_urls.add_many(matched["url"] for matched in matched_articles)
 
     except Exception as e:
-        print(f"기사 수집 작업 오류: {e}")
+        print(f"기사 저장 오류: {e}")
+        record_failure(e)
         db.rollback()
     finally:
         db.close()
@@ -225,6 +517,40 @@ async def update_ocean_prices_by_garbage():
     - 쓰레기 수집이 적으면 시세 하락
     - 일정 기간 동안 쓰레기 수집이 부족하면 강제 경매
     """
+    # 해양 시세를 갱신하는 DB 작업은 다른 시세 갱신 작업과 겹치지 않도록 순서대로 실행
+    if settings.GARBAGE_PRICE_UPDATE_MODE == "per_ocean":
+        await run_serialized(_update_ocean_prices_by_garbage)
+    else:
+        await run_serialized(_update_ocean_prices_by_garbage_bulk)
+
+
+def _update_ocean_prices_by_garbage_bulk():
+    """
+    쓰레기 수집 횟수 기반 시세를 SQL로 일괄 업데이트합니다. (DB 작업)
+
+    해양 수와 관계없이 몇 개의 SQL 문으로 처리됩니다.
+    """
+    db: Session = SessionLocal()
+
+    try:
+        changed_count = OceanRepository(db).apply_garbage_price_changes(
+            GARBAGE_PRICE_TIERS,
+            GARBAGE_NO_COLLECTION_PRICE_CHANGE
+        )
+        db.commit()
+        record_rows(changed_count)
+        print(f"📈 쓰레기 수집 기반 시세 업데이트 완료: {changed_count}개 해양")
+
+    except Exception as e:
+        print(f"쓰레기 수집 기반 시세 업데이트 오류: {e}")
+        record_failure(e)
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _update_ocean_prices_by_garbage():
+    """쓰레기 수집 횟수 기반 시세 업데이트 (DB 작업)"""
     db: Session = SessionLocal()
 
     try:
@@ -233,16 +559,11 @@ async def update_ocean_prices_by_garbage():
 
         for ocean in oceans:
             # 쓰레기 수집 횟수에 따른 가격 변동
-            if ocean.garbage_collection_count > 100:
-                price_change = 500  # 많이 수집: +500
-            elif ocean.garbage_collection_count > 50:
-                price_change = 300  # 보통 수집: +300
-            elif ocean.garbage_collection_count > 20:
-                price_change = 100  # 조금 수집: +100
-            elif ocean.garbage_collection_count > 0:
-                price_change = 0  # 최소 수집: 유지
-            else:
-                price_change = -200  # 수집 없음: -200
+            price_change = GARBAGE_NO_COLLECTION_PRICE_CHANGE
+            for threshold, change in GARBAGE_PRICE_TIERS:
+                if ocean.garbage_collection_count > threshold:
+                    price_change = change
+                    break
 
             previous_price = ocean.current_price
             ocean.current_price += price_change
@@ -253,9 +574,11 @@ async def update_ocean_prices_by_garbage():
             # TODO: 일정 기간 쓰레기 수집이 부족하면 강제 경매 로직 추가
 
         db.commit()
+        record_rows(len(oceans))
 
     except Exception as e:
         print(f"쓰레기 수집 기반 시세 업데이트 오류: {e}")
+        record_failure(e)
         db.rollback()
     finally:
         db.close()
@@ -266,6 +589,49 @@ async def generate_building_income():
     빌딩/음식점에서 발생하는 수익금을 자동으로 지급합니다.
 
     10초마다 실행되며, 각 건물의 수익률에 따라 소유자에게 크레딧을 지급합니다.
+    INCOME_PAYOUT_MODE 설정에 따라 지급 방식을 선택합니다.
+    accrual 모드에서는 잔액 조회/지출 시점에 정산되므로 아무 작업도 하지 않습니다.
+    """
+    if settings.INCOME_PAYOUT_MODE == "accrual":
+        return
+
+    if settings.INCOME_PAYOUT_MODE == "per_building":
+        await run_blocking(_generate_building_income_per_building)
+    else:
+        await run_blocking(_generate_building_income_bulk)
+
+
+def _generate_building_income_bulk():
+    """
+    소유자별로 수익금을 집계하여 일괄 지급합니다.
+
+    건물 수와 관계없이 집계 SELECT 1회와 일괄 UPDATE 몇 회로 처리됩니다.
+    """
+    db: Session = SessionLocal()
+
+    try:
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        repository = OceanManagementRepository(db)
+        total_income_distributed, paid_user_count = repository.settle_building_income(now)
+        db.commit()
+        record_rows(paid_user_count)
+
+        if paid_user_count:
+            print(f"🏢 수익금 지급 완료: 총 {total_income_distributed:,} 크레딧 지급 ({paid_user_count}명)")
+
+    except Exception as e:
+        print(f"❌ 수익금 지급 전체 오류: {e}")
+        record_failure(e)
+        import traceback
+        traceback.print_exc()
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _generate_building_income_per_building():
+    """
+    건물마다 소유자를 조회하여 수익금을 지급합니다. (기존 방식)
     """
     db: Session = SessionLocal()
 
@@ -303,6 +669,15 @@ async def generate_building_income():
                 # DB에서 읽어온 naive datetime을 KST aware datetime으로 변환
                 if last_time.tzinfo is None:
                     last_time = last_time.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+
+                # 사용자 단위 정산(bulk/accrual) 이후라면 그 시점부터 계산 (중복 지급 방지)
+                owner = db.query(User).filter(User.user_id == building.user_id).first()
+                if owner and owner.income_settled_at:
+                    settled_at = owner.income_settled_at
+                    if settled_at.tzinfo is None:
+                        settled_at = settled_at.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+                    last_time = max(last_time, settled_at)
+
                 elapsed_seconds = (now - last_time).total_seconds()
                 print(f"      경과 시간: {elapsed_seconds:.2f}초")
 
@@ -312,7 +687,6 @@ async def generate_building_income():
                     print(f"      계산된 수익금: {income:,} 크레딧")
 
                     # 소유자에게 크레딧 지급
-                    owner = db.query(User).filter(User.user_id == building.user_id).first()
                     if owner:
                         old_credits = owner.credits
                         owner.credits += income
@@ -333,12 +707,19 @@ async def generate_building_income():
                 import traceback
                 traceback.print_exc()
 
+        # 지급 방식을 바꿔도 중복 지급되지 않도록 사용자 단위 정산 시각도 맞춰 둔다
+        db.query(User).filter(User.total_income_rate > 0).update(
+            {User.income_settled_at: now}, synchronize_session=False
+        )
+
         db.commit()
+        record_rows(income_count)
         print(f"\n✅ DB 커밋 완료")
         print(f"✅ 수익금 지급 완료: 총 {total_income_distributed:,} 크레딧 지급 ({income_count}개 건물, {initialized_count}개 초기화)\n")
 
     except Exception as e:
         print(f"❌ 수익금 지급 전체 오류: {e}")
+        record_failure(e)
         import traceback
         traceback.print_exc()
         db.rollback()
@@ -351,176 +732,266 @@ async def fetch_and_update_ocean_data():
     해양 관측소 데이터를 수집하고 시세를 업데이트합니다.
 
     1. Ocean Data API에서 관측소 정보 조회
-    2. 각 해양 지역과 가장 가까운 관측소 찾기
+    2. 각 해양 지역과 가장 가까운 관측소 찾기 (관측소 목록과 해양 좌표가 그대로면 지난 매칭 결과 재사용)
     3. 관측소 유형에 따라 시세 업데이트
        - 종합해양과학기지: +200 (가장 체계적 관리)
        - 해양관측부이: +150 (일반 관리)
        - 조위관측소: +100 (기본 관리)
     """
+    try:
+        # Ocean Data API에서 관측소 정보 가져오기 (TTL 안이면 캐시, 이후 ETag/Last-Modified 조건부 요청)
+        response = await cached_get(
+            settings.OCEAN_DATA_API_URL,
+            params={
+                "page": 1,
+                "perPage": 100,  # 전체 100개 관측소 조회
+                "serviceKey": settings.OCEAN_DATA_API_KEY
+            },
+            ttl_seconds=settings.OCEAN_DATA_API_CACHE_TTL_SECONDS
+        )
+        if not response.from_cache:
+            record_external_call()
+
+        if response.status_code != 200:
+            print(f"Ocean Data API 오류: HTTP {response.status_code}")
+            return
+
+        # 시세 갱신은 다른 시세 갱신 작업과 겹치지 않도록 순서대로 실행
+        await run_serialized(_apply_ocean_station_data, response)
+
+    except Exception as e:
+        print(f"해양 관측소 데이터 수집 오류: {e}")
+        record_failure(e)
+
+
+def _build_station_index(stations: List[Dict[str, Any]]) -> Tuple[GeoKDTree, List[Dict[str, Any]]]:
+    """
+    관측소 목록의 위도/경도를 파싱해 KD-Tree를 만듭니다. 좌표가 없거나 잘못된 관측소는 제외합니다.
+
+    Args:
+        stations: Ocean Data API 응답의 관측소 목록
+
+    Returns:
+        Tuple[GeoKDTree, List[Dict[str, Any]]]: (공간 인덱스, 인덱스 순서의 관측소 목록)
+    """
+    points = []
+    indexed_stations = []
+    for station in stations:
+        try:
+            station_lat = float(station["위도"])
+            station_lon = float(station["경도"])
+        except (KeyError, ValueError, TypeError):
+            continue
+        points.append((station_lat, station_lon))
+        indexed_stations.append(station)
+
+    return GeoKDTree(points), indexed_stations
+
+
+def _compute_water_quality(
+    ocean_id: int,
+    station_type: str,
+    distance: float,
+    price_change: int
+) -> Dict[str, Any]:
+    """
+    관측소 거리와 유형으로 해양의 수질 측정값을 생성합니다.
+
+    거리가 가까울수록, 좋은 관측소일수록 더 좋은 수질이 나오며,
+    해양 ID와 거리로 시드를 정한 지역 난수 생성기를 사용해 전역 random 상태를 건드리지 않습니다.
+
+    Args:
+        ocean_id: 해양 ID
+        station_type: 관측소 유형
+        distance: 관측소까지의 거리 (km)
+        price_change: 이번 측정에 따른 가격 변동
+
+    Returns:
+        Dict[str, Any]: 수질 측정값과 상태
+    """
+    distance_factor = max(0.5, 1 - (distance / STATION_MATCH_RADIUS_KM))  # 0.5 ~ 1.0
+
+    if "종합해양과학기지" in station_type:
+        quality_factor = 1.0
+    elif "해양관측부이" in station_type:
+        quality_factor = 0.9
+    elif "조위관측소" in station_type:
+        quality_factor = 0.8
+    else:
+        quality_factor = 0.7
+
+    # 해양별로 약간씩 다른 수질 값 생성
+    rng = random.Random(ocean_id + int(distance * 10))  # 해양 ID와 거리로 시드 설정
+
+    base_do = 7.0 + (quality_factor * distance_factor * 2.0)  # 7.0 ~ 9.0
+    do_value = round(base_do + rng.uniform(-0.5, 0.5), 1)
+
+    base_ph = 7.8 + (quality_factor * distance_factor * 0.5)  # 7.8 ~ 8.3
+    ph_value = round(base_ph + rng.uniform(-0.2, 0.2), 1)
+
+    base_nitrogen = 0.5 - (quality_factor * distance_factor * 0.3)  # 0.2 ~ 0.5
+    nitrogen_value = round(base_nitrogen + rng.uniform(-0.05, 0.05), 2)
+
+    base_phosphorus = 0.04 - (quality_factor * distance_factor * 0.02)  # 0.02 ~ 0.04
+    phosphorus_value = round(base_phosphorus + rng.uniform(-0.005, 0.005), 3)
+
+    base_turbidity = 3.0 - (quality_factor * distance_factor * 2.0)  # 1.0 ~ 3.0
+    turbidity_value = round(base_turbidity + rng.uniform(-0.3, 0.3), 1)
+
+    # 상태 판단
+    return {
+        "ocean_id": ocean_id,
+        "dissolved_oxygen_value": do_value,
+        "dissolved_oxygen_status": WaterQualityStatus.NORMAL if do_value >= 7.0 else WaterQualityStatus.WARNING,
+        "ph_value": ph_value,
+        "ph_status": WaterQualityStatus.NORMAL if 7.5 <= ph_value <= 8.5 else WaterQualityStatus.WARNING,
+        "nitrogen_value": nitrogen_value,
+        "nitrogen_status": WaterQualityStatus.NORMAL if nitrogen_value < 0.4 else WaterQualityStatus.WARNING,
+        "phosphorus_value": phosphorus_value,
+        "phosphorus_status": WaterQualityStatus.NORMAL if phosphorus_value < 0.03 else WaterQualityStatus.WARNING,
+        "turbidity_value": turbidity_value,
+        "turbidity_status": WaterQualityStatus.NORMAL if turbidity_value < 2.0 else WaterQualityStatus.WARNING,
+        "price_change": price_change
+    }
+
+
+def _ocean_location_signature(oceans: List[Ocean]) -> str:
+    locations = sorted((ocean.ocean_id, ocean.lat, ocean.lon) for ocean in oceans)
+    return hashlib.sha256(repr(locations).encode("utf-8")).hexdigest()
+
+
+def _match_oceans_to_stations(
+    oceans: List[Ocean],
+    response: CachedResponse
+) -> Optional[List[Tuple[int, str, float]]]:
+    """
+    해양별로 가장 가까운 관측소(200km 이내)를 찾습니다.
+
+    관측소 응답 본문과 해양 좌표가 지난 실행과 같으면 JSON 파싱과 매칭을 건너뛰고 지난 결과를 재사용합니다.
+
+    Args:
+        oceans: 해양 목록
+        response: Ocean Data API 응답
+
+    Returns:
+        Optional[List[Tuple[int, str, float]]]: (해양 ID, 관측소 유형, 거리 km) 목록 - 관측소가 없으면 None
+    """
+    cache_key = (response.content_hash, _ocean_location_signature(oceans))
+    if _station_match_cache.get("key") == cache_key:
+        matches = _station_match_cache["matches"]
+        print(f"🌊 관측소 목록이 바뀌지 않아 지난 매칭 결과를 재사용합니다. ({len(matches)}개 해양)")
+        return matches
+
+    stations = response.json().get("data", [])
+    if not stations:
+        return None
+
+    # 관측소 좌표를 한 번만 파싱해 공간 인덱스 구성
+    station_index, indexed_stations = _build_station_index(stations)
+    print(f"🌊 {len(oceans)}개 해양에 대해 관측소 매칭 중... (관측소 {len(indexed_stations)}개)")
+
+    matches = []
+    for ocean in oceans:
+        if ocean.lat is None or ocean.lon is None:
+            continue
+
+        nearest = station_index.nearest(ocean.lat, ocean.lon, max_distance_km=STATION_MATCH_RADIUS_KM)
+        if nearest is None or nearest[1] >= STATION_MATCH_RADIUS_KM:
+            continue
+
+        closest_station = indexed_stations[nearest[0]]
+        matches.append((ocean.ocean_id, closest_station.get("관측소 유형", ""), nearest[1]))
+
+        station_name = closest_station.get("관측소 명", "알 수 없음")
+        ocean_name_display = ocean.ocean_name if ocean.ocean_name else "이름없음"
+        print(f"  ✅ [{ocean_name_display}] 관측소 매칭: {station_name} (거리: {nearest[1]:.1f}km)")
+
+    _station_match_cache["key"] = cache_key
+    _station_match_cache["matches"] = matches
+    return matches
+
+
+def _apply_ocean_station_data(response: CachedResponse) -> None:
+    """
+    관측소 목록을 기준으로 해양 시세와 수질 데이터를 업데이트합니다. (DB 작업)
+
+    해양 수와 관계없이 최신 수질 일괄 조회, 수질 다중 행 upsert, 측정 이력 다중 행 INSERT,
+    시세 이력 다중 행 upsert와 시세 UPDATE로 처리됩니다.
+    관측소 매칭 결과를 재사용하는 경우에도 시세/수질 업데이트는 매번 반영됩니다.
+
+    Args:
+        response: Ocean Data API 응답 (관측소 목록)
+    """
     db: Session = SessionLocal()
 
     try:
-        # Ocean Data API에서 관측소 정보 가져오기
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                settings.OCEAN_DATA_API_URL,
-                params={
-                    "page": 1,
-                    "perPage": 100,  # 전체 100개 관측소 조회
-                    "serviceKey": settings.OCEAN_DATA_API_KEY
-                },
-                timeout=10.0
-            )
+        # 모든 해양 조회
+        ocean_repository = OceanRepository(db)
+        water_quality_repository = WaterQualityRepository(db)
+        oceans = db.query(Ocean).all()
+        oceans_by_id = {ocean.ocean_id: ocean for ocean in oceans}
 
-            if response.status_code != 200:
-                print(f"Ocean Data API 오류: HTTP {response.status_code}")
-                return
-
-            data = response.json()
-            stations = data.get("data", [])
-
-            if not stations:
-                print("관측소 데이터가 없습니다.")
-                return
-
-            # 모든 해양 조회
-            ocean_repository = OceanRepository(db)
-            oceans = db.query(Ocean).all()
-            print(f"🌊 {len(oceans)}개 해양에 대해 관측소 매칭 중...")
-
-            matched_ocean_count = 0
-            for ocean in oceans:
-                # 해양과 가장 가까운 관측소 찾기
-                closest_station = None
-                min_distance = float('inf')
-
-                for station in stations:
-                    try:
-                        station_lat = float(station.get("위도", 0))
-                        station_lon = float(station.get("경도", 0))
-
-                        # 거리 계산 (유클리드 거리 -> km로 변환)
-                        # 위도/경도 1도 = 약 111km
-                        distance = math.sqrt(
-                            ((ocean.lat - station_lat) * 111) ** 2 +
-                            ((ocean.lon - station_lon) * 111) ** 2
-                        )
-
-                        if distance < min_distance:
-                            min_distance = distance
-                            closest_station = station
-                    except (ValueError, TypeError):
-                        continue
-
-                if closest_station and min_distance < 200:  # 200km 이내로 범위 확대
-                    matched_ocean_count += 1
-                    station_name = closest_station.get("관측소 명", "알 수 없음")
-                    ocean_name_display = ocean.ocean_name if ocean.ocean_name else "이름없음"
-                    print(f"  ✅ [{ocean_name_display}] 관측소 매칭: {station_name} (거리: {min_distance:.1f}km)")
-
-                    # 관측소 유형에 따라 가격 변동
-                    station_type = closest_station.get("관측소 유형", "")
-
-                    if "종합해양과학기지" in station_type:
-                        price_change = 200
-                    elif "해양관측부이" in station_type:
-                        price_change = 150
-                    elif "조위관측소" in station_type:
-                        price_change = 100
-                    else:
-                        price_change = 50
-
-                    # 시세 업데이트
-                    previous_price = ocean.current_price
-                    ocean.current_price += price_change
-                    if ocean.current_price < 100:
-                        ocean.current_price = 100
-                    _record_ocean_price_history(ocean_repository, ocean, previous_price)
-
-                    # 수질 데이터 업데이트 (관측소 정보 기반)
-                    water_quality = db.query(WaterQuality).filter(
-                        WaterQuality.ocean_id == ocean.ocean_id
-                    ).first()
-
-                    # 거리와 관측소 유형에 따라 수질 값 다르게 생성
-                    # 거리가 가까울수록, 좋은 관측소일수록 더 좋은 수질
-                    distance_factor = max(0.5, 1 - (min_distance / 200))  # 0.5 ~ 1.0
-
-                    if "종합해양과학기지" in station_type:
-                        quality_factor = 1.0
-                    elif "해양관측부이" in station_type:
-                        quality_factor = 0.9
-                    elif "조위관측소" in station_type:
-                        quality_factor = 0.8
-                    else:
-                        quality_factor = 0.7
-
-                    # 해양별로 약간씩 다른 수질 값 생성
-                    random.seed(ocean.ocean_id + int(min_distance * 10))  # 해양 ID와 거리로 시드 설정
-
-                    base_do = 7.0 + (quality_factor * distance_factor * 2.0)  # 7.0 ~ 9.0
-                    do_value = round(base_do + random.uniform(-0.5, 0.5), 1)
-
-                    base_ph = 7.8 + (quality_factor * distance_factor * 0.5)  # 7.8 ~ 8.3
-                    ph_value = round(base_ph + random.uniform(-0.2, 0.2), 1)
-
-                    base_nitrogen = 0.5 - (quality_factor * distance_factor * 0.3)  # 0.2 ~ 0.5
-                    nitrogen_value = round(base_nitrogen + random.uniform(-0.05, 0.05), 2)
-
-                    base_phosphorus = 0.04 - (quality_factor * distance_factor * 0.02)  # 0.02 ~ 0.04
-                    phosphorus_value = round(base_phosphorus + random.uniform(-0.005, 0.005), 3)
-
-                    base_turbidity = 3.0 - (quality_factor * distance_factor * 2.0)  # 1.0 ~ 3.0
-                    turbidity_value = round(base_turbidity + random.uniform(-0.3, 0.3), 1)
-
-                    # 상태 판단
-                    do_status = WaterQualityStatus.NORMAL if do_value >= 7.0 else WaterQualityStatus.WARNING
-                    ph_status = WaterQualityStatus.NORMAL if 7.5 <= ph_value <= 8.5 else WaterQualityStatus.WARNING
-                    nitrogen_status = WaterQualityStatus.NORMAL if nitrogen_value < 0.4 else WaterQualityStatus.WARNING
-                    phosphorus_status = WaterQualityStatus.NORMAL if phosphorus_value < 0.03 else WaterQualityStatus.WARNING
-                    turbidity_status = WaterQualityStatus.NORMAL if turbidity_value < 2.0 else WaterQualityStatus.WARNING
-
-                    if not water_quality:
-                        # 새로운 수질 데이터 생성 (관측소별로 다른 값)
-                        water_quality = WaterQuality(
-                            ocean_id=ocean.ocean_id,
-                            dissolved_oxygen_value=do_value,
-                            dissolved_oxygen_status=do_status,
-                            ph_value=ph_value,
-                            ph_status=ph_status,
-                            nitrogen_value=nitrogen_value,
-                            nitrogen_status=nitrogen_status,
-                            phosphorus_value=phosphorus_value,
-                            phosphorus_status=phosphorus_status,
-                            turbidity_value=turbidity_value,
-                            turbidity_status=turbidity_status,
-                            heavy_metals_detected=0,
-                            oil_spill_detected=0,
-                            price_change=price_change
-                        )
-                        db.add(water_quality)
-                        print(f"    💧 수질: DO={do_value}, pH={ph_value}, 질소={nitrogen_value}, 탁도={turbidity_value}")
-                    else:
-                        # 기존 수질 데이터 업데이트 (값 변경)
-                        water_quality.dissolved_oxygen_value = do_value
-                        water_quality.dissolved_oxygen_status = do_status
-                        water_quality.ph_value = ph_value
-                        water_quality.ph_status = ph_status
-                        water_quality.nitrogen_value = nitrogen_value
-                        water_quality.nitrogen_status = nitrogen_status
-                        water_quality.phosphorus_value = phosphorus_value
-                        water_quality.phosphorus_status = phosphorus_status
-                        water_quality.turbidity_value = turbidity_value
-                        water_quality.turbidity_status = turbidity_status
-                        water_quality.price_change += price_change
-                        water_quality.measured_at = datetime.utcnow()
-                        print(f"    💧 수질 업데이트: DO={do_value}, pH={ph_value}")
+        # 해양별 가장 가까운 관측소 찾기 (200km 이내)
+        station_matches = _match_oceans_to_stations(oceans, response)
+        if station_matches is None:
+            print("관측소 데이터가 없습니다.")
+            return
 
-            db.commit()
-            print(f"✅ 해양 관측소 데이터 업데이트 완료: {matched_ocean_count}/{len(oceans)}개 해양에 수질 데이터 추가")
+        matches = [
+            (oceans_by_id[ocean_id], station_type, distance)
+            for ocean_id, station_type, distance in station_matches
+        ]
+
+        # 매칭된 해양의 누적 가격 변동을 한 번에 조회
+        accumulated_price_changes = water_quality_repository.find_price_changes_by_ocean_ids(
+            [ocean.ocean_id for ocean, _, _ in matches]
+        )
+
+        water_quality_rows = []
+        history_rows = []
+        changed_oceans = []
+        for ocean, station_type, distance in matches:
+            # 관측소 유형에 따라 가격 변동
+            if "종합해양과학기지" in station_type:
+                price_change = 200
+            elif "해양관측부이" in station_type:
+                price_change = 150
+            elif "조위관측소" in station_type:
+                price_change = 100
+            else:
+                price_change = 50
+
+            # 시세 업데이트
+            previous_price = ocean.current_price
+            ocean.current_price += price_change
+            if ocean.current_price < 100:
+                ocean.current_price = 100
+            if ocean.current_price != previous_price:
+                changed_oceans.append(ocean)
+
+            # 수질 데이터 (해양 ID 기준으로 기존 행을 덮어쓰고 가격 변동을 누적)
+            reading = _compute_water_quality(ocean.ocean_id, station_type, distance, price_change)
+            history_rows.append(dict(reading))
+
+            water_quality_rows.append({
+                **reading,
+                "heavy_metals_detected": 0,
+                "oil_spill_detected": 0,
+                "price_change": accumulated_price_changes.get(ocean.ocean_id, 0) + price_change,
+                "measured_at": func.now()
+            })
+
+        water_quality_repository.upsert_all(water_quality_rows)
+        water_quality_repository.add_histories(history_rows)
+        ocean_repository.add_price_histories(changed_oceans)
+
+        db.commit()
+        record_rows(len(matches))
+        print(f"✅ 해양 관측소 데이터 업데이트 완료: {len(matches)}/{len(oceans)}개 해양에 수질 데이터 추가")
 
     except Exception as e:
-        print(f"해양 관측소 데이터 수집 오류: {e}")
+        print(f"해양 관측소 데이터 반영 오류: {e}")
+        record_failure(e)
         db.rollback()
     finally:
         db.close()
@@ -530,92 +1001,181 @@ async def finalize_expired_auctions():
     """
     종료 시간이 지난 경매를 자동으로 종료하고 크레딧을 이동합니다.
 
+    경매는 보통 경매 종료 스케줄러가 종료 시간에 맞춰 종료하며,
+    이 작업은 누락된 경매를 처리하고 활성 경매를 스케줄러에 다시 등록하는 안전장치입니다.
+
     1. end_time이 지난 ACTIVE 상태의 경매를 찾습니다.
     2. 입찰이 있는 경매만 종료 처리합니다.
     3. 최고 입찰자에게 크레딧을 차감하고 판매자에게 지급합니다.
     4. 소유권을 최고 입찰자에게 이전합니다.
     5. 경매 상태를 SOLD로 변경합니다.
     """
-    db: Session = SessionLocal()
+    await run_blocking(_finalize_expired_auctions)
+    await load_active_auctions()
+
+
+async def finalize_auctions_by_ids(auction_ids: List[int]):
+    """
+    종료 시간이 된 특정 경매들을 종료 처리합니다. (경매 종료 스케줄러에서 호출)
+
+    Args:
+        auction_ids: 경매 ID 목록
+    """
+    await run_blocking(_finalize_expired_auctions, auction_ids)
+
+
+async def load_active_auctions():
+    """활성 경매의 종료 시간을 경매 종료 스케줄러에 등록합니다."""
+    auctions = await run_blocking(_find_active_auction_end_times)
+    auction_expiry_scheduler.schedule_all(auctions)
 
+
+async def load_new_auctions():
+    """
+    마지막으로 읽은 경매 이후 등록된 활성 경매를 경매 종료 스케줄러에 등록합니다.
+
+    다른 워커 프로세스에서 등록된 경매도 종료 시간에 맞춰 처리되도록 리더 프로세스에서 자주 실행합니다.
+    ID 순서와 커밋 순서가 다를 수 있으므로 최근 AUCTION_RELOAD_OVERLAP_SECONDS초 안에 등록된 경매는 다시 확인합니다.
+    (이미 같은 종료 시간으로 등록된 경매는 스케줄러가 무시)
+    """
+    auctions = await run_blocking(
+        _find_active_auction_end_times,
+        auction_expiry_scheduler.last_loaded_auction_id,
+        settings.AUCTION_RELOAD_OVERLAP_SECONDS
+    )
+    auction_expiry_scheduler.schedule_all(auctions)
+
+
+def _find_active_auction_end_times(
+    after_id: int = 0,
+    recent_seconds: Optional[int] = None
+) -> List[Tuple[int, datetime]]:
+    db: Session = SessionLocal()
     try:
         from app.domain.ocean_trade.domain.repository import OceanTradeRepository
-        from app.domain.ocean_trade.domain.entity import AuctionStatus
-        from app.domain.auth.domain.repository import UserRepository
 
-        repository = OceanTradeRepository(db)
-        user_repository = UserRepository(db)
+        return OceanTradeRepository(db).find_active_auction_end_times(after_id, recent_seconds)
+    finally:
+        db.close()
 
-        # 종료 시간이 지난 경매 조회
-        expired_auctions = repository.find_expired_auctions()
 
-        for auction in expired_auctions:
-            try:
-                # 최고 입찰 조회
-                highest_bid = repository.find_highest_bid(auction.id)
-
-                if not highest_bid:
-                    # 입찰이 없으면 경매 취소 처리 및 소유권 복구
-                    auction.status = AuctionStatus.CANCELLED
-                    auction.ended_at = datetime.now()
-
-                    # 소유권 복구
-                    ownership = repository.find_ownership_by_user_and_ocean(
-                        auction.seller_id, auction.ocean_id
-                    )
-                    if ownership:
-                        repository.update_ownership_square_meters(
-                            ownership, ownership.square_meters + auction.square_meters
-                        )
-                    else:
-                        repository.create_ownership(
-                            user_id=auction.seller_id,
-                            ocean_id=auction.ocean_id,
-                            square_meters=auction.square_meters
-                        )
+def _finalize_expired_auctions(auction_ids: Optional[List[int]] = None):
+    """
+    종료 시간이 지난 경매 종료 처리 (DB 작업)
 
-                    print(f"⚠️ 경매 {auction.id}: 입찰이 없어 취소 처리되었습니다.")
-                    continue
+    AUCTION_FINALIZE_BATCH_SIZE개씩 나누어, 배치마다 최고 입찰/사용자/소유권을 일괄 조회한 뒤
+    모든 정산을 하나의 트랜잭션으로 커밋합니다.
+    같은 프로세스의 스케줄러와 점검 작업이 동시에 정산하지 않도록 잠금을 사용합니다.
 
-                # 크레딧 처리
-                bidder = user_repository.find_by_username(highest_bid.bidder_id)
-                seller = user_repository.find_by_username(auction.seller_id)
+    Args:
+        auction_ids: 확인할 경매 ID 목록 (None이면 모든 활성 경매)
+    """
+    with _auction_finalize_lock:
+        db: Session = SessionLocal()
 
-                if bidder:
-                    bidder.credits -= highest_bid.bid_amount
-                if seller:
-                    seller.credits += highest_bid.bid_amount
+        try:
+            from app.domain.ocean_trade.domain.repository import OceanTradeRepository
 
-                # 소유권 이전
-                ownership = repository.find_ownership_by_user_and_ocean(
-                    highest_bid.bidder_id, auction.ocean_id
-                )
-                if ownership:
-                    repository.update_ownership_square_meters(
-                        ownership, ownership.square_meters + auction.square_meters
-                    )
-                else:
-                    repository.create_ownership(
-                        user_id=highest_bid.bidder_id,
-                        ocean_id=auction.ocean_id,
-                        square_meters=auction.square_meters
-                    )
+            expired_ids = OceanTradeRepository(db).find_expired_auction_ids(auction_ids)
+            db.commit()
 
-                # 경매 상태 업데이트
-                auction.status = AuctionStatus.SOLD
-                auction.winner_id = highest_bid.bidder_id
-                auction.ended_at = datetime.now()
+            batch_size = settings.AUCTION_FINALIZE_BATCH_SIZE
+            for start in range(0, len(expired_ids), batch_size):
+                batch_ids = expired_ids[start:start + batch_size]
+                try:
+                    finalized_count = _finalize_auction_batch(db, batch_ids)
+                    db.commit()
+                    record_rows(finalized_count)
+                except Exception as e:
+                    print(f"경매 {batch_ids[0]}~{batch_ids[-1]} 종료 처리 오류: {e}")
+                    record_failure(e)
+                    db.rollback()
 
-                print(f"✅ 경매 {auction.id} 자동 종료: 낙찰자 {highest_bid.bidder_id}, 금액 {highest_bid.bid_amount}")
+        except Exception as e:
+            print(f"경매 자동 종료 작업 오류: {e}")
+            record_failure(e)
+            db.rollback()
+        finally:
+            db.close()
 
-            except Exception as e:
-                print(f"경매 {auction.id} 종료 처리 오류: {e}")
-                continue
 
-        db.commit()
+def _finalize_auction_batch(db: Session, auction_ids: List[int]) -> int:
+    """
+    경매 배치를 정산합니다. (커밋하지 않음)
 
-    except Exception as e:
-        print(f"경매 자동 종료 작업 오류: {e}")
-        db.rollback()
-    finally:
-        db.close()
+    1. 경매를 잠그고 조회 (다른 프로세스가 처리 중인 경매는 건너뜀)
+    2. 최고 입찰을 한 번에 조회
+    3. 입찰자/판매자와 소유권을 한 번에 조회
+    4. 크레딧 이동, 소유권 이전/복구, 경매 상태 변경
+
+    Returns:
+        int: 정산한 경매 수
+    """
+    from app.domain.ocean_trade.domain.repository import OceanTradeRepository
+    from app.domain.ocean_trade.domain.entity import AuctionStatus
+    from app.domain.ocean_management.domain.entity import OceanOwnership
+    from app.domain.auth.domain.repository import UserRepository
+
+    repository = OceanTradeRepository(db)
+    user_repository = UserRepository(db)
+
+    auctions = repository.lock_active_auctions(auction_ids)
+    if not auctions:
+        return 0
+
+    winning_bids = repository.find_winning_bids([auction.id for auction in auctions])
+
+    # 소유권을 받을 사용자: 낙찰자 (입찰이 없으면 판매자에게 복구)
+    receivers = {
+        auction.id: winning_bids[auction.id][0] if auction.id in winning_bids else auction.seller_id
+        for auction in auctions
+    }
+    users = user_repository.find_all_by_usernames(
+        [auction.seller_id for auction in auctions] + [bidder_id for bidder_id, _ in winning_bids.values()]
+    )
+    ownerships = repository.find_ownerships_by_users_and_oceans(
+        [(receivers[auction.id], auction.ocean_id) for auction in auctions]
+    )
+
+    now = datetime.now()
+    for auction in auctions:
+        receiver_id = receivers[auction.id]
+
+        # 소유권 이전 (입찰이 없으면 판매자에게 복구)
+        ownership = ownerships.get((receiver_id, auction.ocean_id))
+        if ownership:
+            ownership.square_meters += auction.square_meters
+        else:
+            ownership = OceanOwnership(
+                user_id=receiver_id,
+                ocean_id=auction.ocean_id,
+                square_meters=auction.square_meters
+            )
+            db.add(ownership)
+            ownerships[(receiver_id, auction.ocean_id)] = ownership
+
+        auction.ended_at = now
+
+        if auction.id not in winning_bids:
+            # 입찰이 없으면 경매 취소 처리
+            auction.status = AuctionStatus.CANCELLED
+            print(f"⚠️ 경매 {auction.id}: 입찰이 없어 취소 처리되었습니다.")
+            continue
+
+        # 크레딧 처리
+        bidder_id, bid_amount = winning_bids[auction.id]
+        bidder = users.get(bidder_id)
+        seller = users.get(auction.seller_id)
+
+        if bidder:
+            bidder.credits -= bid_amount
+        if seller:
+            seller.credits += bid_amount
+
+        # 경매 상태 업데이트
+        auction.status = AuctionStatus.SOLD
+        auction.winner_id = bidder_id
+
+        print(f"✅ 경매 {auction.id} 자동 종료: 낙찰자 {bidder_id}, 금액 {bid_amount}")
+
+    return len(auctions)
@@ -0,0 +1,93 @@
+"""
+서버 시작 시 초기 작업(warm-up) 실행 및 준비 상태 관리
+
+초기 작업은 서로 독립적이므로 동시에 실행하고, 작업별 제한 시간을 넘기면 포기합니다.
+(제한 시간을 넘긴 작업 중 스레드 풀에서 실행 중인 DB 처리는 끝날 때까지 계속 실행됩니다)
+실패하거나 시간이 초과된 작업도 다음 스케줄 실행에서 다시 수행되므로 준비 완료로 봅니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class WarmupState:
+    """
+    초기 작업 진행 상태
+    """
+
+    def __init__(self):
+        self._steps: Dict[str, Dict[str, Any]] = {}
+        self._started = False
+        self._finished = False
+
+    @property
+    def is_ready(self) -> bool:
+        """초기 작업이 없거나 모두 끝났는지 여부"""
+        return not self._started or self._finished
+
+    def begin(self) -> None:
+        """초기 작업 시작을 표시합니다. (이후 finish 전까지 준비되지 않은 상태)"""
+        self._started = True
+        self._finished = False
+
+    def set_steps(self, names: List[str]) -> None:
+        self._steps = {name: {"status": "pending", "duration": None, "error": None} for name in names}
+
+    def update(self, name: str, status: str, duration: Optional[float] = None, error: Optional[str] = None) -> None:
+        self._steps[name] = {
+            "status": status,
+            "duration": round(duration, 3) if duration is not None else None,
+            "error": error
+        }
+
+    def finish(self) -> None:
+        self._finished = True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        준비 상태를 조회합니다.
+
+        Returns:
+            Dict[str, Any]: 준비 여부와 작업별 상태 (pending/running/done/failed/timeout)
+        """
+        return {
+            "ready": self.is_ready,
+            "steps": {name: dict(step) for name, step in self._steps.items()}
+        }
+
+
+# 싱글톤 인스턴스
+warmup_state = WarmupState()
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[Any]], timeout: float) -> None:
+    warmup_state.update(name, "running")
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(step(), timeout=timeout)
+        warmup_state.update(name, "done", time.perf_counter() - started)
+        print(f"✅ {name} 완료")
+    except asyncio.TimeoutError:
+        warmup_state.update(name, "timeout", time.perf_counter() - started, f"{timeout}초 초과")
+        print(f"⚠️  {name} 시간 초과 ({timeout}초)")
+    except Exception as e:
+        # /ready는 인증 없이 조회되므로 URL, API 키, SQL이 섞일 수 있는 메시지는 로그에만 남긴다
+        warmup_state.update(name, "failed", time.perf_counter() - started, type(e).__name__)
+        print(f"⚠️  {name} 오류: {e}")
+
+
+async def run_warmup(steps: List[Tuple[str, Callable[[], Awaitable[Any]]]], timeout: float) -> None:
+    """
+    초기 작업을 동시에 실행하고 모두 끝날 때까지 기다립니다.
+
+    Args:
+        steps: (작업 이름, 비동기 작업 함수) 목록
+        timeout: 작업별 제한 시간 (초)
+    """
+    warmup_state.begin()
+    warmup_state.set_steps([name for name, _ in steps])
+    try:
+        await asyncio.gather(*(_run_step(name, step, timeout) for name, step in steps))
+    finally:
+        warmup_state.finish()
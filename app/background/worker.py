@@ -0,0 +1,48 @@
+"""
+백그라운드 작업 전용 워커
+
+API 서버와 별도 프로세스에서 스케줄 작업(기사 수집, 시세 업데이트, 수익금 지급, 관측소 데이터 수집, 경매 종료)을 실행합니다.
+API 서버는 RUN_BACKGROUND_JOBS=false로 실행해 스케줄러를 띄우지 않도록 합니다.
+
+실행:
+    python -m app.background.worker
+"""
+
+import asyncio
+import signal
+
+from app.database import init_db
+from app.core.http import close_http_client, start_http_client
+from app.background.scheduler import start_background_jobs, stop_background_jobs
+
+
+async def main():
+    """워커를 실행하고 SIGINT/SIGTERM을 받을 때까지 대기합니다."""
+    init_db()
+    start_http_client()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signal_number, stop_event.set)
+        except NotImplementedError:
+            # Windows 등 시그널 핸들러를 지원하지 않는 환경
+            pass
+
+    print("🛠️  백그라운드 작업 워커 시작")
+    await start_background_jobs()
+
+    try:
+        await stop_event.wait()
+    finally:
+        print("🛑 백그라운드 작업 워커 종료 중...")
+        await stop_background_jobs()
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
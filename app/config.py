@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict
 
 
 class Settings(BaseSettings):
@@ -31,16 +32,78 @@ class Settings(BaseSettings):
     OCEAN_DATA_API_KEY: str
     OCEAN_DATA_API_URL: str
 
+    # Outbound HTTP Client (뉴스/해양 데이터 API 공용)
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0  # 연결 제한 시간
+    HTTP_READ_TIMEOUT_SECONDS: float = 10.0  # 응답 읽기 제한 시간
+    HTTP_MAX_CONNECTIONS: int = 20  # 최대 동시 연결 수
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10  # 재사용을 위해 유지할 최대 연결 수
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0  # 유휴 연결 유지 시간
+    HTTP2_ENABLED: bool = False  # HTTP/2 사용 (h2 패키지 필요: pip install "httpx[http2]")
+    HTTP_RETRY_ATTEMPTS: int = 3  # 연결 오류/일시적 오류(429, 502, 503, 504) 시 최대 시도 횟수
+    HTTP_RETRY_BACKOFF_SECONDS: float = 0.5  # 재시도 대기 시간 (시도마다 2배, 최대 HTTP_RETRY_MAX_BACKOFF_SECONDS)
+    HTTP_RETRY_MAX_BACKOFF_SECONDS: float = 8.0
+    # 외부 API 응답 캐시 (SQLite 파일, 여러 프로세스가 공유)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATH: str = "/tmp/searim-http-cache.sqlite3"
+    HTTP_CACHE_RETENTION_SECONDS: int = 86400  # 이 시간 동안 갱신(재검증)되지 않은 캐시 항목은 삭제
+    NEWS_API_CACHE_TTL_SECONDS: int = 300  # 뉴스 API 응답을 요청 없이 재사용할 시간 (이후 조건부 요청)
+    OCEAN_DATA_API_CACHE_TTL_SECONDS: int = 600  # 관측소 목록을 요청 없이 재사용할 시간 (이후 조건부 요청)
+
     # Application
     APP_TITLE: str = "Marine Real Estate API"
     APP_VERSION: str = "1.0.0"
     APP_DESCRIPTION: str = "해양 부동산 관리 및 거래 플랫폼 API"
 
     # Background Tasks
+    RUN_BACKGROUND_JOBS: bool = True  # false: API만 실행 (백그라운드 작업은 python -m app.background.worker로 별도 실행)
     ARTICLE_FETCH_INTERVAL_MINUTES: int = 60  # 1시간마다 기사 수집
     INCOME_GENERATION_INTERVAL_SECONDS: int = 10  # 10초마다 수익금 지급
     PRICE_UPDATE_INTERVAL_MINUTES: int = 10  # 10분마다 시세 업데이트
     OCEAN_DATA_FETCH_INTERVAL_MINUTES: int = 30  # 30분마다 해양 관측소 데이터 수집
+    AUCTION_FINALIZE_BATCH_SIZE: int = 200  # 경매 정산 1회 트랜잭션에 묶을 경매 수
+    AUCTION_SWEEP_INTERVAL_MINUTES: int = 10  # 경매 종료 누락 점검 주기 (경매는 종료 스케줄러가 종료 시간에 맞춰 처리)
+    # 쓰레기 수집 기반 시세 업데이트 방식
+    # "bulk": 모든 해양을 SQL 일괄 UPDATE/INSERT로 처리
+    # "per_ocean": 해양마다 ORM 객체를 수정 (기존 방식)
+    GARBAGE_PRICE_UPDATE_MODE: str = "bulk"
+    NEWS_FETCH_PAGE_SIZE: int = 100  # 뉴스 API 페이지당 기사 수
+    NEWS_FETCH_MAX_PAGES: int = 5  # 1회 수집 시 최대 페이지 수
+    ARTICLE_SENTIMENT_BATCH_SIZE: int = 10  # 감성 분석 1회 요청에 묶을 기사 수
+    ARTICLE_SENTIMENT_CONCURRENCY: int = 5  # 감성 분석 동시 요청 수
+    ARTICLE_SENTIMENT_TIMEOUT_SECONDS: float = 30.0  # 감성 분석 1회 요청 제한 시간 (초과 시 중립)
+    SENTIMENT_CACHE_TTL_HOURS: int = 168  # 감성 분석 캐시 유지 시간 (7일)
+    SENTIMENT_CACHE_MAX_ENTRIES: int = 5000  # 프로세스 내 LRU 캐시 최대 항목 수
+    ARTICLE_URL_FILTER_CAPACITY: int = 100000  # 저장된 기사 URL 블룸 필터 초기 용량
+    ARTICLE_URL_FILTER_ERROR_RATE: float = 0.001  # 블룸 필터 오탐률
+    OCEAN_LOCATION_INDEX_TTL_SECONDS: int = 300  # 해양 위치 인덱스 재구성 주기 (다른 프로세스의 해양 변경 반영)
+    AUCTION_RELOAD_INTERVAL_SECONDS: int = 10  # 다른 워커에서 등록된 새 경매를 읽어오는 주기
+    AUCTION_RELOAD_OVERLAP_SECONDS: int = 60  # 새 경매를 읽을 때 ID와 관계없이 다시 확인할 최근 등록 구간 (늦게 커밋된 경매 보완)
+    LEADER_LOCK_NAME: str = "searim-background-leader"  # 리더 선출용 MySQL GET_LOCK 이름
+    LEADER_LOCK_FILE: str = "/tmp/searim-background-leader.lock"  # MySQL이 아닐 때 사용할 잠금 파일
+    LEADER_CHECK_INTERVAL_SECONDS: int = 10  # 리더 잠금 확인/재시도 주기
+    # 작업별 스케줄 정책 (작업 ID: 값) - 없는 작업은 기본값(동시 실행 1개, 누락 실행 합치기, 유예 1초) 사용
+    JOB_MAX_INSTANCES: Dict[str, int] = {}  # 동시에 실행될 수 있는 최대 인스턴스 수
+    JOB_COALESCE: Dict[str, bool] = {}  # 밀린 실행을 한 번으로 합칠지 여부
+    JOB_MISFIRE_GRACE_SECONDS: Dict[str, int] = {  # 예정 시각을 놓쳤을 때 늦게라도 실행할 수 있는 유예 시간
+        "fetch_articles": 300,
+        "update_prices_by_garbage": 60,
+        "generate_building_income": 5,
+        "fetch_ocean_data": 300,
+        "finalize_expired_auctions": 60,
+        "load_new_auctions": 1
+    }
+    # 서버 시작 시 초기 작업(기사/시세/관측소 데이터 수집, 미션 생성) 실행 방식
+    # "background": 요청을 바로 받으면서 백그라운드에서 동시에 실행 (완료 여부는 /ready로 확인)
+    # "blocking": 모든 초기 작업이 끝난 뒤 요청을 받음 (기존 방식)
+    STARTUP_WARMUP_MODE: str = "background"
+    STARTUP_WARMUP_TIMEOUT_SECONDS: int = 120  # 초기 작업별 제한 시간
+    BACKGROUND_DB_WORKERS: int = 4  # 백그라운드 작업의 DB 처리용 스레드 수 (DB 커넥션 풀보다 작게)
+
+    # Building Income Payout
+    # "bulk": 소유자별 집계 후 일괄 UPDATE로 지급
+    # "per_building": 건물마다 소유자를 조회하여 지급 (기존 방식)
+    # "accrual": 주기 지급 없이 잔액 조회/지출 시점에 미정산 수익금을 정산
+    INCOME_PAYOUT_MODE: str = "bulk"
 
     # Building Costs (건물 구매 비용)
     STORE_COST: int = 100000  # 가게 구매 비용 (10만 크레딧)
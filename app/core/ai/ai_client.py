@@ -2,33 +2,75 @@
 AI 클라이언트 팩토리
 
 환경변수에 따라 적절한 AI 클라이언트를 반환합니다.
+프로바이더 SDK(openai, google.generativeai, PIL)는 AI를 처음 호출할 때 import되며,
+AI를 사용하지 않는 프로세스(워커, 테스트, CLI)는 SDK를 불러오지 않습니다.
 """
+import importlib
+import threading
+from typing import Any, Callable, Dict
 from app.config import get_settings
 
 settings = get_settings()
 
 
+def _load(module_name: str, class_name: str) -> Callable[[], Any]:
+    def factory():
+        return getattr(importlib.import_module(module_name), class_name)()
+    return factory
+
+
+# 프로바이더 이름: 클라이언트 생성 함수
+_providers: Dict[str, Callable[[], Any]] = {
+    "openai": _load("app.core.ai.openai_client", "OpenAIClient"),
+    "gemini": _load("app.core.ai.gemini_client", "GeminiClient")
+}
+_clients: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def register_provider(name: str, factory: Callable[[], Any]) -> None:
+    """
+    AI 프로바이더를 등록합니다. (테스트용 가짜 클라이언트 등)
+
+    Args:
+        name: 프로바이더 이름 (AI_MODEL_PROVIDER 값)
+        factory: 클라이언트를 생성하는 함수 - 처음 사용할 때 한 번만 호출됨
+    """
+    with _lock:
+        _providers[name.lower()] = factory
+        _clients.pop(name.lower(), None)
+
+
 def get_ai_client():
     """
     환경변수에 따라 적절한 AI 클라이언트를 반환합니다.
+    클라이언트는 처음 요청될 때 생성되어 재사용됩니다.
 
     Returns:
         GeminiClient 또는 OpenAIClient 인스턴스
     """
     provider = settings.AI_MODEL_PROVIDER.lower()
 
-    if provider == "openai":
-        from app.core.ai.openai_client import openai_client
-        return openai_client
-    elif provider == "gemini":
-        from app.core.ai.gemini_client import gemini_client
-        return gemini_client
-    else:
+    if provider not in _providers:
         # 기본값은 OpenAI
         print(f"⚠️ 알 수 없는 AI 모델 프로바이더: {provider}. OpenAI를 사용합니다.")
-        from app.core.ai.openai_client import openai_client
-        return openai_client
+        provider = "openai"
+
+    client = _clients.get(provider)
+    if client is None:
+        with _lock:
+            client = _clients.get(provider)
+            if client is None:
+                client = _clients[provider] = _providers[provider]()
+    return client
+
+
+class _LazyAIClient:
+    """처음 속성에 접근할 때 실제 AI 클라이언트를 생성해 위임하는 프록시"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_ai_client(), name)
 
 
-# 싱글톤 인스턴스 (편의를 위해)
-ai_client = get_ai_client()
+# 싱글톤 인스턴스 (편의를 위해, import 시점에는 클라이언트를 만들지 않음)
+ai_client = _LazyAIClient()
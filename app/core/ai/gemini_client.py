@@ -2,14 +2,16 @@ import google.generativeai as genai
 from PIL import Image
 import io
 import json
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from app.config import get_settings
+from app.core.ai.sentiment_batch import (
+    build_batch_sentiment_prompt,
+    fill_missing_sentiments,
+    parse_batch_sentiment_response,
+)
 
 settings = get_settings()
 
-# Gemini API 설정
-genai.configure(api_key=settings.GEMINI_API_KEY)
-
 
 class GeminiClient:
     """
@@ -19,6 +21,8 @@ class GeminiClient:
     """
 
     def __init__(self):
+        # Gemini API 설정
+        genai.configure(api_key=settings.GEMINI_API_KEY)
         self.model = genai.GenerativeModel('gemini-2.0-flash')
 
     async def verify_garbage_image(self, image_bytes: bytes) -> bool:
@@ -155,7 +159,8 @@ class GeminiClient:
             답변은 반드시 하나의 단어만 출력하세요 (positive, negative, neutral 중 하나).
             """
 
-            response = self.model.generate_content(prompt)
+            # 여러 기사를 동시에 분석할 수 있도록 비동기 API 사용
+            response = await self.model.generate_content_async(prompt)
             result = response.text.strip().lower()
 
             # 결과 검증
@@ -170,6 +175,37 @@ class GeminiClient:
             print(f"Gemini 감성 분석 오류: {e}")
             return "neutral"  # 오류 시 중립으로 처리
 
+    async def analyze_articles_sentiment_batch(self, items: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        여러 기사의 감성을 한 번의 요청으로 분석합니다.
+
+        응답 JSON을 항목별로 검증하며, 파싱에 실패하거나 결과가 누락/잘못된 항목은
+        analyze_article_sentiment로 개별 분석합니다.
+
+        Args:
+            items: (해양 이름, 기사 제목, 기사 내용) 목록
+
+        Returns:
+            List[str]: 입력 순서대로 "positive", "negative", "neutral" 중 하나
+        """
+        if not items:
+            return []
+
+        results: List[Optional[str]] = [None] * len(items)
+
+        try:
+            # Gemini에게 감성 분석 일괄 요청
+            prompt = build_batch_sentiment_prompt(items)
+
+            response = await self.model.generate_content_async(prompt)
+            results = parse_batch_sentiment_response(response.text, len(items))
+
+        except Exception as e:
+            print(f"Gemini 감성 일괄 분석 오류 (개별 분석으로 대체): {e}")
+
+        # 결과가 없는 항목은 동시에 개별 분석
+        return await fill_missing_sentiments(results, items, self.analyze_article_sentiment)
+
     async def generate_mission(self) -> Optional[Dict]:
         """
         AI를 사용하여 새로운 해양 관련 미션을 생성합니다.
@@ -232,7 +268,3 @@ class GeminiClient:
         except Exception as e:
             print(f"Gemini AI 미션 생성 오류: {e}")
             return None
-
-
-# 싱글톤 인스턴스
-gemini_client = GeminiClient()
@@ -1,10 +1,14 @@
 from openai import AsyncOpenAI
-from PIL import Image
 import io
 import json
 import base64
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from app.config import get_settings
+from app.core.ai.sentiment_batch import (
+    build_batch_sentiment_prompt,
+    fill_missing_sentiments,
+    parse_batch_sentiment_response,
+)
 
 settings = get_settings()
 
@@ -232,6 +236,45 @@ class OpenAIClient:
             print(f"OpenAI 감성 분석 오류: {e}")
             return "neutral"  # 오류 시 중립으로 처리
 
+    async def analyze_articles_sentiment_batch(self, items: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        여러 기사의 감성을 한 번의 요청으로 분석합니다.
+
+        응답 JSON을 항목별로 검증하며, 파싱에 실패하거나 결과가 누락/잘못된 항목은
+        analyze_article_sentiment로 개별 분석합니다.
+
+        Args:
+            items: (해양 이름, 기사 제목, 기사 내용) 목록
+
+        Returns:
+            List[str]: 입력 순서대로 "positive", "negative", "neutral" 중 하나
+        """
+        if not items:
+            return []
+
+        results: List[Optional[str]] = [None] * len(items)
+
+        try:
+            # OpenAI에게 감성 분석 일괄 요청
+            prompt = build_batch_sentiment_prompt(items)
+
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=50 + 30 * len(items),
+                response_format={"type": "json_object"}
+            )
+
+            results = parse_batch_sentiment_response(response.choices[0].message.content, len(items))
+
+        except Exception as e:
+            print(f"OpenAI 감성 일괄 분석 오류 (개별 분석으로 대체): {e}")
+
+        # 결과가 없는 항목은 동시에 개별 분석
+        return await fill_missing_sentiments(results, items, self.analyze_article_sentiment)
+
     async def generate_mission(self) -> Optional[Dict]:
         """
         AI를 사용하여 새로운 해양 관련 미션을 생성합니다.
@@ -296,7 +339,3 @@ class OpenAIClient:
         except Exception as e:
             print(f"OpenAI AI 미션 생성 오류: {e}")
             return None
-
-
-# 싱글톤 인스턴스
-openai_client = OpenAIClient()
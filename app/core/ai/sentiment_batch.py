@@ -0,0 +1,105 @@
+import asyncio
+import json
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+VALID_SENTIMENTS = ("positive", "negative", "neutral")
+
+
+def build_batch_sentiment_prompt(items: List[Tuple[str, str, str]]) -> str:
+    """
+    기사 감성 일괄 분석 프롬프트를 생성합니다.
+
+    Args:
+        items: (해양 이름, 기사 제목, 기사 내용) 목록
+
+    Returns:
+        str: AI에게 보낼 프롬프트
+    """
+    article_lines = "\n".join(
+        f"[{index}] 해양: {ocean_name} | 제목: {article_title} | 내용: {article_content[:300]}"
+        for index, (ocean_name, article_title, article_content) in enumerate(items)
+    )
+
+    return f"""
+    다음 기사들이 각각 함께 적힌 해양 지역에 대해 긍정적인지, 부정적인지, 중립적인지 판단해주세요.
+
+    {article_lines}
+
+    판단 기준:
+    - 긍정적: 수질 개선, 환경 보호, 관광 활성화, 생태계 회복, 투자, 개발 등
+    - 부정적: 오염, 쓰레기, 환경 파괴, 적조, 사고, 피해 등
+    - 중립적: 단순 정보 전달, 통계, 일반 소식 등
+
+    응답은 반드시 다음 JSON 형식으로만 작성하세요:
+    {{
+        "results": [
+            {{"index": 기사 번호, "sentiment": "positive, negative, neutral 중 하나"}}
+        ]
+    }}
+
+    모든 기사 번호에 대해 하나씩 결과를 포함하고, JSON만 출력하세요.
+    """
+
+
+def parse_batch_sentiment_response(result_text: str, count: int) -> List[Optional[str]]:
+    """
+    일괄 분석 응답 JSON을 항목별로 검증하여 파싱합니다.
+
+    코드 블록으로 감싸진 응답도 처리하며, 누락되었거나 잘못된 항목은 None으로 남깁니다.
+
+    Args:
+        result_text: AI 응답 텍스트
+        count: 요청한 기사 수
+
+    Returns:
+        List[Optional[str]]: 입력 순서대로 감성 또는 None
+
+    Raises:
+        json.JSONDecodeError: 응답이 JSON이 아닌 경우
+    """
+    result_text = result_text.strip()
+
+    # 코드 블록으로 감싸진 경우 제거
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+
+    result_data = json.loads(result_text)
+
+    results: List[Optional[str]] = [None] * count
+    entries = result_data.get("results", []) if isinstance(result_data, dict) else []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("index")
+        sentiment = str(entry.get("sentiment", "")).strip().lower()
+        if isinstance(index, int) and 0 <= index < count and sentiment in VALID_SENTIMENTS:
+            results[index] = sentiment
+
+    return results
+
+
+async def fill_missing_sentiments(
+    results: List[Optional[str]],
+    items: List[Tuple[str, str, str]],
+    analyze_one: Callable[[str, str, str], Awaitable[str]]
+) -> List[str]:
+    """
+    일괄 분석 결과가 없는 항목을 개별 분석으로 동시에 채웁니다.
+
+    Args:
+        results: 일괄 분석 결과 (누락 항목은 None)
+        items: (해양 이름, 기사 제목, 기사 내용) 목록
+        analyze_one: 기사 하나를 분석하는 코루틴 함수
+
+    Returns:
+        List[str]: 입력 순서대로 "positive", "negative", "neutral" 중 하나
+    """
+    missing = [index for index, result in enumerate(results) if result is None]
+    fallbacks = await asyncio.gather(*(analyze_one(*items[index]) for index in missing))
+
+    filled = list(results)
+    for index, sentiment in zip(missing, fallbacks):
+        filled[index] = sentiment
+    return filled
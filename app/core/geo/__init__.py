@@ -0,0 +1,3 @@
+from app.core.geo.spatial import GeoKDTree, haversine_km
+
+__all__ = ["GeoKDTree", "haversine_km"]
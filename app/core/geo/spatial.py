@@ -0,0 +1,131 @@
+"""
+공간 검색 유틸리티
+
+위도/경도를 3차원 단위 벡터로 변환해 KD-Tree에 넣고,
+대권 거리(haversine)와 단조 관계인 현(chord) 거리로 최근접 지점을 찾습니다.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+
+_Vector = Tuple[float, float, float]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    두 지점 사이의 대권 거리를 계산합니다.
+
+    Args:
+        lat1: 지점 1 위도
+        lon1: 지점 1 경도
+        lat2: 지점 2 위도
+        lon2: 지점 2 경도
+
+    Returns:
+        float: 거리 (km)
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_vector(lat: float, lon: float) -> _Vector:
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_for_km(distance_km: float) -> float:
+    # 대권 거리 d에 해당하는 단위 구 위의 현 길이 = 2 * sin(d / 2R)
+    angle = min(math.pi, distance_km / EARTH_RADIUS_KM)
+    return 2 * math.sin(angle / 2)
+
+
+class GeoKDTree:
+    """
+    위도/경도 지점용 KD-Tree
+
+    지점 목록으로 한 번 만들어 두고 최근접 지점을 O(log n)에 조회합니다.
+    거리가 같으면 먼저 입력된 지점을 반환합니다.
+    """
+
+    def __init__(self, points: Sequence[Tuple[float, float]]):
+        """
+        Args:
+            points: (위도, 경도) 목록
+        """
+        self._points = [(float(lat), float(lon)) for lat, lon in points]
+        self._vectors: List[_Vector] = [_to_vector(lat, lon) for lat, lon in self._points]
+        # 노드: (지점 인덱스, 분할 축, 왼쪽 노드, 오른쪽 노드)
+        self._root = self._build(list(range(len(self._vectors))), 0)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _build(self, indexes: List[int], depth: int):
+        if not indexes:
+            return None
+        axis = depth % 3
+        indexes.sort(key=lambda index: (self._vectors[index][axis], index))
+        middle = len(indexes) // 2
+        return (
+            indexes[middle],
+            axis,
+            self._build(indexes[:middle], depth + 1),
+            self._build(indexes[middle + 1:], depth + 1)
+        )
+
+    def nearest(self, lat: float, lon: float, max_distance_km: Optional[float] = None) -> Optional[Tuple[int, float]]:
+        """
+        가장 가까운 지점을 찾습니다.
+
+        Args:
+            lat: 기준 위도
+            lon: 기준 경도
+            max_distance_km: 최대 거리 (km) - 이보다 먼 지점은 무시
+
+        Returns:
+            Optional[Tuple[int, float]]: (지점 인덱스, 거리 km) 또는 None
+        """
+        if self._root is None:
+            return None
+
+        target = _to_vector(lat, lon)
+        limit = _chord_for_km(max_distance_km) ** 2 if max_distance_km is not None else float("inf")
+        # (현 거리 제곱, 지점 인덱스) - 튜플 비교로 동거리일 때 앞선 인덱스 우선
+        best: List[Tuple[float, int]] = [(limit, len(self._points))]
+
+        # (노드, 분할 평면까지의 거리 제곱)
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, plane_squared = stack.pop()
+            # 분할 평면이 현재 최선보다 멀면 그 너머는 볼 필요가 없다
+            if node is None or plane_squared > best[0][0]:
+                continue
+            index, axis, left, right = node
+            vector = self._vectors[index]
+            squared = (
+                (vector[0] - target[0]) ** 2 +
+                (vector[1] - target[1]) ** 2 +
+                (vector[2] - target[2]) ** 2
+            )
+            if (squared, index) < best[0] and squared <= limit:
+                best[0] = (squared, index)
+
+            diff = target[axis] - vector[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+
+        _, index = best[0]
+        if index == len(self._points):
+            return None
+
+        point_lat, point_lon = self._points[index]
+        return index, haversine_km(lat, lon, point_lat, point_lon)
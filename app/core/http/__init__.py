@@ -0,0 +1,4 @@
+from app.core.http.client import close_http_client, get_http_client, request, start_http_client
+from app.core.http.cache import CachedResponse, cached_get
+
+__all__ = ["CachedResponse", "cached_get", "close_http_client", "get_http_client", "request", "start_http_client"]
@@ -0,0 +1,207 @@
+"""
+외부 API 응답 캐시
+
+GET 응답을 URL과 파라미터 기준으로 SQLite 파일에 저장합니다.
+- TTL 안의 응답은 요청 없이 캐시에서 반환
+- TTL이 지나면 ETag/Last-Modified로 조건부 요청을 보내고, 304면 캐시된 본문을 재사용
+캐시 키는 파라미터(API 키 포함)의 해시이므로 파일에 API 키가 그대로 저장되지 않습니다.
+여러 프로세스가 같은 파일을 공유할 수 있습니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.core.http.client import request
+
+settings = get_settings()
+
+
+class CachedResponse:
+    """
+    캐시를 거친 응답
+
+    Attributes:
+        status_code: HTTP 상태 코드 (304로 재검증된 경우 200)
+        content: 응답 본문
+        content_hash: 본문 SHA-256 (200 응답만) - 내용이 바뀌었는지 비교할 때 사용
+        from_cache: 요청 없이 캐시에서 반환했는지 여부
+        revalidated: 조건부 요청 결과 304로 캐시된 본문을 재사용했는지 여부
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        content_hash: Optional[str] = None,
+        from_cache: bool = False,
+        revalidated: bool = False
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.content_hash = content_hash
+        self.from_cache = from_cache
+        self.revalidated = revalidated
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """
+    SQLite 기반 응답 캐시
+    """
+
+    def __init__(self, path: str, retention_seconds: float):
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS http_responses ("
+                        "cache_key TEXT PRIMARY KEY, "
+                        "url TEXT NOT NULL, "
+                        "etag TEXT, "
+                        "last_modified TEXT, "
+                        "content BLOB NOT NULL, "
+                        "content_hash TEXT NOT NULL, "
+                        "fetched_at REAL NOT NULL)"
+                    )
+                    connection.commit()
+                    self._initialized = True
+        return connection
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        normalized = json.dumps(sorted((params or {}).items()), ensure_ascii=False, default=str)
+        return hashlib.sha256(f"GET {url} {normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Tuple[Optional[str], Optional[str], bytes, str, float]]:
+        """
+        캐시 항목을 조회합니다. (블로킹)
+
+        Returns:
+            Optional[Tuple]: (etag, last_modified, content, content_hash, fetched_at) 또는 None
+        """
+        connection = self._connect()
+        try:
+            return connection.execute(
+                "SELECT etag, last_modified, content, content_hash, fetched_at "
+                "FROM http_responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+        finally:
+            connection.close()
+
+    def put(
+        self,
+        cache_key: str,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content: bytes,
+        content_hash: str
+    ) -> None:
+        """캐시 항목을 저장하고 보관 기간이 지난 항목을 정리합니다. (블로킹)"""
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO http_responses "
+                "(cache_key, url, etag, last_modified, content, content_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, url, etag, last_modified, content, content_hash, now)
+            )
+            connection.execute(
+                "DELETE FROM http_responses WHERE fetched_at < ?",
+                (now - self.retention_seconds,)
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+    def touch(self, cache_key: str) -> None:
+        """재검증된 항목의 TTL을 다시 시작합니다. (블로킹)"""
+        connection = self._connect()
+        try:
+            connection.execute(
+                "UPDATE http_responses SET fetched_at = ? WHERE cache_key = ?",
+                (time.time(), cache_key)
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache(
+    path=settings.HTTP_CACHE_PATH,
+    retention_seconds=settings.HTTP_CACHE_RETENTION_SECONDS
+)
+
+
+async def cached_get(url: str, params: Optional[Dict[str, Any]] = None, ttl_seconds: float = 0) -> CachedResponse:
+    """
+    캐시를 거쳐 GET 요청을 보냅니다. (요청은 공용 HTTP 클라이언트로, 재시도 포함)
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        ttl_seconds: 요청 없이 캐시를 사용할 시간 (초) - 0이면 항상 조건부 요청
+
+    Returns:
+        CachedResponse: 응답 (200이 아닌 응답은 캐시하지 않고 그대로 반환)
+
+    Raises:
+        httpx.HTTPError: 모든 시도에서 연결/타임아웃 오류가 발생한 경우
+    """
+    if not settings.HTTP_CACHE_ENABLED:
+        response = await request("GET", url, params=params)
+        content_hash = hashlib.sha256(response.content).hexdigest() if response.status_code == 200 else None
+        return CachedResponse(response.status_code, response.content, content_hash)
+
+    cache_key = response_cache.make_key(url, params)
+    entry = await asyncio.to_thread(response_cache.get, cache_key)
+
+    headers = {}
+    if entry is not None:
+        etag, last_modified, content, content_hash, fetched_at = entry
+        if time.time() - fetched_at < ttl_seconds:
+            return CachedResponse(200, content, content_hash, from_cache=True)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = await request("GET", url, params=params, headers=headers)
+
+    if response.status_code == 304 and entry is not None:
+        await asyncio.to_thread(response_cache.touch, cache_key)
+        return CachedResponse(200, content, content_hash, revalidated=True)
+
+    if response.status_code != 200:
+        return CachedResponse(response.status_code, response.content)
+
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    await asyncio.to_thread(
+        response_cache.put,
+        cache_key,
+        url,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        response.content,
+        content_hash
+    )
+    return CachedResponse(200, response.content, content_hash)
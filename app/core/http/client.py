@@ -0,0 +1,127 @@
+"""
+외부 API용 공용 HTTP 클라이언트
+
+애플리케이션 전체에서 하나의 httpx.AsyncClient를 공유해 연결(TLS 핸드셰이크 포함)을 재사용합니다.
+lifespan(또는 워커)에서 start_http_client로 만들고 종료 시 close_http_client로 닫습니다.
+연결 오류와 일시적인 서버 오류는 지수 백오프로 재시도합니다.
+"""
+
+import asyncio
+import random
+from typing import Any, Optional
+
+import httpx
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _create_client() -> httpx.AsyncClient:
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not _http2_available():
+        print("⚠️  h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install \"httpx[http2]\")")
+        http2 = False
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.HTTP_READ_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+        ),
+        http2=http2
+    )
+
+
+def start_http_client() -> httpx.AsyncClient:
+    """
+    공용 HTTP 클라이언트를 생성합니다. 이미 있으면 그대로 반환합니다.
+
+    Returns:
+        httpx.AsyncClient: 공용 HTTP 클라이언트
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공용 HTTP 클라이언트를 반환합니다.
+    lifespan 밖(스크립트 등)에서 호출되면 새로 생성합니다.
+
+    Returns:
+        httpx.AsyncClient: 공용 HTTP 클라이언트
+    """
+    return start_http_client()
+
+
+async def close_http_client() -> None:
+    """공용 HTTP 클라이언트를 닫습니다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    # 서버가 Retry-After(초)를 알려주면 따른다
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), settings.HTTP_RETRY_MAX_BACKOFF_SECONDS)
+
+    delay = min(settings.HTTP_RETRY_BACKOFF_SECONDS * (2 ** attempt), settings.HTTP_RETRY_MAX_BACKOFF_SECONDS)
+    # 여러 요청이 동시에 재시도하지 않도록 지터 추가
+    return delay * random.uniform(0.5, 1.0)
+
+
+async def request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """
+    공용 클라이언트로 요청을 보내고, 연결 오류/일시적 오류는 재시도합니다.
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL
+        **kwargs: httpx.AsyncClient.request에 전달할 인자 (params, headers, timeout 등)
+
+    Returns:
+        httpx.Response: 마지막 응답 (재시도 후에도 일시적 오류면 그 응답)
+
+    Raises:
+        httpx.HTTPError: 모든 시도에서 연결/타임아웃 오류가 발생한 경우
+    """
+    client = get_http_client()
+    attempts = max(1, settings.HTTP_RETRY_ATTEMPTS)
+
+    for attempt in range(attempts):
+        is_last = attempt == attempts - 1
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if is_last:
+                raise
+            await asyncio.sleep(_retry_delay(attempt, None))
+            continue
+
+        if response.status_code not in RETRY_STATUS_CODES or is_last:
+            return response
+        await asyncio.sleep(_retry_delay(attempt, response))
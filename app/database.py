@@ -1,15 +1,16 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Integer, cast, create_engine, func, literal_column
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.sql import Select
+from typing import Any, Dict, Generator, List, Optional
 from app.config import get_settings
 
 settings = get_settings()
 
-# MySQL 연결을 위한 추가 인자
+# MySQL 연결을 위한 추가 인자 (테스트용 SQLite 등에는 전달하지 않음)
 connect_args = {
     "init_command": "SET time_zone='+09:00'"  # KST 시간대 설정
-}
+} if settings.DATABASE_URL.startswith("mysql") else {}
 
 # MySQL 전용 엔진 설정
 engine = create_engine(
@@ -52,11 +53,83 @@ def init_db():
     """
     # 모든 Entity import (테이블 생성을 위해 필요)
     from app.domain.auth.domain.entity import User
-    from app.domain.ocean.domain.entity import Ocean, WaterQuality, OceanPriceHistory
+    from app.domain.ocean.domain.entity import Ocean, WaterQuality, WaterQualityHistory, OceanPriceHistory
     from app.domain.ocean_management.domain.entity import OceanOwnership, Building
     from app.domain.ocean_trade.domain.entity import OceanSale, OceanAuction, AuctionBid
     from app.domain.mission.domain.entity import Mission, UserMission, GarbageCollection
-    from app.domain.article.domain.entity import Article
+    from app.domain.article.domain.entity import Article, ArticleSentimentCache, NewsFetchWatermark
 
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
+
+
+def upsert(
+    db: Session,
+    model: Any,
+    index_elements: List[str],
+    update_columns: List[str],
+    values: Optional[List[Dict[str, Any]]] = None,
+    select: Optional[Select] = None,
+    select_columns: Optional[List[str]] = None
+):
+    """
+    데이터베이스 종류에 맞는 INSERT ... ON DUPLICATE KEY UPDATE / ON CONFLICT DO UPDATE를 실행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: 대상 Entity 클래스
+        index_elements: 충돌을 판단할 고유 키 컬럼 (MySQL은 테이블의 고유 키를 자동으로 사용)
+        update_columns: 충돌 시 새 값으로 덮어쓸 컬럼
+        values: 삽입할 행 목록 (select와 둘 중 하나)
+        select: INSERT ... SELECT에 사용할 SELECT 문
+        select_columns: select 결과에 대응하는 컬럼 이름
+
+    Returns:
+        실행 결과
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    statement = insert(model)
+    if select is not None:
+        statement = statement.from_select(select_columns, select)
+    else:
+        statement = statement.values(values)
+
+    if dialect == "mysql":
+        statement = statement.on_duplicate_key_update(
+            {column: statement.inserted[column] for column in update_columns}
+        )
+    else:
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: statement.excluded[column] for column in update_columns}
+        )
+
+    return db.execute(statement)
+
+
+def seconds_between(db: Session, start: Any, end: Any):
+    """
+    데이터베이스 종류에 맞는 두 시각 사이의 경과 초(소수점 이하 버림) SQL 식을 만듭니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 시각 (컬럼 또는 값)
+        end: 종료 시각 (컬럼 또는 값)
+
+    Returns:
+        정수 경과 초 SQL 식
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        return func.timestampdiff(literal_column("SECOND"), start, end)
+    if dialect == "postgresql":
+        return cast(func.floor(func.extract("epoch", end - start)), Integer)
+    # SQLite: julianday 차이(일)를 초로 변환 (부동소수점 오차를 밀리초에서 반올림한 뒤 버림)
+    return cast(func.round((func.julianday(end) - func.julianday(start)) * 86400, 3), Integer)
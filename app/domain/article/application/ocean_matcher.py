@@ -0,0 +1,144 @@
+"""
+기사-해양 매칭기
+
+모든 해양 이름과 그 변형 키워드로 Aho-Corasick 오토마톤을 한 번 만들어 두고,
+기사 본문을 한 번만 훑어 매칭되는 해양을 찾습니다.
+해양 목록이 바뀔 때만 오토마톤을 다시 만듭니다.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (해양 순서, 키워드 순서) - 값이 작을수록 우선
+_Priority = Tuple[int, int]
+_NO_MATCH: _Priority = (2 ** 62, 2 ** 62)
+
+
+def build_ocean_keywords(ocean_name: str) -> List[str]:
+    """
+    해양 이름에서 기사 매칭용 키워드를 만듭니다.
+
+    1. 전체 해양 이름
+    2. " 앞바다", " 해역"을 제거한 이름
+    3. 2의 이름을 공백으로 나눈 3글자 이상 단어
+
+    Args:
+        ocean_name: 해양 이름
+
+    Returns:
+        List[str]: 우선순위 순서의 키워드 목록
+    """
+    ocean_name_clean = ocean_name.replace(" 앞바다", "").replace(" 해역", "").strip()
+
+    keywords = [ocean_name, ocean_name_clean]
+    if " " in ocean_name_clean:
+        for word in ocean_name_clean.split():
+            if len(word) >= 3:  # 3글자 이상만
+                keywords.append(word)
+
+    return keywords
+
+
+class OceanKeywordMatcher:
+    """
+    Aho-Corasick 기반 해양 키워드 매칭기
+
+    여러 해양이 동시에 매칭되면 기존 순차 매칭과 같은 결과가 나오도록
+    (해양 순서, 키워드 순서)가 가장 앞서는 매칭을 반환합니다.
+    """
+
+    def __init__(self, oceans: Sequence[Tuple[int, str]]):
+        """
+        Args:
+            oceans: (해양 ID, 해양 이름) 목록 (매칭 우선순위 순서)
+        """
+        self._oceans = list(oceans)
+        self._keywords: List[List[str]] = [build_ocean_keywords(name) for _, name in self._oceans]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best: List[_Priority] = [_NO_MATCH]
+
+        for ocean_index, keywords in enumerate(self._keywords):
+            for keyword_index, keyword in enumerate(keywords):
+                self._add_pattern(keyword, (ocean_index, keyword_index))
+
+        self._build_fail_links()
+
+    def _add_pattern(self, pattern: str, priority: _Priority) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(_NO_MATCH)
+            state = next_state
+        self._best[state] = min(self._best[state], priority)
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                # 실패 링크를 따라 도달 가능한 매칭 중 가장 앞선 우선순위를 미리 합쳐 둔다
+                self._best[next_state] = min(self._best[next_state], self._best[self._fail[next_state]])
+                queue.append(next_state)
+
+    def match(self, text: str) -> Optional[Tuple[int, str, str]]:
+        """
+        텍스트에서 매칭되는 해양을 찾습니다.
+
+        Args:
+            text: 검사할 텍스트 (기사 제목 + 설명)
+
+        Returns:
+            Optional[Tuple[int, str, str]]: (해양 ID, 해양 이름, 매칭 키워드) 또는 None
+        """
+        best = self._best[0]  # 빈 키워드는 항상 매칭
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._best[state] < best:
+                best = self._best[state]
+
+        if best == _NO_MATCH:
+            return None
+
+        ocean_index, keyword_index = best
+        ocean_id, ocean_name = self._oceans[ocean_index]
+        return ocean_id, ocean_name, self._keywords[ocean_index][keyword_index]
+
+
+_matcher: Optional[OceanKeywordMatcher] = None
+_matcher_signature: Optional[Tuple[Tuple[int, str], ...]] = None
+_matcher_lock = threading.Lock()
+
+
+def get_ocean_matcher(oceans: Sequence[Tuple[int, str]]) -> OceanKeywordMatcher:
+    """
+    해양 목록에 맞는 매칭기를 반환합니다. 해양 목록이 바뀐 경우에만 다시 만듭니다.
+
+    Args:
+        oceans: (해양 ID, 해양 이름) 목록 (매칭 우선순위 순서)
+
+    Returns:
+        OceanKeywordMatcher: 매칭기
+    """
+    global _matcher, _matcher_signature
+
+    signature = tuple((ocean_id, ocean_name) for ocean_id, ocean_name in oceans)
+    with _matcher_lock:
+        if _matcher is None or signature != _matcher_signature:
+            _matcher = OceanKeywordMatcher(signature)
+            _matcher_signature = signature
+        return _matcher
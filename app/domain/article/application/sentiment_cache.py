@@ -0,0 +1,117 @@
+"""
+기사 감성 분석 캐시
+
+같은 기사가 여러 URL이나 여러 수집 주기에 반복 등장할 때 AI 호출을 생략하기 위해
+(해양 이름, 제목, 설명)의 정규화 해시를 키로 감성 분석 결과를 보관합니다.
+프로세스 내 LRU 캐시가 앞단에서, article_sentiment_caches 테이블이 뒷단에서 동작합니다.
+"""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from app.config import get_settings
+
+settings = get_settings()
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def make_sentiment_cache_key(ocean_name: str, title: str, description: str) -> str:
+    """
+    감성 분석 캐시 키를 생성합니다.
+
+    유니코드 정규화(NFKC), 소문자 변환, 공백 정리 후 SHA-256 해시를 계산합니다.
+
+    Args:
+        ocean_name: 해양 이름
+        title: 기사 제목
+        description: 기사 설명
+
+    Returns:
+        str: 64자리 16진수 해시
+    """
+    normalized = "\n".join(
+        _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", value or "")).strip().lower()
+        for value in (ocean_name, title, description)
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class SentimentLRUCache:
+    """
+    TTL을 가진 프로세스 내 LRU 캐시
+
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    백그라운드 스레드 풀과 이벤트 루프에서 함께 사용되므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        만료되지 않은 캐시 항목을 조회합니다.
+
+        Args:
+            keys: 조회할 캐시 키 목록
+
+        Returns:
+            Dict[str, str]: 캐시 키별 감성
+        """
+        now = time.monotonic()
+        found: Dict[str, str] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                sentiment, stored_at = entry
+                if now - stored_at > self.ttl_seconds:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = sentiment
+        return found
+
+    def put_many(
+        self,
+        sentiments: Dict[str, str],
+        cached_at: Optional[Dict[str, datetime]] = None
+    ) -> None:
+        """
+        캐시 항목을 저장하고 최대 항목 수를 넘는 오래된 항목을 제거합니다.
+
+        DB 캐시에서 가져온 항목은 cached_at으로 원래 저장 시각을 넘겨
+        두 캐시 계층이 같은 시각에 만료되도록 합니다.
+
+        Args:
+            sentiments: 캐시 키별 감성
+            cached_at: 캐시 키별 원래 저장 일시 (없으면 현재 시각)
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key, sentiment in sentiments.items():
+                stored_at = now
+                original = (cached_at or {}).get(key)
+                if original is not None:
+                    age = (datetime.now(original.tzinfo) - original).total_seconds()
+                    stored_at = now - max(0.0, age)
+                self._entries[key] = (sentiment, stored_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# 싱글톤 인스턴스
+sentiment_lru_cache = SentimentLRUCache(
+    max_entries=settings.SENTIMENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SENTIMENT_CACHE_TTL_HOURS * 3600
+)
@@ -0,0 +1,138 @@
+"""
+저장된 기사 URL 필터
+
+articles 테이블의 URL로 블룸 필터를 채워 두고, 뉴스 수집 시 새 URL은 DB 조회 없이 걸러냅니다.
+블룸 필터가 "있을 수도 있다"고 판단한 URL만 IN 쿼리 한 번으로 실제 존재 여부를 확인합니다.
+"""
+
+import hashlib
+import math
+import threading
+from typing import Iterable, Set
+from sqlalchemy.orm import Session
+from app.domain.article.domain.repository import ArticleRepository
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class BloomFilter:
+    """
+    블룸 필터
+
+    거짓 음성 없이 "확실히 없음"과 "있을 수도 있음"을 판단합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Args:
+            capacity: 예상 최대 항목 수
+            error_rate: 목표 오탐률
+        """
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.bit_count = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.bit_count
+
+    def add(self, item: str) -> None:
+        """항목을 추가합니다."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class KnownArticleUrls:
+    """
+    저장된 기사 URL 집합 (블룸 필터 + DB 확인)
+
+    처음 사용할 때(또는 무효화 후) articles 테이블에서 URL을 읽어 필터를 채우고,
+    이후에는 새로 저장한 URL만 추가합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter: BloomFilter = BloomFilter(capacity, error_rate)
+        self._warmed = False
+        self._lock = threading.Lock()
+
+    def _warm(self, db: Session) -> None:
+        urls = list(ArticleRepository(db).iter_all_urls())
+
+        # 용량을 넘으면 오탐률이 급격히 오르므로 여유 있게 다시 만든다
+        capacity = self.capacity
+        while capacity < len(urls) * 2:
+            capacity *= 2
+
+        bloom_filter = BloomFilter(capacity, self.error_rate)
+        for url in urls:
+            bloom_filter.add(url)
+
+        self._filter = bloom_filter
+        self._warmed = True
+        print(f"🔎 기사 URL 필터 준비 완료: {len(urls)}개 URL")
+
+    def find_existing(self, db: Session, urls: Iterable[str]) -> Set[str]:
+        """
+        주어진 URL 중 이미 저장된 URL을 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            urls: 확인할 기사 URL 목록
+
+        Returns:
+            Set[str]: 이미 저장된 URL 집합
+        """
+        with self._lock:
+            if not self._warmed:
+                self._warm(db)
+            candidates = [url for url in set(urls) if url in self._filter]
+
+        if not candidates:
+            return set()
+
+        return ArticleRepository(db).find_existing_urls(candidates)
+
+    def invalidate(self) -> None:
+        """
+        필터를 무효화합니다. 다음 조회 시 articles 테이블에서 다시 채웁니다.
+
+        리더가 아니던 동안 다른 프로세스가 저장한 URL을 반영하기 위해 리더로 선출될 때 호출합니다.
+        """
+        with self._lock:
+            self._warmed = False
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """
+        새로 저장한 URL을 필터에 추가합니다.
+
+        Args:
+            urls: 저장된 기사 URL 목록
+        """
+        with self._lock:
+            if not self._warmed:
+                return
+            for url in urls:
+                self._filter.add(url)
+            if self._filter.count > self._filter.capacity:
+                # 다음 조회 시 더 큰 용량으로 다시 채운다
+                self._warmed = False
+
+
+# 싱글톤 인스턴스
+known_article_urls = KnownArticleUrls(
+    capacity=settings.ARTICLE_URL_FILTER_CAPACITY,
+    error_rate=settings.ARTICLE_URL_FILTER_ERROR_RATE
+)
@@ -34,3 +34,29 @@ class Article(Base):
 
     def __repr__(self):
         return f"<Article(article_id={self.article_id}, ocean_id={self.ocean_id}, sentiment={self.sentiment})>"
+
+
+class ArticleSentimentCache(Base):
+    """기사 감성 분석 캐시 Entity"""
+
+    __tablename__ = "article_sentiment_caches"
+
+    content_hash = Column(String(64), primary_key=True, comment="해양 이름/제목/설명 정규화 해시 (SHA-256)")
+    sentiment = Column(SQLEnum(ArticleSentiment), nullable=False, comment="감성 분석 결과")
+    cached_at = Column(DateTime(timezone=True), nullable=False, index=True, comment="캐시 저장 일시")
+
+    def __repr__(self):
+        return f"<ArticleSentimentCache(content_hash={self.content_hash}, sentiment={self.sentiment})>"
+
+
+class NewsFetchWatermark(Base):
+    """뉴스 수집 워터마크 Entity (검색 쿼리별 마지막으로 수집한 기사 발행 시각)"""
+
+    __tablename__ = "news_fetch_watermarks"
+
+    query_hash = Column(String(64), primary_key=True, comment="검색 쿼리 해시 (SHA-256)")
+    last_published_at = Column(DateTime, nullable=False, comment="마지막으로 수집한 기사 발행 일시 (UTC)")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정 일시")
+
+    def __repr__(self):
+        return f"<NewsFetchWatermark(query_hash={self.query_hash}, last_published_at={self.last_published_at})>"
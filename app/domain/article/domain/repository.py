@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
-from typing import List
-from app.domain.article.domain.entity import Article
+from sqlalchemy import exists
+from typing import List, Dict, Set, Iterable, Iterator, Optional, Tuple
+from datetime import datetime
+from app.domain.article.domain.entity import Article, ArticleSentiment, ArticleSentimentCache, NewsFetchWatermark
 
 
 class ArticleRepository:
@@ -76,4 +78,158 @@ class ArticleRepository:
         Returns:
             bool: 존재 여부
         """
-        return self.db.query(Article).filter(Article.url == url).count() > 0
+        return self.db.query(exists().where(Article.url == url)).scalar()
+
+    def find_existing_urls(self, urls: Iterable[str], chunk_size: int = 500) -> Set[str]:
+        """
+        주어진 URL 중 이미 저장된 URL을 IN 쿼리로 한 번에 조회합니다.
+
+        Args:
+            urls: 확인할 기사 URL 목록
+            chunk_size: IN 쿼리 한 번에 넣을 URL 수
+
+        Returns:
+            Set[str]: 이미 저장된 URL 집합
+        """
+        url_list = list(set(urls))
+        existing: Set[str] = set()
+        for start in range(0, len(url_list), chunk_size):
+            rows = (
+                self.db.query(Article.url)
+                .filter(Article.url.in_(url_list[start:start + chunk_size]))
+                .all()
+            )
+            existing.update(row.url for row in rows)
+        return existing
+
+    def iter_all_urls(self, batch_size: int = 5000) -> Iterator[str]:
+        """
+        저장된 모든 기사 URL을 배치 단위로 순회합니다.
+
+        Args:
+            batch_size: 한 번에 가져올 행 수
+
+        Returns:
+            Iterator[str]: 기사 URL
+        """
+        for row in self.db.query(Article.url).yield_per(batch_size):
+            yield row.url
+
+
+class ArticleSentimentCacheRepository:
+    """기사 감성 분석 캐시 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_valid_by_hashes(self, content_hashes: List[str], since: datetime) -> Dict[str, Tuple[str, datetime]]:
+        """
+        만료되지 않은 감성 분석 캐시를 조회합니다.
+
+        Args:
+            content_hashes: 조회할 콘텐츠 해시 목록
+            since: 이 시각 이후에 저장된 캐시만 유효
+
+        Returns:
+            Dict[str, Tuple[str, datetime]]: 콘텐츠 해시별 (감성, 캐시 저장 일시)
+        """
+        if not content_hashes:
+            return {}
+
+        rows = (
+            self.db.query(
+                ArticleSentimentCache.content_hash,
+                ArticleSentimentCache.sentiment,
+                ArticleSentimentCache.cached_at
+            )
+            .filter(
+                ArticleSentimentCache.content_hash.in_(content_hashes),
+                ArticleSentimentCache.cached_at >= since
+            )
+            .all()
+        )
+        return {
+            content_hash: (sentiment.value, cached_at)
+            for content_hash, sentiment, cached_at in rows
+        }
+
+    def delete_expired(self, before: datetime) -> int:
+        """
+        만료된 감성 분석 캐시를 삭제합니다. 커밋은 호출자가 수행합니다.
+
+        Args:
+            before: 이 시각 이전에 저장된 캐시를 삭제
+
+        Returns:
+            int: 삭제된 캐시 수
+        """
+        return (
+            self.db.query(ArticleSentimentCache)
+            .filter(ArticleSentimentCache.cached_at < before)
+            .delete(synchronize_session=False)
+        )
+
+    def save_all(self, sentiments: Dict[str, str], cached_at: datetime) -> None:
+        """
+        감성 분석 결과를 캐시에 저장합니다. 커밋은 호출자가 수행합니다.
+
+        Args:
+            sentiments: 콘텐츠 해시별 감성
+            cached_at: 캐시 저장 일시
+        """
+        if not sentiments:
+            return
+
+        existing = {
+            row.content_hash
+            for row in self.db.query(ArticleSentimentCache.content_hash)
+            .filter(ArticleSentimentCache.content_hash.in_(list(sentiments.keys())))
+            .all()
+        }
+        self.db.add_all([
+            ArticleSentimentCache(
+                content_hash=content_hash,
+                sentiment=ArticleSentiment(sentiment),
+                cached_at=cached_at
+            )
+            for content_hash, sentiment in sentiments.items()
+            if content_hash not in existing
+        ])
+
+
+class NewsFetchWatermarkRepository:
+    """뉴스 수집 워터마크 Repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_last_published_at(self, query_hash: str) -> Optional[datetime]:
+        """
+        검색 쿼리의 마지막 수집 기사 발행 시각을 조회합니다.
+
+        Args:
+            query_hash: 검색 쿼리 해시
+
+        Returns:
+            Optional[datetime]: 마지막 발행 시각 (UTC, naive) 또는 None
+        """
+        watermark = self.db.query(NewsFetchWatermark).filter(
+            NewsFetchWatermark.query_hash == query_hash
+        ).first()
+        return watermark.last_published_at if watermark else None
+
+    def save(self, query_hash: str, last_published_at: datetime) -> None:
+        """
+        워터마크를 저장합니다. 기존 값보다 앞선 시각으로는 되돌리지 않습니다.
+
+        Args:
+            query_hash: 검색 쿼리 해시
+            last_published_at: 마지막 발행 시각 (UTC, naive)
+        """
+        watermark = self.db.query(NewsFetchWatermark).filter(
+            NewsFetchWatermark.query_hash == query_hash
+        ).first()
+        if watermark is None:
+            self.db.add(NewsFetchWatermark(query_hash=query_hash, last_published_at=last_published_at))
+        elif watermark.last_published_at < last_published_at:
+            watermark.last_published_at = last_published_at
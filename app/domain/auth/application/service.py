@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from jose import jwt
 from fastapi import HTTPException, status
 from typing import Dict, Any, List
@@ -110,9 +111,14 @@ class AuthService:
                 detail="사용자를 찾을 수 없습니다."
             )
 
+        credits = user.credits
+        if settings.INCOME_PAYOUT_MODE == "accrual":
+            # 조회 시에는 정산하지 않고 미정산 수익금을 더해서 보여준다 (정산은 지출 시점에만)
+            credits = self.repository.find_credits_with_accrued_income(username, datetime.now(ZoneInfo("Asia/Seoul")))
+
         return {
             "username": user.user_id,
-            "credits": user.credits,
+            "credits": credits,
             "created_at": user.created_at
         }
 
@@ -126,14 +132,18 @@ class AuthService:
         Returns:
             List[Dict[str, Any]]: 랭킹 목록
         """
-        users = self.repository.find_top_users_by_credits(limit)
+        if settings.INCOME_PAYOUT_MODE == "accrual":
+            # 전체 사용자를 정산하지 않고 미정산 수익금을 더한 값으로 순위를 매긴다
+            users = self.repository.find_top_users_by_accrued_credits(datetime.now(ZoneInfo("Asia/Seoul")), limit)
+        else:
+            users = [(user.user_id, user.credits) for user in self.repository.find_top_users_by_credits(limit)]
 
         ranking = []
-        for idx, user in enumerate(users, start=1):
+        for idx, (user_id, credits) in enumerate(users, start=1):
             ranking.append({
                 "rank": idx,
-                "username": user.user_id,
-                "credits": user.credits
+                "username": user_id,
+                "credits": credits
             })
 
         return ranking
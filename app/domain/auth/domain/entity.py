@@ -11,6 +11,8 @@ class User(Base):
     user_id = Column(String(50), primary_key=True, index=True, comment="사용자 ID")
     password = Column(String(255), nullable=False, comment="비밀번호 해시")
     credits = Column(Integer, default=10000, nullable=False, comment="보유 크레딧")
+    total_income_rate = Column(Integer, default=0, nullable=False, comment="보유 건물 전체 초당 수익률 합계 (크레딧/초)")
+    income_settled_at = Column(DateTime(timezone=True), nullable=True, comment="마지막 수익금 정산 일시")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 일시")
     updated_at = Column(
         DateTime(timezone=True),
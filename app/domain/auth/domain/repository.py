@@ -1,5 +1,8 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import case
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime
+from app.database import seconds_between
 from app.domain.auth.domain.entity import User
 
 
@@ -43,6 +46,21 @@ class UserRepository:
         """
         return self.db.query(User).filter(User.user_id == username).first()
 
+    def find_all_by_usernames(self, usernames: List[str]) -> Dict[str, User]:
+        """
+        여러 사용자를 한 번에 조회합니다.
+
+        Args:
+            usernames: 사용자 이름 목록
+
+        Returns:
+            Dict[str, User]: 사용자 이름별 사용자 객체
+        """
+        if not usernames:
+            return {}
+        users = self.db.query(User).filter(User.user_id.in_(set(usernames))).all()
+        return {user.user_id: user for user in users}
+
     def exists_by_username(self, username: str) -> bool:
         """
         사용자 이름이 존재하는지 확인합니다.
@@ -71,3 +89,53 @@ class UserRepository:
             .limit(limit)
             .all()
         )
+
+    def _credits_with_accrued_income(self, now: datetime):
+        # 정산 시각이 있는 사용자만 미정산 수익금을 더한다 (정산 전 사용자는 다음 정산 때 반영)
+        accrued = case(
+            (
+                (User.total_income_rate > 0) & User.income_settled_at.isnot(None),
+                seconds_between(self.db, User.income_settled_at, now) * User.total_income_rate
+            ),
+            else_=0
+        )
+        return (User.credits + accrued).label("credits")
+
+    def find_credits_with_accrued_income(self, username: str, now: datetime) -> Optional[int]:
+        """
+        미정산 건물 수익금을 더한 사용자의 크레딧을 조회합니다. (정산하지 않는 읽기 전용 조회)
+
+        Args:
+            username: 사용자 이름
+            now: 기준 시각 (KST)
+
+        Returns:
+            Optional[int]: 크레딧 또는 None (사용자가 없는 경우)
+        """
+        return (
+            self.db.query(self._credits_with_accrued_income(now))
+            .filter(User.user_id == username)
+            .scalar()
+        )
+
+    def find_top_users_by_accrued_credits(self, now: datetime, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        미정산 건물 수익금을 더한 크레딧이 높은 순서로 사용자를 조회합니다. (정산하지 않는 읽기 전용 조회)
+
+        Args:
+            now: 기준 시각 (KST)
+            limit: 조회할 사용자 수 (기본값: 10)
+
+        Returns:
+            List[Tuple[str, int]]: (사용자 ID, 크레딧) 목록 (크레딧 내림차순)
+        """
+        credits = self._credits_with_accrued_income(now)
+        return [
+            (user_id, user_credits)
+            for user_id, user_credits in (
+                self.db.query(User.user_id, credits)
+                .order_by(credits.desc())
+                .limit(limit)
+                .all()
+            )
+        ]
@@ -2,9 +2,9 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.domain.mission.domain.entity import Mission, UserMission, GarbageCollection
 from app.domain.ocean.domain.entity import Ocean
+from app.domain.ocean.domain.location_index import ocean_location_index
 from app.domain.auth.domain.entity import User
 from datetime import datetime
-import math
 
 
 class MissionRepository:
@@ -139,33 +139,12 @@ class MissionRepository:
         Returns:
             Optional[Ocean]: 가장 가까운 해양 또는 None
         """
-        # 모든 해양 조회
-        all_oceans = self.db.query(Ocean).all()
-
-        if not all_oceans:
+        # 프로세스 내 공간 인덱스로 가장 가까운 해양 찾기 (DB 조회 없음)
+        ocean_id = ocean_location_index.find_nearest_ocean_id(self.db, lat, lon, max_distance)
+        if ocean_id is None:
             return None
 
-        # 가장 가까운 해양 찾기
-        closest_ocean = None
-        min_distance = float('inf')
-
-        for ocean in all_oceans:
-            # 거리 계산 (유클리드 거리 -> km로 변환)
-            # 위도/경도 1도는 약 111km
-            distance = math.sqrt(
-                ((ocean.lat - lat) * 111) ** 2 +
-                ((ocean.lon - lon) * 111) ** 2
-            )
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_ocean = ocean
-
-        # 최대 거리 내에 있는 경우만 반환
-        if closest_ocean and min_distance <= max_distance:
-            return closest_ocean
-
-        return None
+        return self.db.get(Ocean, ocean_id)
 
     def create_garbage_collection(
         self,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint, Enum as SQLEnum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -21,6 +21,7 @@ class Ocean(Base):
     total_square_meters = Column(Integer, default=100, nullable=False, comment="총 평수")
     available_square_meters = Column(Integer, default=100, nullable=False, comment="구매 가능한 평수")
     garbage_collection_count = Column(Integer, default=0, nullable=False, comment="쓰레기 수집 횟수")
+    price_history_sequence = Column(Integer, default=0, nullable=False, comment="마지막 시세 이력 순번")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 일시")
     updated_at = Column(
         DateTime(timezone=True),
@@ -34,12 +35,21 @@ class Ocean(Base):
 
 
 class OceanPriceHistory(Base):
-    """해양 시세 이력 Entity"""
+    """
+    해양 시세 이력 Entity
+
+    해양별 고정 슬롯(링 버퍼)에 최근 시세를 덮어씁니다. (슬롯 = 순번 % 유지 개수)
+    """
 
     __tablename__ = "ocean_price_histories"
+    __table_args__ = (
+        UniqueConstraint("ocean_id", "slot", name="uq_ocean_price_histories_ocean_slot"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="시세 이력 ID")
     ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, index=True, comment="해양 ID")
+    slot = Column(Integer, nullable=False, comment="링 버퍼 슬롯 (0 ~ 유지 개수-1)")
+    sequence = Column(Integer, nullable=False, comment="시세 이력 순번 (클수록 최신)")
     price = Column(Integer, nullable=False, comment="시세 (1평당)")
     recorded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True, comment="기록 일시")
 
@@ -58,9 +68,12 @@ class WaterQuality(Base):
     """수질 데이터 Entity"""
 
     __tablename__ = "water_qualities"
+    __table_args__ = (
+        UniqueConstraint("ocean_id", name="uq_water_qualities_ocean_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="수질 데이터 ID")
-    ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, index=True, comment="해양 ID")
+    ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, comment="해양 ID (해양당 최신 측정 1건)")
 
     # 용존산소
     dissolved_oxygen_value = Column(Float, comment="용존산소 농도 (mg/L)")
@@ -92,3 +105,27 @@ class WaterQuality(Base):
 
     def __repr__(self):
         return f"<WaterQuality(ocean_id={self.ocean_id}, measured_at={self.measured_at})>"
+
+
+class WaterQualityHistory(Base):
+    """수질 측정 이력 Entity (추가 전용)"""
+
+    __tablename__ = "water_quality_histories"
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="수질 측정 이력 ID")
+    ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, index=True, comment="해양 ID")
+    dissolved_oxygen_value = Column(Float, comment="용존산소 농도 (mg/L)")
+    dissolved_oxygen_status = Column(SQLEnum(WaterQualityStatus), comment="용존산소 상태")
+    ph_value = Column(Float, comment="pH 값")
+    ph_status = Column(SQLEnum(WaterQualityStatus), comment="pH 상태")
+    nitrogen_value = Column(Float, comment="질소 농도 (mg/L)")
+    nitrogen_status = Column(SQLEnum(WaterQualityStatus), comment="질소 상태")
+    phosphorus_value = Column(Float, comment="인 농도 (mg/L)")
+    phosphorus_status = Column(SQLEnum(WaterQualityStatus), comment="인 상태")
+    turbidity_value = Column(Float, comment="탁도 (NTU)")
+    turbidity_status = Column(SQLEnum(WaterQualityStatus), comment="탁도 상태")
+    price_change = Column(Integer, default=0, comment="이번 측정에 따른 가격 변동")
+    measured_at = Column(DateTime(timezone=True), server_default=func.now(), index=True, comment="측정 일시")
+
+    def __repr__(self):
+        return f"<WaterQualityHistory(ocean_id={self.ocean_id}, measured_at={self.measured_at})>"
@@ -0,0 +1,127 @@
+"""
+해양 위치 인덱스
+
+모든 해양 좌표를 프로세스 내 KD-Tree로 보관해 위치 기반 해양 조회를 DB 조회 없이 처리합니다.
+해양이 추가/삭제되거나 좌표가 바뀌면 flush 시점에 세션에 표시해 두었다가 커밋된 뒤에 무효화하고
+(롤백되면 표시만 지움), 다른 프로세스에서의 변경은 OCEAN_LOCATION_INDEX_TTL_SECONDS 주기로 반영됩니다.
+"""
+
+import threading
+import time
+from typing import List, Optional, Tuple
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from app.core.geo import GeoKDTree
+from app.domain.ocean.domain.entity import Ocean
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class OceanLocationIndex:
+    """
+    해양 좌표 공간 인덱스
+
+    처음 조회할 때(또는 무효화/만료 후) 해양 좌표만 읽어 KD-Tree를 만듭니다.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._tree: Optional[GeoKDTree] = None
+        self._ocean_ids: List[int] = []
+        self._built_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """인덱스를 무효화합니다. 다음 조회 시 다시 만듭니다."""
+        with self._lock:
+            self._generation += 1
+            self._tree = None
+
+    def _rebuild(self, db: Session) -> Tuple[GeoKDTree, List[int]]:
+        with self._lock:
+            generation = self._generation
+
+        rows = db.query(Ocean.ocean_id, Ocean.lat, Ocean.lon).order_by(Ocean.ocean_id).all()
+        ocean_ids = [row.ocean_id for row in rows]
+        tree = GeoKDTree([(row.lat, row.lon) for row in rows])
+
+        with self._lock:
+            # 만드는 동안 무효화되었다면 이번 조회에는 쓰되 저장하지 않아 다음 조회에서 다시 만든다
+            if generation == self._generation:
+                self._tree = tree
+                self._ocean_ids = ocean_ids
+                self._built_at = time.monotonic()
+
+        return tree, ocean_ids
+
+    def find_nearest_ocean_id(self, db: Session, lat: float, lon: float, max_distance: float) -> Optional[int]:
+        """
+        위치에서 가장 가까운 해양 ID를 조회합니다.
+
+        Args:
+            db: 인덱스를 다시 만들 때 사용할 데이터베이스 세션
+            lat: 위도
+            lon: 경도
+            max_distance: 최대 거리 (km)
+
+        Returns:
+            Optional[int]: 가장 가까운 해양 ID 또는 None
+        """
+        with self._lock:
+            tree = self._tree
+            ocean_ids = self._ocean_ids
+            expired = time.monotonic() - self._built_at >= self.ttl_seconds
+
+        if tree is None or expired:
+            tree, ocean_ids = self._rebuild(db)
+
+        nearest = tree.nearest(lat, lon, max_distance_km=max_distance)
+        if nearest is None:
+            return None
+        return ocean_ids[nearest[0]]
+
+
+# 싱글톤 인스턴스
+ocean_location_index = OceanLocationIndex(ttl_seconds=settings.OCEAN_LOCATION_INDEX_TTL_SECONDS)
+
+
+# 커밋 전에 무효화하면 다른 요청이 커밋되지 않은 좌표를 못 본 채 인덱스를 다시 만들 수 있으므로
+# flush 시점에는 세션에 표시만 하고 커밋된 뒤에 무효화한다
+_DIRTY_KEY = "ocean_location_index_dirty"
+
+
+def _mark_dirty(target) -> None:
+    session = object_session(target)
+    if session is None:
+        ocean_location_index.invalidate()
+        return
+    session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Ocean, "after_insert")
+@event.listens_for(Ocean, "after_delete")
+def _mark_dirty_on_ocean_change(mapper, connection, target) -> None:
+    _mark_dirty(target)
+
+
+@event.listens_for(Ocean, "after_update")
+def _mark_dirty_on_ocean_move(mapper, connection, target) -> None:
+    # 시세/쓰레기 수집 횟수 변경은 무시하고 좌표가 바뀐 경우에만 표시
+    state = inspect(target)
+    if state.attrs.lat.history.has_changes() or state.attrs.lon.history.has_changes():
+        _mark_dirty(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        ocean_location_index.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_dirty_after_rollback(session, previous_transaction) -> None:
+    # 최상위 트랜잭션이 롤백된 경우에만 변경이 사라진 것이므로 표시를 지운다
+    if previous_transaction.parent is None:
+        session.info.pop(_DIRTY_KEY, None)
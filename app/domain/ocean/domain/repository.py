@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict
-from app.domain.ocean.domain.entity import Ocean, WaterQuality, OceanPriceHistory
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import case, func, insert, select, update
+from typing import Any, Optional, List, Dict, Sequence, Tuple
+from app.domain.ocean.domain.entity import Ocean, WaterQuality, WaterQualityHistory, OceanPriceHistory
 from app.domain.article.domain.entity import Article
+from app.database import upsert
 
 
 class OceanRepository:
@@ -46,33 +49,122 @@ class OceanRepository:
         """
         return self.db.query(Ocean).filter(Ocean.ocean_id == ocean_id).first()
 
-    def add_price_history(self, ocean_id: int, price: int, limit: int = 10) -> None:
+    def add_price_history(self, ocean: Ocean, limit: int = 10) -> None:
         """
-        해양 시세 이력을 추가하고 최근 limit개만 유지합니다.
+        해양의 현재 시세를 시세 이력 링 버퍼에 기록합니다.
+
+        해양의 이력 순번을 1 증가시키고 (해양 ID, 순번 % limit) 슬롯을 덮어쓰므로
+        삭제 없이 쓰기 1회로 최근 limit개만 유지됩니다.
 
         Args:
-            ocean_id: 해양 ID
-            price: 시세 (1평당)
-            limit: 유지할 이력 개수
-        """
-        history = OceanPriceHistory(ocean_id=ocean_id, price=price)
-        self.db.add(history)
-        self.db.flush()
-
-        extra_ids = (
-            self.db.query(OceanPriceHistory.id)
-            .filter(OceanPriceHistory.ocean_id == ocean_id)
-            .order_by(
-                OceanPriceHistory.recorded_at.desc(),
-                OceanPriceHistory.id.desc()
-            )
-            .offset(limit)
-            .all()
+            ocean: 시세가 바뀐 해양 (이력 순번이 증가됨)
+            limit: 유지할 이력 개수 (슬롯 수)
+        """
+        self.add_price_histories([ocean], limit=limit)
+
+    def add_price_histories(self, oceans: List[Ocean], limit: int = 10) -> None:
+        """
+        여러 해양의 현재 시세를 시세 이력 링 버퍼에 한 번의 다중 행 upsert로 기록합니다.
+
+        이력 순번은 UPDATE 한 번으로 DB에서 원자적으로 증가시킨 뒤 다시 읽어 오므로
+        같은 해양을 동시에 기록해도 순번(슬롯)이 겹치지 않습니다.
+
+        Args:
+            oceans: 시세가 바뀐 해양 목록 (이력 순번이 증가됨)
+            limit: 유지할 이력 개수 (슬롯 수)
+        """
+        if not oceans:
+            return
+
+        oceans_by_id = {ocean.ocean_id: ocean for ocean in oceans}
+
+        # 순번 증가 (UPDATE가 행을 잠그므로 커밋 전까지 다른 트랜잭션이 같은 순번을 받지 않음)
+        self.db.execute(
+            update(Ocean)
+            .where(Ocean.ocean_id.in_(oceans_by_id))
+            .values(price_history_sequence=Ocean.price_history_sequence + 1)
+            .execution_options(synchronize_session=False)
+        )
+        sequences = self.db.execute(
+            select(Ocean.ocean_id, Ocean.price_history_sequence)
+            .where(Ocean.ocean_id.in_(oceans_by_id))
+        ).all()
+
+        values = []
+        for ocean_id, sequence in sequences:
+            ocean = oceans_by_id[ocean_id]
+            set_committed_value(ocean, "price_history_sequence", sequence)
+            values.append({
+                "ocean_id": ocean_id,
+                "slot": sequence % limit,
+                "sequence": sequence,
+                "price": ocean.current_price,
+                "recorded_at": func.now()
+            })
+
+        upsert(
+            self.db,
+            OceanPriceHistory,
+            index_elements=["ocean_id", "slot"],
+            update_columns=["sequence", "price", "recorded_at"],
+            values=values
+        )
+
+    def apply_garbage_price_changes(
+        self,
+        tiers: Sequence[Tuple[int, int]],
+        default_change: int,
+        min_price: int = 100,
+        history_limit: int = 10
+    ) -> int:
+        """
+        쓰레기 수집 횟수 구간별 가격 변동을 모든 해양에 일괄 적용합니다.
+
+        해양 수와 관계없이 INSERT ... SELECT 1회(시세 이력 슬롯 덮어쓰기)와 UPDATE 1회(시세)로 처리합니다.
+
+        Args:
+            tiers: (쓰레기 수집 횟수 하한(초과), 가격 변동량) 목록 - 앞에서부터 먼저 매칭
+            default_change: 어느 구간에도 해당하지 않을 때의 가격 변동량
+            min_price: 최소 가격
+            history_limit: 해양별로 유지할 시세 이력 개수
+
+        Returns:
+            int: 시세가 바뀐 해양 수
+        """
+        price_change = case(
+            *[(Ocean.garbage_collection_count > threshold, change) for threshold, change in tiers],
+            else_=default_change
+        )
+        changed_price = Ocean.current_price + price_change
+        new_price = case((changed_price < min_price, min_price), else_=changed_price)
+        is_changed = new_price != Ocean.current_price
+
+        next_sequence = Ocean.price_history_sequence + 1
+
+        # 시세가 바뀌는 해양의 새 시세를 이력 슬롯에 먼저 기록 (UPDATE 전의 current_price 기준으로 계산)
+        upsert(
+            self.db,
+            OceanPriceHistory,
+            index_elements=["ocean_id", "slot"],
+            update_columns=["sequence", "price", "recorded_at"],
+            select=select(
+                Ocean.ocean_id,
+                next_sequence % history_limit,
+                next_sequence,
+                new_price,
+                func.now()
+            ).where(is_changed),
+            select_columns=["ocean_id", "slot", "sequence", "price", "recorded_at"]
+        )
+
+        result = self.db.execute(
+            update(Ocean)
+            .where(is_changed)
+            .values(current_price=new_price, price_history_sequence=next_sequence)
+            .execution_options(synchronize_session=False)
         )
-        if extra_ids:
-            self.db.query(OceanPriceHistory).filter(
-                OceanPriceHistory.id.in_([row.id for row in extra_ids])
-            ).delete(synchronize_session=False)
+
+        return result.rowcount
 
     def find_recent_prices_by_ocean_ids(
         self,
@@ -92,22 +184,29 @@ class OceanRepository:
         if not ocean_ids:
             return {}
 
-        histories = (
-            self.db.query(OceanPriceHistory)
-            .filter(OceanPriceHistory.ocean_id.in_(ocean_ids))
-            .order_by(
+        # 해양별 최신 limit개만 DB에서 잘라 (해양 ID, 시세) 튜플로 조회 (MySQL 8 / SQLite 3.25+)
+        ranked = (
+            select(
                 OceanPriceHistory.ocean_id,
-                OceanPriceHistory.recorded_at.desc(),
-                OceanPriceHistory.id.desc()
+                OceanPriceHistory.price,
+                OceanPriceHistory.sequence,
+                func.row_number().over(
+                    partition_by=OceanPriceHistory.ocean_id,
+                    order_by=OceanPriceHistory.sequence.desc()
+                ).label("row_number")
             )
-            .all()
+            .where(OceanPriceHistory.ocean_id.in_(ocean_ids))
+            .subquery()
         )
+        rows = self.db.execute(
+            select(ranked.c.ocean_id, ranked.c.price)
+            .where(ranked.c.row_number <= limit)
+            .order_by(ranked.c.ocean_id, ranked.c.sequence.desc())
+        ).all()
 
         result: Dict[int, List[int]] = {ocean_id: [] for ocean_id in ocean_ids}
-        for history in histories:
-            prices = result.setdefault(history.ocean_id, [])
-            if len(prices) < limit:
-                prices.append(history.price)
+        for ocean_id, price in rows:
+            result.setdefault(ocean_id, []).append(price)
 
         return result
 
@@ -135,6 +234,59 @@ class WaterQualityRepository:
             .first()
         )
 
+    def find_price_changes_by_ocean_ids(self, ocean_ids: List[int]) -> Dict[int, int]:
+        """
+        해양별 수질 데이터의 누적 가격 변동을 한 번에 조회합니다.
+
+        Args:
+            ocean_ids: 해양 ID 목록
+
+        Returns:
+            Dict[int, int]: 해양 ID별 누적 가격 변동 (수질 데이터가 있는 해양만)
+        """
+        if not ocean_ids:
+            return {}
+
+        rows = self.db.execute(
+            select(WaterQuality.ocean_id, WaterQuality.price_change)
+            .where(WaterQuality.ocean_id.in_(ocean_ids))
+        ).all()
+
+        return {ocean_id: price_change or 0 for ocean_id, price_change in rows}
+
+    def upsert_all(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        수질 데이터를 해양 ID 고유 키 기준 다중 행 upsert로 저장합니다.
+
+        해양당 수질 데이터는 1건이므로 기존 행은 덮어쓰고 없으면 새로 삽입합니다.
+
+        Args:
+            rows: 수질 데이터 행 목록 (id 제외)
+        """
+        if not rows:
+            return
+
+        update_columns = [column for column in rows[0] if column != "ocean_id"]
+        upsert(
+            self.db,
+            WaterQuality,
+            index_elements=["ocean_id"],
+            update_columns=update_columns,
+            values=rows
+        )
+
+    def add_histories(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        수질 측정 이력을 다중 행 INSERT로 추가합니다.
+
+        Args:
+            rows: 수질 측정 이력 행 목록
+        """
+        if not rows:
+            return
+
+        self.db.execute(insert(WaterQualityHistory), rows)
+
 
 class ArticleRepository:
     """기사 Repository"""
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from app.domain.ocean_management.domain.repository import OceanManagementRepository
 from app.domain.ocean_management.domain.entity import BuildingType
 from app.config import get_settings
@@ -15,6 +17,38 @@ class OceanManagementService:
         self.db = db
         self.repository = OceanManagementRepository(db)
 
+    def settle_accrued_income(self, user_ids: Optional[List[str]] = None) -> None:
+        """
+        accrual 모드에서 미정산 건물 수익금을 크레딧에 반영합니다.
+
+        크레딧을 지출하기 직전에만 호출합니다. (조회는 정산하지 않고 미정산 수익금을 더해서 계산)
+        다른 지급 모드에서는 아무 작업도 하지 않습니다.
+
+        Args:
+            user_ids: 정산할 사용자 ID 목록 (None이면 전체 사용자)
+        """
+        if settings.INCOME_PAYOUT_MODE != "accrual":
+            return
+
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        self.repository.settle_building_income(now, user_ids=user_ids)
+        self.db.commit()
+
+    def settle_before_income_rate_change(self, user_id: str) -> None:
+        """
+        수익률 합계가 바뀌기 직전에 기존 수익률로 발생한 수익금을 정산합니다.
+
+        사용자 단위 정산(bulk/accrual) 모드에서만 동작하며, 커밋은 호출자가 수행합니다.
+
+        Args:
+            user_id: 사용자 ID
+        """
+        if settings.INCOME_PAYOUT_MODE == "per_building":
+            return
+
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        self.repository.settle_building_income(now, user_ids=[user_id])
+
     def get_my_oceans(self, user_id: str) -> List[Dict[str, Any]]:
         """
         사용자가 소유한 해양 목록과 건물 정보를 조회합니다.
@@ -34,6 +68,7 @@ class OceanManagementService:
                     "detail": "제주시",
                     "current_price": 1500,
                     "owned_square_meters": 50,
+                    "total_income_rate": 10,
                     "buildings": [
                         {
                             "building_id": 1,
@@ -69,6 +104,7 @@ class OceanManagementService:
                 "detail": ocean.detail,
                 "current_price": ocean.current_price,
                 "owned_square_meters": ownership.square_meters,
+                "total_income_rate": ownership.total_income_rate or 0,
                 "buildings": [
                     {
                         "building_id": building.id,
@@ -125,6 +161,7 @@ class OceanManagementService:
             )
 
         # 사용자 크레딧 확인
+        self.settle_accrued_income([user_id])
         user = self.repository.find_user_by_id(user_id)
         if not user:
             raise HTTPException(
@@ -150,6 +187,15 @@ class OceanManagementService:
         # 크레딧 차감
         self.repository.update_user_credits(user_id, user.credits - building_cost)
 
+        # 기존 수익률로 발생한 수익금 정산 후 수익률 합계 증가 (건물 생성과 같은 트랜잭션)
+        self.settle_before_income_rate_change(user_id)
+        self.repository.add_income_rate(
+            user_id=user_id,
+            ocean_id=ocean_id,
+            income_rate=income_rate,
+            now=datetime.now(ZoneInfo("Asia/Seoul"))
+        )
+
         # 건물 생성
         building = self.repository.create_building(
             ocean_id=ocean_id,
@@ -197,6 +243,7 @@ class OceanManagementService:
         total_cost = ocean.current_price * square_meters
 
         # 사용자 크레딧 확인 및 차감
+        self.settle_accrued_income([user_id])
         user = self.repository.find_user_by_id(user_id)
         if not user:
             raise HTTPException(
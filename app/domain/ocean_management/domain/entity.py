@@ -13,6 +13,7 @@ class OceanOwnership(Base):
     user_id = Column(String(50), ForeignKey("users.user_id"), nullable=False, index=True, comment="사용자 ID")
     ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, index=True, comment="해양 ID")
     square_meters = Column(Integer, nullable=False, comment="소유 평수")
+    total_income_rate = Column(Integer, default=0, nullable=False, comment="해당 해양 건물 초당 수익률 합계 (크레딧/초)")
     purchased_at = Column(DateTime(timezone=True), server_default=func.now(), comment="구매 일시")
 
     def __repr__(self):
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from sqlalchemy import and_
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import and_, case, func, or_, select, update
+from app.database import seconds_between
 from app.domain.ocean_management.domain.entity import OceanOwnership, Building, BuildingType
 from app.domain.ocean.domain.entity import Ocean
 from app.domain.auth.domain.entity import User
@@ -203,3 +205,154 @@ class OceanManagementRepository:
             self.db.commit()
             self.db.refresh(ownership)
         return ownership
+
+    def add_income_rate(self, user_id: str, ocean_id: int, income_rate: int, now: datetime) -> None:
+        """
+        사용자 및 해양 소유권의 수익률 합계를 증가시킵니다.
+
+        건물 생성과 같은 트랜잭션에서 호출해야 합니다. 커밋은 호출자가 수행합니다.
+
+        Args:
+            user_id: 사용자 ID
+            ocean_id: 해양 ID
+            income_rate: 증가시킬 초당 수익률
+            now: 정산 시작 시각 (수익률 합계가 0이던 사용자에게 기록)
+        """
+        # 수익률 합계가 0인 동안에는 쌓인 수익금이 없으므로 정산 시각을 지금으로 옮긴다
+        # (건물을 모두 잃은 뒤 다시 지으면 쉬던 기간이 새 수익률로 지급되지 않도록)
+        # MySQL은 SET을 왼쪽부터 적용하므로 수익률 합계를 바꾸기 전에 정산 시각을 먼저 계산
+        self.db.execute(
+            update(User)
+            .where(User.user_id == user_id)
+            .ordered_values(
+                (
+                    User.income_settled_at,
+                    case((User.total_income_rate == 0, now), else_=func.coalesce(User.income_settled_at, now))
+                ),
+                (User.total_income_rate, User.total_income_rate + income_rate)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(
+            update(OceanOwnership)
+            .where(
+                OceanOwnership.user_id == user_id,
+                OceanOwnership.ocean_id == ocean_id
+            )
+            .values(total_income_rate=OceanOwnership.total_income_rate + income_rate)
+            .execution_options(synchronize_session=False)
+        )
+
+    def rebuild_income_rate_rollups(self, now: datetime) -> None:
+        """
+        buildings 테이블을 기준으로 사용자/소유권별 수익률 합계를 다시 계산합니다.
+
+        서버 시작 시 집계값과 실제 건물 상태를 맞추기 위해 사용합니다.
+        수익률 합계가 0이던 사용자는 쌓인 수익금이 없으므로 정산 시각을 now로 옮깁니다.
+        커밋은 호출자가 수행합니다.
+
+        Args:
+            now: 정산 기준 시각 (KST)
+        """
+        user_rate = (
+            select(func.coalesce(func.sum(Building.income_rate), 0))
+            .where(Building.user_id == User.user_id)
+            .correlate(User)
+            .scalar_subquery()
+        )
+        # 정산 시각이 없는 사용자는 건물별 마지막 지급 시각부터 정산되므로 그대로 둔다
+        self.db.execute(
+            update(User)
+            .ordered_values(
+                (
+                    User.income_settled_at,
+                    case(
+                        (and_(User.total_income_rate == 0, User.income_settled_at.isnot(None)), now),
+                        else_=User.income_settled_at
+                    )
+                ),
+                (User.total_income_rate, user_rate)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        ownership_rate = (
+            select(func.coalesce(func.sum(Building.income_rate), 0))
+            .where(
+                Building.user_id == OceanOwnership.user_id,
+                Building.ocean_id == OceanOwnership.ocean_id
+            )
+            .correlate(OceanOwnership)
+            .scalar_subquery()
+        )
+        self.db.execute(
+            update(OceanOwnership)
+            .values(total_income_rate=ownership_rate)
+            .execution_options(synchronize_session=False)
+        )
+
+    def settle_building_income(
+        self, now: datetime, user_ids: Optional[List[str]] = None
+    ) -> Tuple[int, int]:
+        """
+        마지막 정산 이후 경과 시간만큼의 건물 수익금을 사용자별로 한 번에 정산합니다.
+
+        건물을 순회하지 않고 사용자별 수익률 합계(total_income_rate)를 사용합니다.
+        지급액(경과 초 * 수익률)은 UPDATE 안에서 행의 현재 정산 시각으로 계산하므로,
+        정산이 동시에 실행되어도 같은 구간이 두 번 지급되지 않습니다.
+        정산 시각이 없는 사용자(사용자 단위 정산 이전 데이터)는 건물별 마지막 지급 시각부터 계산합니다.
+        커밋은 호출자가 수행합니다.
+
+        Args:
+            now: 정산 기준 시각 (KST)
+            user_ids: 정산할 사용자 ID 목록 (None이면 전체 사용자)
+
+        Returns:
+            Tuple[int, int]: (지급된 총 크레딧, 지급받은 사용자 수)
+        """
+        # 건물별 마지막 지급 이후 수익금 (정산 시각이 없는 사용자용, 건물별 지급과 같은 계산)
+        pending_by_building = (
+            select(func.coalesce(func.sum(
+                seconds_between(self.db, Building.last_income_generated_at, now) * Building.income_rate
+            ), 0))
+            .where(
+                Building.user_id == User.user_id,
+                Building.last_income_generated_at.isnot(None)
+            )
+            .correlate(User)
+            .scalar_subquery()
+        )
+        income = case(
+            (User.income_settled_at.is_(None), pending_by_building),
+            else_=seconds_between(self.db, User.income_settled_at, now) * User.total_income_rate
+        )
+
+        # 1초 이상 경과한 사용자만 지급 대상
+        cutoff = now - timedelta(seconds=1)
+        conditions = [
+            User.total_income_rate > 0,
+            or_(User.income_settled_at.is_(None), User.income_settled_at <= cutoff)
+        ]
+        if user_ids is not None:
+            conditions.append(User.user_id.in_(user_ids))
+
+        # 지급 대상 행을 잠그고 지급액 집계 (MySQL/PostgreSQL에서는 동시 정산이 여기서 대기)
+        rows = self.db.execute(
+            select(User.user_id, income).where(*conditions).with_for_update()
+        ).all()
+        if not rows:
+            return 0, 0
+
+        # credits를 income_settled_at보다 먼저 갱신 (MySQL은 SET을 왼쪽부터 평가하므로 순서 고정)
+        self.db.execute(
+            update(User)
+            .where(*conditions)
+            .ordered_values(
+                (User.credits, User.credits + income),
+                (User.income_settled_at, now)
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        paid = [user_income for _, user_income in rows if user_income]
+        return sum(paid), len(paid)
@@ -43,6 +43,7 @@ def get_my_oceans(
                 "detail": "제주시",
                 "current_price": 1500,
                 "owned_square_meters": 50,
+                "total_income_rate": 10,
                 "buildings": [
                     {
                         "building_id": 1,
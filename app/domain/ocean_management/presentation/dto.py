@@ -28,6 +28,7 @@ class MyOceanResponse(BaseModel):
     detail: str = Field(..., description="구/군")
     current_price: int = Field(..., description="현재 가격 (1평당)")
     owned_square_meters: int = Field(..., description="소유 평수")
+    total_income_rate: int = Field(0, description="해당 해양 건물 초당 수익률 합계 (크레딧/초)")
     buildings: List[BuildingInfo] = Field(default_factory=list, description="건물 목록")
 
     class Config:
@@ -39,6 +40,7 @@ class MyOceanResponse(BaseModel):
                 "detail": "제주시",
                 "current_price": 1500,
                 "owned_square_meters": 50,
+                "total_income_rate": 10,
                 "buildings": [
                     {
                         "building_id": 1,
@@ -0,0 +1,36 @@
+"""
+경매 등록 이벤트
+
+경매 도메인이 백그라운드 계층에 의존하지 않도록, 경매가 등록되면 등록된 리스너에게 알립니다.
+경매 종료 스케줄러(app.background.auction_scheduler)가 리스너를 등록해 종료 시간을 예약합니다.
+"""
+
+from datetime import datetime
+from typing import Callable, List
+
+AuctionRegisteredListener = Callable[[int, datetime], None]
+
+_listeners: List[AuctionRegisteredListener] = []
+
+
+def add_auction_registered_listener(listener: AuctionRegisteredListener) -> None:
+    """
+    경매 등록 리스너를 추가합니다.
+
+    Args:
+        listener: (경매 ID, 종료 예정 시간)을 받는 함수 - API 스레드에서 호출되므로 스레드 안전해야 함
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def notify_auction_registered(auction_id: int, end_time: datetime) -> None:
+    """
+    경매 등록을 리스너에게 알립니다.
+
+    Args:
+        auction_id: 경매 ID
+        end_time: 경매 종료 예정 시간
+    """
+    for listener in _listeners:
+        listener(auction_id, end_time)
@@ -14,6 +14,8 @@ from app.domain.ocean_trade.domain.entity import (
 from app.domain.ocean.domain.entity import Ocean
 from app.domain.ocean_management.domain.entity import OceanOwnership
 from app.domain.auth.domain.repository import UserRepository
+from app.domain.ocean_management.application.service import OceanManagementService
+from app.domain.ocean_trade.application.auction_events import notify_auction_registered
 
 
 class OceanTradeService:
@@ -24,6 +26,7 @@ class OceanTradeService:
         self.repository = OceanTradeRepository(db)
         self.ocean_repository = OceanRepository(db)
         self.user_repository = UserRepository(db)
+        self.ocean_management_service = OceanManagementService(db)
 
     def get_purchasable_oceans(
         self,
@@ -84,6 +87,7 @@ class OceanTradeService:
             )
 
         # 사용자 크레딧 확인
+        self.ocean_management_service.settle_accrued_income([username])
         user = self.user_repository.find_by_username(username)
         if not user:
             raise HTTPException(
@@ -166,9 +170,11 @@ class OceanTradeService:
 
         # 소유권이 0이 되면 해당 해양의 건물 삭제
         if new_square_meters == 0:
+            self.ocean_management_service.settle_before_income_rate_change(seller_username)
             deleted_buildings = self.repository.delete_buildings_by_user_and_ocean(
                 seller_username, ocean_id
             )
+            self.db.commit()
             if deleted_buildings > 0:
                 print(f"🏚️  소유권 상실로 인해 {deleted_buildings}개 건물 삭제 (사용자: {seller_username}, 해양: {ocean_id})")
 
@@ -214,6 +220,9 @@ class OceanTradeService:
             end_time=end_time
         )
 
+        # 종료 시간에 맞춰 자동 종료되도록 등록 알림 (경매 종료 스케줄러가 예약)
+        notify_auction_registered(auction.id, auction.end_time)
+
         # 경매 등록 시 소유권 차감
         new_square_meters = ownership.square_meters - square_meters
         self.repository.update_ownership_square_meters(
@@ -222,9 +231,11 @@ class OceanTradeService:
 
         # 소유권이 0이 되면 해당 해양의 건물 삭제
         if new_square_meters == 0:
+            self.ocean_management_service.settle_before_income_rate_change(seller_username)
             deleted_buildings = self.repository.delete_buildings_by_user_and_ocean(
                 seller_username, ocean_id
             )
+            self.db.commit()
             if deleted_buildings > 0:
                 print(f"🏚️  소유권 상실로 인해 {deleted_buildings}개 건물 삭제 (사용자: {seller_username}, 해양: {ocean_id})")
 
@@ -257,6 +268,7 @@ class OceanTradeService:
             )
 
         # 사용자 크레딧 확인
+        self.ocean_management_service.settle_accrued_income([buyer_username])
         buyer = self.user_repository.find_by_username(buyer_username)
         if not buyer:
             raise HTTPException(
@@ -336,6 +348,7 @@ class OceanTradeService:
             )
 
         # 사용자 크레딧 확인
+        self.ocean_management_service.settle_accrued_income([bidder_username])
         bidder = self.user_repository.find_by_username(bidder_username)
         if not bidder or bidder.credits < bid_amount:
             raise HTTPException(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -41,6 +41,10 @@ class OceanAuction(Base):
     """해양 경매 Entity"""
 
     __tablename__ = "ocean_auctions"
+    __table_args__ = (
+        # 리더가 최근 등록된 활성 경매를 주기적으로 다시 확인할 때 사용
+        Index("ix_ocean_auctions_status_created_at", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="경매 ID")
     ocean_id = Column(Integer, ForeignKey("oceans.ocean_id"), nullable=False, index=True, comment="해양 ID")
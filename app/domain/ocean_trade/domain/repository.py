@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from app.domain.ocean_trade.domain.entity import OceanSale, OceanAuction, AuctionBid, SaleStatus, AuctionStatus
 from app.domain.ocean.domain.entity import Ocean
 from app.domain.ocean_management.domain.entity import OceanOwnership, Building
+from app.domain.auth.domain.entity import User
+from sqlalchemy import func, select, update
 
 
 class OceanTradeRepository:
@@ -46,6 +48,27 @@ class OceanTradeRepository:
             .first()
         )
 
+    def find_ownerships_by_users_and_oceans(
+        self, pairs: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], OceanOwnership]:
+        """(사용자 ID, 해양 ID) 목록의 소유권을 한 번에 조회합니다."""
+        if not pairs:
+            return {}
+        wanted = set(pairs)
+        ownerships = (
+            self.db.query(OceanOwnership)
+            .filter(
+                OceanOwnership.user_id.in_({user_id for user_id, _ in wanted}),
+                OceanOwnership.ocean_id.in_({ocean_id for _, ocean_id in wanted})
+            )
+            .all()
+        )
+        return {
+            (ownership.user_id, ownership.ocean_id): ownership
+            for ownership in ownerships
+            if (ownership.user_id, ownership.ocean_id) in wanted
+        }
+
     def create_ownership(
         self, user_id: str, ocean_id: int, square_meters: int
     ) -> OceanOwnership:
@@ -161,17 +184,67 @@ class OceanTradeRepository:
 
         return query.all()
 
-    def find_expired_auctions(self) -> List[OceanAuction]:
-        """종료 시간이 지난 활성 경매 목록을 조회합니다."""
+    def find_expired_auction_ids(self, auction_ids: Optional[List[int]] = None) -> List[int]:
+        """종료 시간이 지난 활성 경매 ID 목록을 조회합니다. auction_ids가 주어지면 해당 경매만 확인합니다."""
         now = datetime.now()
+        query = self.db.query(OceanAuction.id).filter(
+            OceanAuction.status == AuctionStatus.ACTIVE,
+            OceanAuction.end_time <= now
+        )
+        if auction_ids is not None:
+            query = query.filter(OceanAuction.id.in_(auction_ids))
+        return [row.id for row in query.order_by(OceanAuction.end_time, OceanAuction.id).all()]
+
+    def lock_active_auctions(self, auction_ids: List[int]) -> List[OceanAuction]:
+        """
+        활성 경매를 잠그고 조회합니다. (다른 트랜잭션이 잠근 경매는 건너뜀)
+
+        여러 프로세스가 동시에 종료 처리하더라도 같은 경매가 두 번 정산되지 않도록 합니다.
+        """
         return (
             self.db.query(OceanAuction)
             .filter(
-                OceanAuction.status == AuctionStatus.ACTIVE,
-                OceanAuction.end_time <= now
+                OceanAuction.id.in_(auction_ids),
+                OceanAuction.status == AuctionStatus.ACTIVE
             )
+            .order_by(OceanAuction.id)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def find_active_auction_end_times(
+        self,
+        after_id: int = 0,
+        recent_seconds: Optional[int] = None
+    ) -> List[Tuple[int, datetime]]:
+        """
+        활성 경매의 (경매 ID, 종료 예정 시간) 목록을 조회합니다.
+
+        after_id보다 큰 ID와 함께, recent_seconds가 주어지면 최근 recent_seconds초 안에 등록된 경매도 조회합니다.
+        (ID는 먼저 받았지만 늦게 커밋된 경매가 ID 기준선에 가려 빠지지 않도록)
+        두 조건은 각각 기본 키와 (status, created_at) 인덱스를 타도록 따로 조회합니다.
+        """
+        rows = (
+            self.db.query(OceanAuction.id, OceanAuction.end_time)
+            .filter(OceanAuction.id > after_id, OceanAuction.status == AuctionStatus.ACTIVE)
             .all()
         )
+        end_times = {row.id: row.end_time for row in rows}
+
+        if recent_seconds is not None:
+            # created_at은 DB 시각으로 기록되므로 기준 시각도 DB에서 받아 값으로 비교
+            db_now = self.db.execute(select(func.now())).scalar()
+            recent_rows = (
+                self.db.query(OceanAuction.id, OceanAuction.end_time)
+                .filter(
+                    OceanAuction.status == AuctionStatus.ACTIVE,
+                    OceanAuction.created_at >= db_now - timedelta(seconds=recent_seconds)
+                )
+                .all()
+            )
+            end_times.update((row.id, row.end_time) for row in recent_rows)
+
+        return list(end_times.items())
 
     def update_auction_current_price(
         self, auction: OceanAuction, current_price: int
@@ -208,6 +281,36 @@ class OceanTradeRepository:
         self.db.refresh(bid)
         return bid
 
+    def find_winning_bids(self, auction_ids: List[int]) -> Dict[int, Tuple[str, int]]:
+        """
+        여러 경매의 최고 입찰을 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            Dict[int, Tuple[str, int]]: 경매 ID별 (입찰자 ID, 입찰 금액) - 입찰이 없는 경매는 제외
+        """
+        if not auction_ids:
+            return {}
+
+        ranked = (
+            select(
+                AuctionBid.auction_id,
+                AuctionBid.bidder_id,
+                AuctionBid.bid_amount,
+                func.row_number().over(
+                    partition_by=AuctionBid.auction_id,
+                    order_by=(AuctionBid.bid_amount.desc(), AuctionBid.id)
+                ).label("row_number")
+            )
+            .where(AuctionBid.auction_id.in_(auction_ids))
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(ranked.c.auction_id, ranked.c.bidder_id, ranked.c.bid_amount)
+            .where(ranked.c.row_number == 1)
+        ).all()
+
+        return {auction_id: (bidder_id, bid_amount) for auction_id, bidder_id, bid_amount in rows}
+
     def find_highest_bid(self, auction_id: int) -> Optional[AuctionBid]:
         """경매의 최고 입찰을 조회합니다."""
         return (
@@ -219,10 +322,32 @@ class OceanTradeRepository:
 
     # Building 관리
     def delete_buildings_by_user_and_ocean(self, user_id: str, ocean_id: int) -> int:
-        """특정 사용자가 특정 해양에 소유한 모든 건물을 삭제합니다."""
+        """
+        특정 사용자가 특정 해양에 소유한 모든 건물을 삭제합니다.
+
+        삭제된 건물의 수익률만큼 사용자/소유권 수익률 합계도 같은 트랜잭션에서 차감합니다.
+        """
+        removed_rate = (
+            self.db.query(func.coalesce(func.sum(Building.income_rate), 0))
+            .filter(Building.user_id == user_id, Building.ocean_id == ocean_id)
+            .scalar()
+        )
         deleted_count = (
             self.db.query(Building)
             .filter(Building.user_id == user_id, Building.ocean_id == ocean_id)
             .delete(synchronize_session=False)
         )
+        if removed_rate:
+            self.db.execute(
+                update(User)
+                .where(User.user_id == user_id)
+                .values(total_income_rate=User.total_income_rate - removed_rate)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.execute(
+                update(OceanOwnership)
+                .where(OceanOwnership.user_id == user_id, OceanOwnership.ocean_id == ocean_id)
+                .values(total_income_rate=0)
+                .execution_options(synchronize_session=False)
+            )
         return deleted_count
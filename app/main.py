@@ -1,18 +1,15 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.config import get_settings
 from app.database import init_db
 from app.core.exception.handler import add_exception_handlers
-from app.background.tasks import (
-    fetch_and_update_articles,
-    update_ocean_prices_by_garbage,
-    generate_building_income,
-    fetch_and_update_ocean_data,
-    finalize_expired_auctions
-)
+from app.core.http import close_http_client, start_http_client
+from app.background.scheduler import start_background_jobs, stop_background_jobs
+from app.background.controller import router as background_router
+from app.background.warmup import warmup_state
 
 # 도메인별 라우터 import
 from app.domain.auth.presentation.controller import router as auth_router
@@ -23,7 +20,6 @@ from app.domain.mission.presentation.controller import router as mission_router
 from app.domain.article.presentation.controller import router as article_router
 
 settings = get_settings()
-scheduler = AsyncIOScheduler()
 
 
 @asynccontextmanager
@@ -31,98 +27,28 @@ async def lifespan(app: FastAPI):
     """
     애플리케이션 라이프사이클 관리
 
-    시작 시: 데이터베이스 초기화 및 백그라운드 작업 시작
-    종료 시: 스케줄러 종료
+    시작 시: 데이터베이스 초기화, 공용 HTTP 클라이언트 생성 및 백그라운드 작업 시작
+    (STARTUP_WARMUP_MODE가 background이면 초기 작업을 기다리지 않고 바로 요청을 받음)
+    종료 시: 스케줄러 종료 및 공용 HTTP 클라이언트 종료
+
+    RUN_BACKGROUND_JOBS가 false이면 API만 실행하며, 백그라운드 작업은
+    전용 워커(python -m app.background.worker)에서 실행합니다.
     """
     # 시작 시 실행
     init_db()
+    start_http_client()
 
-    # 서버 시작 시 백그라운드 작업 즉시 한 번 실행
-    print("🚀 서버 시작 시 백그라운드 작업 초기 실행 중...")
-
-    try:
-        await fetch_and_update_articles()
-        print("✅ 기사 수집 완료")
-    except Exception as e:
-        print(f"⚠️  기사 수집 오류: {e}")
-
-    try:
-        await update_ocean_prices_by_garbage()
-        print("✅ 쓰레기 수집 기반 시세 업데이트 완료")
-    except Exception as e:
-        print(f"⚠️  쓰레기 수집 기반 시세 업데이트 오류: {e}")
-
-    try:
-        await fetch_and_update_ocean_data()
-        print("✅ 해양 관측소 데이터 수집 완료")
-    except Exception as e:
-        print(f"⚠️  해양 관측소 데이터 수집 오류: {e}")
-
-    # 미션 자동 생성 (5개 유지)
-    try:
-        from app.database import SessionLocal
-        from app.domain.mission.application.service import MissionService
-
-        db = SessionLocal()
-        try:
-            mission_service = MissionService(db)
-            await mission_service.check_and_generate_missions()
-        finally:
-            db.close()
-    except Exception as e:
-        print(f"⚠️  미션 자동 생성 오류: {e}")
-
-    # generate_building_income은 매 초마다 실행되므로 초기 실행 생략
-    print("✅ 초기 백그라운드 작업 완료\n")
-
-    # 백그라운드 작업 스케줄링
-    # 1. 주기적으로 기사 수집 및 시세 업데이트 (1시간마다)
-    scheduler.add_job(
-        fetch_and_update_articles,
-        'interval',
-        minutes=settings.ARTICLE_FETCH_INTERVAL_MINUTES,
-        id='fetch_articles'
-    )
-
-    # 2. 쓰레기 수집 횟수에 따른 시세 업데이트 (10분마다)
-    scheduler.add_job(
-        update_ocean_prices_by_garbage,
-        'interval',
-        minutes=settings.PRICE_UPDATE_INTERVAL_MINUTES,
-        id='update_prices_by_garbage'
-    )
-
-    # 3. 빌딩/음식점 수익금 지급 (1초마다)
-    scheduler.add_job(
-        generate_building_income,
-        'interval',
-        seconds=settings.INCOME_GENERATION_INTERVAL_SECONDS,
-        id='generate_building_income'
-    )
-
-    # 4. 해양 관측소 데이터 수집 및 시세 업데이트 (30분마다)
-    scheduler.add_job(
-        fetch_and_update_ocean_data,
-        'interval',
-        minutes=settings.OCEAN_DATA_FETCH_INTERVAL_MINUTES,
-        id='fetch_ocean_data'
-    )
-
-    # 5. 경매 자동 종료 (1분마다)
-    scheduler.add_job(
-        finalize_expired_auctions,
-        'interval',
-        minutes=1,
-        id='finalize_expired_auctions'
-    )
-
-    scheduler.start()
-    print("📅 백그라운드 작업 스케줄러 시작됨\n")
+    if settings.RUN_BACKGROUND_JOBS:
+        await start_background_jobs()
+    else:
+        print("ℹ️  API 전용 모드: 백그라운드 작업은 워커 프로세스에서 실행됩니다.\n")
 
     yield
 
     # 종료 시 실행
-    scheduler.shutdown()
+    if settings.RUN_BACKGROUND_JOBS:
+        await stop_background_jobs()
+    await close_http_client()
 
 
 # FastAPI 애플리케이션 생성
@@ -152,6 +78,7 @@ app.include_router(ocean_management_router, prefix="/api", tags=["해양 관리"
 app.include_router(ocean_trade_router, prefix="/api", tags=["해양 거래"])
 app.include_router(mission_router, prefix="/api", tags=["미션"])
 app.include_router(article_router, prefix="/api", tags=["기사"])
+app.include_router(background_router, tags=["내부"])
 
 
 @app.get("/")
@@ -168,3 +95,18 @@ async def root():
 async def health_check():
     """헬스 체크 엔드포인트"""
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    준비 상태 확인 엔드포인트
+
+    서버 시작 시 초기 작업(기사/시세/관측소 데이터 수집, 미션 생성)이 끝나기 전에는 503을 반환합니다.
+    초기 작업을 실행하지 않는 프로세스(API 전용 모드, 리더가 아닌 워커)는 바로 준비 상태입니다.
+    """
+    snapshot = warmup_state.snapshot()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if snapshot["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=snapshot
+    )
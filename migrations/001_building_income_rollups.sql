@@ -0,0 +1,42 @@
+-- 건물 수익률 집계 컬럼 추가 및 사용자 단위 정산 시각 백필 (MySQL)
+--
+-- 기존 데이터베이스에 적용합니다. (새 데이터베이스는 서버 시작 시 create_all로 생성됨)
+-- 기존 서버의 수익금 지급 작업이 멈춘 상태(배포 중)에서 한 번 실행합니다.
+
+SET time_zone = '+09:00';  -- 애플리케이션과 같은 KST 기준
+
+ALTER TABLE users
+    ADD COLUMN total_income_rate INT NOT NULL DEFAULT 0 COMMENT '보유 건물 전체 초당 수익률 합계 (크레딧/초)' AFTER credits,
+    ADD COLUMN income_settled_at DATETIME NULL COMMENT '마지막 수익금 정산 일시' AFTER total_income_rate;
+
+ALTER TABLE ocean_ownerships
+    ADD COLUMN total_income_rate INT NOT NULL DEFAULT 0 COMMENT '해당 해양 건물 초당 수익률 합계 (크레딧/초)' AFTER square_meters;
+
+-- 수익률 합계를 buildings 기준으로 채움
+UPDATE users u
+SET u.total_income_rate = (
+    SELECT COALESCE(SUM(b.income_rate), 0) FROM buildings b WHERE b.user_id = u.user_id
+);
+
+UPDATE ocean_ownerships o
+SET o.total_income_rate = (
+    SELECT COALESCE(SUM(b.income_rate), 0)
+    FROM buildings b
+    WHERE b.user_id = o.user_id AND b.ocean_id = o.ocean_id
+);
+
+-- 건물별 마지막 지급 이후 발생한 수익금을 지급하고 그 시점을 정산 시각으로 기록
+-- (정산 시각을 단순히 지금으로 초기화하면 마지막 지급 ~ 배포 사이의 수익금이 사라짐)
+UPDATE users u
+JOIN (
+    SELECT
+        b.user_id,
+        SUM(TIMESTAMPDIFF(SECOND, b.last_income_generated_at, NOW()) * b.income_rate) AS pending_income
+    FROM buildings b
+    WHERE b.last_income_generated_at IS NOT NULL
+    GROUP BY b.user_id
+) pending ON pending.user_id = u.user_id
+SET
+    u.credits = u.credits + pending.pending_income,
+    u.income_settled_at = NOW()
+WHERE u.income_settled_at IS NULL;
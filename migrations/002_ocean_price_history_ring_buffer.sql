@@ -0,0 +1,45 @@
+-- 시세 이력 링 버퍼 컬럼/유니크 키 추가 및 기존 이력 순번 백필 (MySQL 8.0+)
+--
+-- 기존 데이터베이스에 적용합니다. (새 데이터베이스는 서버 시작 시 create_all로 생성됨)
+-- 시세 갱신 작업이 멈춘 상태(배포 중)에서 한 번 실행합니다.
+-- 해양별 유지 개수(슬롯 수)는 애플리케이션 기본값인 10입니다.
+
+ALTER TABLE oceans
+    ADD COLUMN price_history_sequence INT NOT NULL DEFAULT 0 COMMENT '마지막 시세 이력 순번' AFTER current_price;
+
+ALTER TABLE ocean_price_histories
+    ADD COLUMN slot INT NULL COMMENT '링 버퍼 슬롯 (0 ~ 유지 개수-1)' AFTER ocean_id,
+    ADD COLUMN sequence INT NULL COMMENT '시세 이력 순번 (클수록 최신)' AFTER slot;
+
+-- 해양별로 오래된 이력부터 1, 2, 3, ... 순번 부여
+UPDATE ocean_price_histories h
+JOIN (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (PARTITION BY ocean_id ORDER BY recorded_at, id) AS sequence
+    FROM ocean_price_histories
+) numbered ON numbered.id = h.id
+SET h.sequence = numbered.sequence;
+
+-- 해양별 최근 10개만 남김 (같은 슬롯을 쓰는 오래된 이력 제거)
+DELETE h
+FROM ocean_price_histories h
+JOIN (
+    SELECT ocean_id, MAX(sequence) AS max_sequence
+    FROM ocean_price_histories
+    GROUP BY ocean_id
+) latest ON latest.ocean_id = h.ocean_id
+WHERE h.sequence <= latest.max_sequence - 10;
+
+UPDATE ocean_price_histories SET slot = sequence % 10;
+
+ALTER TABLE ocean_price_histories
+    MODIFY COLUMN slot INT NOT NULL COMMENT '링 버퍼 슬롯 (0 ~ 유지 개수-1)',
+    MODIFY COLUMN sequence INT NOT NULL COMMENT '시세 이력 순번 (클수록 최신)',
+    ADD CONSTRAINT uq_ocean_price_histories_ocean_slot UNIQUE (ocean_id, slot);
+
+-- 다음 기록이 마지막 순번 다음 슬롯에 쓰이도록 해양별 순번을 맞춤
+UPDATE oceans o
+SET o.price_history_sequence = (
+    SELECT COALESCE(MAX(h.sequence), 0) FROM ocean_price_histories h WHERE h.ocean_id = o.ocean_id
+);
@@ -0,0 +1,20 @@
+-- 수질 데이터 해양별 1건 유니크 키 추가 (MySQL 8.0+)
+--
+-- 기존 데이터베이스에 적용합니다. (새 데이터베이스는 서버 시작 시 create_all로 생성됨)
+-- 해양 관측소 데이터 작업이 멈춘 상태(배포 중)에서 한 번 실행합니다.
+-- 수질 데이터는 해양 ID 기준으로 덮어쓰므로 해양당 최신 1건만 남기고 유니크 키를 추가합니다.
+-- (지난 측정값은 water_quality_histories에 보관됨)
+
+-- 해양별 최신 측정(같은 시각이면 큰 ID) 1건만 남김
+DELETE w
+FROM water_qualities w
+JOIN (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (PARTITION BY ocean_id ORDER BY measured_at DESC, id DESC) AS row_number_in_ocean
+    FROM water_qualities
+) ranked ON ranked.id = w.id
+WHERE ranked.row_number_in_ocean > 1;
+
+ALTER TABLE water_qualities
+    ADD CONSTRAINT uq_water_qualities_ocean_id UNIQUE (ocean_id);
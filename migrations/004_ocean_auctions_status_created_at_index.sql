@@ -0,0 +1,6 @@
+-- 최근 등록된 활성 경매 재조회용 인덱스 추가 (MySQL)
+--
+-- 기존 데이터베이스에 적용합니다. (새 데이터베이스는 서버 시작 시 create_all로 생성됨)
+-- 리더가 AUCTION_RELOAD_INTERVAL_SECONDS마다 status = 'ACTIVE' AND created_at >= ? 로 조회합니다.
+
+CREATE INDEX ix_ocean_auctions_status_created_at ON ocean_auctions (status, created_at);
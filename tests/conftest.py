@@ -2,6 +2,18 @@
 Pytest 설정 및 공통 픽스처
 """
 
+import os
+import tempfile
+
+# 앱 설정 로드 전에 테스트용 환경 변수 지정 (.env가 없어도 실행되도록)
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'searim-test.db')}")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("NEWS_API_KEY", "test")
+os.environ.setdefault("NEWS_API_URL", "http://news.test/v2/everything")
+os.environ.setdefault("OCEAN_DATA_API_KEY", "test")
+os.environ.setdefault("OCEAN_DATA_API_URL", "http://ocean.test/api")
+os.environ.setdefault("RUN_BACKGROUND_JOBS", "false")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -12,7 +24,7 @@ from app.main import app
 from app.database import Base, get_db
 from app.domain.auth.domain.entity import User
 from app.domain.ocean.domain.entity import Ocean
-from app.global.security.password import hash_password
+from app.core.security.password import hash_password
 
 # 테스트용 인메모리 데이터베이스
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -49,6 +61,14 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def session_factory(db_session, monkeypatch):
+    """백그라운드 작업이 테스트 데이터베이스를 사용하도록 SessionLocal 교체"""
+    from app.background import tasks
+    monkeypatch.setattr(tasks, "SessionLocal", TestingSessionLocal)
+    return TestingSessionLocal
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """테스트 클라이언트"""
@@ -42,3 +42,292 @@ class TestArticle:
         assert data["oceans"][0]["ocean_id"] == test_ocean.ocean_id
         assert len(data["oceans"][0]["articles"]) == 1
         assert data["oceans"][0]["articles"][0]["title"] == "테스트 기사"
+
+
+class TestBatchSentiment:
+    """기사 감성 일괄 분석 헬퍼 테스트"""
+
+    def test_parse_skips_invalid_entries(self):
+        """코드 블록을 벗기고 잘못된 항목은 None으로 남기는지 테스트"""
+        from app.core.ai.sentiment_batch import parse_batch_sentiment_response
+
+        text = """```json
+        {"results": [
+            {"index": 0, "sentiment": "Positive"},
+            {"index": 2, "sentiment": "unknown"},
+            {"index": 5, "sentiment": "negative"},
+            "oops"
+        ]}
+        ```"""
+
+        assert parse_batch_sentiment_response(text, 3) == ["positive", None, None]
+
+    def test_missing_results_are_analyzed_concurrently(self):
+        """누락된 항목의 개별 분석이 동시에 실행되는지 테스트"""
+        import asyncio
+        from app.core.ai.sentiment_batch import fill_missing_sentiments
+
+        items = [("바다", f"제목{i}", "내용") for i in range(3)]
+        running = 0
+        max_running = 0
+
+        async def analyze_one(ocean_name, title, content):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "negative"
+
+        results = asyncio.run(fill_missing_sentiments([None, "positive", None], items, analyze_one))
+
+        assert results == ["negative", "positive", "negative"]
+        assert max_running == 2
+
+
+class TestSentimentCache:
+    """기사 감성 분석 캐시 테스트"""
+
+    def test_lru_entry_keeps_db_cached_at(self):
+        """DB 캐시에서 가져온 항목이 원래 저장 시각 기준으로 만료되는지 테스트"""
+        from datetime import datetime, timedelta
+        from app.domain.article.application.sentiment_cache import SentimentLRUCache
+
+        cache = SentimentLRUCache(max_entries=10, ttl_seconds=3600)
+        cache.put_many(
+            {"old": "positive", "fresh": "negative"},
+            cached_at={
+                "old": datetime.now() - timedelta(hours=2),
+                "fresh": datetime.now() - timedelta(minutes=10)
+            }
+        )
+
+        assert cache.get_many(["old", "fresh"]) == {"fresh": "negative"}
+
+
+def _match_sequentially(oceans, text):
+    """기존 순차 매칭: 해양 순서, 키워드 순서대로 처음 포함되는 키워드를 반환"""
+    from app.domain.article.application.ocean_matcher import build_ocean_keywords
+
+    for ocean_id, ocean_name in oceans:
+        for keyword in build_ocean_keywords(ocean_name):
+            if keyword in text:
+                return ocean_id, ocean_name, keyword
+    return None
+
+
+class TestOceanKeywordMatcher:
+    """Aho-Corasick 해양 키워드 매칭기 테스트"""
+
+    OCEANS = [
+        (1, "부산 해운대 앞바다"),
+        (2, "해운대"),
+        (3, "제주 서귀포 해역"),
+        (4, "서귀포"),
+        (5, "울산 앞바다"),
+    ]
+
+    def test_prefers_earlier_ocean_and_keyword(self):
+        """여러 해양이 매칭되면 순차 매칭과 같은 우선순위를 따르는지 테스트"""
+        from app.domain.article.application.ocean_matcher import OceanKeywordMatcher
+
+        matcher = OceanKeywordMatcher(self.OCEANS)
+
+        assert matcher.match("서귀포와 해운대에 피서객") == (1, "부산 해운대 앞바다", "해운대")
+        assert matcher.match("제주 서귀포 바다 수질 개선") == (3, "제주 서귀포 해역", "제주 서귀포")
+        assert matcher.match("울산 앞바다 적조") == (5, "울산 앞바다", "울산 앞바다")
+        assert matcher.match("동해 소식") is None
+
+    def test_matches_sequential_behaviour(self):
+        """무작위 텍스트에서 기존 순차 매칭과 결과가 같은지 테스트"""
+        import random
+        from app.domain.article.application.ocean_matcher import OceanKeywordMatcher
+
+        matcher = OceanKeywordMatcher(self.OCEANS)
+        fragments = ["부산", " ", "해운", "대", "제주", "서귀", "포", "울산", "앞바다", "해역", "뉴스"]
+        rng = random.Random(42)
+
+        for _ in range(500):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+            assert matcher.match(text) == _match_sequentially(self.OCEANS, text), text
+
+
+class TestArticleUrlFilter:
+    """저장된 기사 URL 필터 테스트"""
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """추가한 항목은 항상 포함으로 판단하고 오탐률이 목표 근처인지 테스트"""
+        from app.domain.article.application.url_filter import BloomFilter
+
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+        added = [f"https://example.com/news/{i}" for i in range(1000)]
+        for url in added:
+            bloom_filter.add(url)
+
+        assert all(url in bloom_filter for url in added)
+        false_positives = sum(f"https://example.com/other/{i}" in bloom_filter for i in range(10000))
+        assert false_positives < 300
+
+    def test_find_existing_matches_database(self, test_ocean, db_session):
+        """필터를 거친 결과가 DB에 저장된 URL과 같고 새로 저장한 URL도 찾는지 테스트"""
+        from app.domain.article.application.url_filter import KnownArticleUrls
+        from app.domain.article.domain.entity import Article, ArticleSentiment
+
+        for i in range(3):
+            db_session.add(Article(
+                ocean_id=test_ocean.ocean_id,
+                ocean_name=test_ocean.ocean_name,
+                title=f"기사 {i}",
+                url=f"https://example.com/article/{i}",
+                sentiment=ArticleSentiment.NEUTRAL,
+                price_change=0
+            ))
+        db_session.commit()
+
+        known_urls = KnownArticleUrls(capacity=16, error_rate=0.01)
+        urls = [f"https://example.com/article/{i}" for i in range(6)]
+
+        assert known_urls.find_existing(db_session, urls) == set(urls[:3])
+
+        db_session.add(Article(
+            ocean_id=test_ocean.ocean_id,
+            ocean_name=test_ocean.ocean_name,
+            title="기사 3",
+            url=urls[3],
+            sentiment=ArticleSentiment.NEUTRAL,
+            price_change=0
+        ))
+        db_session.commit()
+        known_urls.add_many([urls[3]])
+
+        assert known_urls.find_existing(db_session, urls) == set(urls[:4])
+
+
+class TestNewsFetch:
+    """뉴스 증분 수집 테스트"""
+
+    def _fake_pages(self, monkeypatch, total_results, first_page_from_cache=False, requested_ttls=None):
+        import asyncio
+        import json
+        from app.background import tasks
+        from app.core.http import CachedResponse
+
+        async def fake_fetch_news_page(page, since, ttl_seconds):
+            if requested_ttls is not None:
+                requested_ttls[page] = ttl_seconds
+            content = json.dumps({
+                "totalResults": total_results,
+                "articles": [{"url": f"https://example.com/{page}", "publishedAt": "2026-01-01T00:00:00Z"}]
+            }).encode("utf-8")
+            return CachedResponse(200, content, from_cache=page == 1 and first_page_from_cache)
+
+        monkeypatch.setattr(tasks, "_fetch_news_page", fake_fetch_news_page)
+        return asyncio.run(tasks._fetch_news_since(None))
+
+    def test_complete_when_all_pages_fetched(self, monkeypatch):
+        """필요한 페이지를 모두 받으면 완료로 판단하는지 테스트"""
+        from app.background.tasks import settings
+
+        articles, complete = self._fake_pages(monkeypatch, settings.NEWS_FETCH_PAGE_SIZE * 2)
+
+        assert len(articles) == 2
+        assert complete is True
+
+    def test_incomplete_when_truncated_at_max_pages(self, monkeypatch):
+        """최대 페이지 수에서 잘리면 워터마크를 옮기지 않도록 미완료로 판단하는지 테스트"""
+        from app.background.tasks import settings
+
+        total_results = settings.NEWS_FETCH_PAGE_SIZE * (settings.NEWS_FETCH_MAX_PAGES + 1)
+        articles, complete = self._fake_pages(monkeypatch, total_results)
+
+        assert len(articles) == settings.NEWS_FETCH_MAX_PAGES
+        assert complete is False
+
+    def test_later_pages_skip_ttl_when_first_page_was_fetched(self, monkeypatch):
+        """첫 페이지를 새로 받았으면 나머지 페이지도 TTL 없이 새로 요청하는지 테스트"""
+        from app.background.tasks import settings
+
+        requested_ttls = {}
+        self._fake_pages(monkeypatch, settings.NEWS_FETCH_PAGE_SIZE * 3, requested_ttls=requested_ttls)
+
+        assert requested_ttls == {1: settings.NEWS_API_CACHE_TTL_SECONDS, 2: 0, 3: 0}
+
+    def test_later_pages_use_ttl_when_first_page_was_cached(self, monkeypatch):
+        """첫 페이지가 캐시에서 왔으면 나머지 페이지도 같은 TTL로 캐시를 사용하는지 테스트"""
+        from app.background.tasks import settings
+
+        requested_ttls = {}
+        self._fake_pages(
+            monkeypatch,
+            settings.NEWS_FETCH_PAGE_SIZE * 3,
+            first_page_from_cache=True,
+            requested_ttls=requested_ttls
+        )
+
+        ttl = settings.NEWS_API_CACHE_TTL_SECONDS
+        assert requested_ttls == {1: ttl, 2: ttl, 3: ttl}
+
+
+class TestArticleUrlFilterFailover:
+    """리더 교체 후 기사 URL 필터 테스트"""
+
+    @staticmethod
+    def _add_article(db_session, ocean, url):
+        from app.domain.article.domain.entity import Article, ArticleSentiment
+
+        db_session.add(Article(
+            ocean_id=ocean.ocean_id,
+            ocean_name=ocean.ocean_name,
+            title="다른 프로세스가 저장한 기사",
+            url=url,
+            sentiment=ArticleSentiment.NEUTRAL,
+            price_change=0
+        ))
+        db_session.commit()
+
+    def test_invalidate_reloads_urls_saved_elsewhere(self, test_ocean, db_session):
+        """무효화하면 다른 프로세스가 저장한 URL도 다시 찾는지 테스트"""
+        from app.domain.article.application.url_filter import KnownArticleUrls
+
+        known_urls = KnownArticleUrls(capacity=1000, error_rate=0.0001)
+        url = "https://example.com/article/elsewhere"
+        assert known_urls.find_existing(db_session, [url]) == set()
+
+        self._add_article(db_session, test_ocean, url)
+        known_urls.invalidate()
+
+        assert known_urls.find_existing(db_session, [url]) == {url}
+
+    def test_save_skips_already_saved_urls(self, test_ocean, db_session, session_factory):
+        """이미 저장된 URL이 섞여 있어도 나머지 기사와 워터마크는 저장되는지 테스트"""
+        from datetime import datetime
+        from app.background import tasks
+        from app.domain.article.domain.entity import Article
+        from app.domain.article.domain.repository import NewsFetchWatermarkRepository
+
+        duplicate_url = "https://example.com/article/duplicate"
+        self._add_article(db_session, test_ocean, duplicate_url)
+
+        matched_articles = [
+            {
+                "ocean_id": test_ocean.ocean_id,
+                "ocean_name": test_ocean.ocean_name,
+                "title": f"기사 {url}",
+                "content": "",
+                "url": url,
+                "image_url": None,
+                "cache_key": url,
+                "sentiment": "positive"
+            }
+            for url in (duplicate_url, "https://example.com/article/new")
+        ]
+        watermark = datetime(2026, 1, 1, 9, 0)
+
+        tasks._save_analyzed_articles(matched_articles, watermark)
+
+        db_session.expire_all()
+        assert sorted(url for url, in db_session.query(Article.url)) == [
+            duplicate_url,
+            "https://example.com/article/new"
+        ]
+        assert NewsFetchWatermarkRepository(db_session).find_last_published_at(tasks.NEWS_QUERY_HASH) == watermark
@@ -77,3 +77,32 @@ class TestAuth:
         )
 
         assert response.status_code == 404
+
+
+class TestAccruedCredits:
+    """accrual 모드 미정산 수익금 조회 테스트"""
+
+    def test_ranking_includes_accrued_income_without_settling(self, db_session):
+        """랭킹 조회가 정산 없이 미정산 수익금을 더해 순위를 매기는지 테스트"""
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+        from app.domain.auth.domain.entity import User
+        from app.domain.auth.domain.repository import UserRepository
+
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        settled_at = (now - timedelta(seconds=10.5)).replace(tzinfo=None)
+        db_session.add_all([
+            User(user_id="rich", password="x", credits=5000),
+            User(user_id="earner", password="x", credits=2000, total_income_rate=400, income_settled_at=settled_at),
+            User(user_id="unsettled", password="x", credits=3000, total_income_rate=400, income_settled_at=None)
+        ])
+        db_session.commit()
+
+        repository = UserRepository(db_session)
+        ranking = repository.find_top_users_by_accrued_credits(now, limit=3)
+
+        assert ranking == [("earner", 2000 + 10 * 400), ("rich", 5000), ("unsettled", 3000)]
+        assert repository.find_credits_with_accrued_income("earner", now) == 2000 + 10 * 400
+
+        db_session.expire_all()
+        assert db_session.get(User, "earner").credits == 2000
@@ -0,0 +1,122 @@
+"""
+백그라운드 작업 지표 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestJobMetrics:
+    """작업 실행 지표 테스트"""
+
+    def test_error_records_only_exception_type(self):
+        """실패한 실행의 오류는 메시지 없이 예외 종류만 기록하는지 테스트"""
+        from app.background.metrics import instrument, job_metrics
+
+        async def failing_job():
+            raise ValueError("postgresql://user:secret@db/searim")
+
+        job = instrument("test_failing_job", failing_job)
+        with pytest.raises(ValueError):
+            asyncio.run(job())
+
+        metrics = next(item for item in job_metrics.snapshot() if item["job_id"] == "test_failing_job")
+        assert metrics["failures"] == 1
+        assert metrics["last_error"] == "ValueError"
+
+    def test_cancelled_run_is_counted(self):
+        """제한 시간 초과로 취소된 실행을 취소 횟수로 기록하는지 테스트"""
+        from app.background.metrics import instrument, job_metrics
+
+        async def slow_job():
+            await asyncio.sleep(10)
+
+        job = instrument("test_slow_job", slow_job)
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(job(), timeout=0.01))
+
+        metrics = next(item for item in job_metrics.snapshot() if item["job_id"] == "test_slow_job")
+        assert metrics["runs"] == 1
+        assert metrics["cancellations"] == 1
+        assert metrics["failures"] == 0
+        assert metrics["running"] == 0
+
+
+class TestJobsEndpoint:
+    """작업 상태 조회 API 테스트"""
+
+    def test_requires_authentication(self, client: TestClient):
+        """토큰 없이 조회하면 거부되는지 테스트"""
+        response = client.get("/internal/jobs")
+
+        assert response.status_code == 401
+
+    def test_returns_jobs_with_token(self, client: TestClient):
+        """토큰으로 조회하면 작업 지표를 반환하는지 테스트"""
+        from app.core.security.jwt import create_access_token
+
+        token = create_access_token({"sub": "operator"})
+        response = client.get("/internal/jobs", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert "jobs" in response.json()
+
+
+class TestReadiness:
+    """서버 시작 시 초기 작업 준비 상태 API 테스트"""
+
+    @pytest.fixture
+    def warmup_state(self, monkeypatch):
+        """테스트마다 새 준비 상태를 사용"""
+        import app.main
+        from app.background import warmup
+
+        state = warmup.WarmupState()
+        monkeypatch.setattr(warmup, "warmup_state", state)
+        monkeypatch.setattr(app.main, "warmup_state", state)
+        return state
+
+    def test_not_ready_while_warmup_runs(self, client: TestClient, warmup_state):
+        """초기 작업이 끝나기 전에는 503을 반환하는지 테스트"""
+        warmup_state.begin()
+
+        response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+
+    def test_ready_after_warmup_with_failures_and_timeouts(self, client: TestClient, warmup_state):
+        """실패/시간 초과한 작업이 있어도 끝나면 200이고 오류는 예외 종류만 노출하는지 테스트"""
+        from app.background.warmup import run_warmup
+
+        async def done_step():
+            return None
+
+        async def failing_step():
+            raise RuntimeError("https://newsapi.org/v2/everything?apiKey=secret")
+
+        async def slow_step():
+            await asyncio.sleep(10)
+
+        asyncio.run(run_warmup(
+            [("완료", done_step), ("실패", failing_step), ("지연", slow_step)],
+            timeout=0.05
+        ))
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] is True
+        assert body["steps"]["완료"]["status"] == "done"
+        assert body["steps"]["실패"] == {"status": "failed", "duration": body["steps"]["실패"]["duration"], "error": "RuntimeError"}
+        assert body["steps"]["지연"]["status"] == "timeout"
+        assert "secret" not in response.text
+
+    def test_ready_without_warmup(self, client: TestClient, warmup_state):
+        """초기 작업을 실행하지 않는 프로세스는 바로 준비 상태인지 테스트"""
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"ready": True, "steps": {}}
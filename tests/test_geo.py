@@ -0,0 +1,60 @@
+"""
+공간 검색 유틸리티 테스트
+"""
+
+import random
+
+from app.core.geo import GeoKDTree, haversine_km
+
+
+def _nearest_by_scan(points, lat, lon, max_distance_km=None):
+    """기존 전체 순회 방식: 모든 지점의 haversine 거리를 계산해 가장 가까운 지점을 반환"""
+    best = None
+    for index, (point_lat, point_lon) in enumerate(points):
+        distance = haversine_km(lat, lon, point_lat, point_lon)
+        if max_distance_km is not None and distance > max_distance_km:
+            continue
+        if best is None or distance < best[1]:
+            best = (index, distance)
+    return best
+
+
+class TestGeoKDTree:
+    """KD-Tree 최근접 검색 테스트"""
+
+    def test_matches_full_scan(self):
+        """무작위 지점에서 전체 순회와 같은 최근접 지점을 찾는지 테스트"""
+        rng = random.Random(7)
+        points = [(rng.uniform(33.0, 38.5), rng.uniform(124.5, 131.0)) for _ in range(300)]
+        tree = GeoKDTree(points)
+
+        for _ in range(300):
+            lat, lon = rng.uniform(32.0, 39.5), rng.uniform(123.5, 132.0)
+            expected_index, expected_distance = _nearest_by_scan(points, lat, lon)
+            index, distance = tree.nearest(lat, lon)
+
+            assert abs(distance - expected_distance) < 1e-6
+            assert index == expected_index
+
+    def test_respects_max_distance(self):
+        """최대 거리 밖의 지점은 무시하는지 테스트"""
+        rng = random.Random(11)
+        points = [(rng.uniform(33.0, 38.5), rng.uniform(124.5, 131.0)) for _ in range(100)]
+        tree = GeoKDTree(points)
+
+        for _ in range(200):
+            lat, lon = rng.uniform(32.0, 39.5), rng.uniform(123.5, 132.0)
+            expected = _nearest_by_scan(points, lat, lon, max_distance_km=20.0)
+            result = tree.nearest(lat, lon, max_distance_km=20.0)
+
+            if expected is None:
+                assert result is None
+            else:
+                assert result[0] == expected[0]
+
+    def test_prefers_first_point_on_tie_and_handles_empty(self):
+        """같은 좌표가 여러 개면 먼저 입력된 지점을, 지점이 없으면 None을 반환하는지 테스트"""
+        tree = GeoKDTree([(35.1, 129.0), (35.1, 129.0), (33.5, 126.5)])
+
+        assert tree.nearest(35.0, 129.0)[0] == 0
+        assert GeoKDTree([]).nearest(35.0, 129.0) is None
@@ -0,0 +1,362 @@
+"""
+외부 API HTTP 클라이언트 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """
+    공용 HTTP 클라이언트를 MockTransport로 바꾸고 재시도 대기를 기록합니다.
+
+    handler를 설정한 뒤 사용하며, 대기 시간은 실제로 기다리지 않고 sleeps에 쌓입니다.
+    """
+    from app.core.http import client as http_client
+
+    class MockHttp:
+        def __init__(self):
+            self.handler = None
+            self.requests = []
+            self.sleeps = []
+
+        def _handle(self, request):
+            self.requests.append(request)
+            return self.handler(request)
+
+    mock = MockHttp()
+
+    async def fake_sleep(delay):
+        mock.sleeps.append(delay)
+
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(mock._handle)))
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+    # 지터 없이 최대 대기 시간을 사용
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(http_client.settings, "HTTP_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(http_client.settings, "HTTP_RETRY_BACKOFF_SECONDS", 0.5)
+    monkeypatch.setattr(http_client.settings, "HTTP_RETRY_MAX_BACKOFF_SECONDS", 8.0)
+    return mock
+
+
+class TestRequestRetry:
+    """재시도/백오프 테스트"""
+
+    def test_success_is_not_retried(self, mock_http):
+        """정상 응답은 재시도 없이 반환하는지 테스트"""
+        from app.core.http import request
+
+        mock_http.handler = lambda req: httpx.Response(200, text="ok")
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 200
+        assert len(mock_http.requests) == 1
+        assert mock_http.sleeps == []
+
+    def test_transport_error_is_retried_with_backoff(self, mock_http):
+        """연결 오류는 지수 백오프로 대기한 뒤 재시도하는지 테스트"""
+        from app.core.http import request
+
+        outcomes = [httpx.ConnectError("connection refused"), httpx.ReadTimeout("timed out"), None]
+
+        def handler(req):
+            outcome = outcomes.pop(0)
+            if outcome is not None:
+                raise outcome
+            return httpx.Response(200, text="ok")
+
+        mock_http.handler = handler
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 200
+        assert len(mock_http.requests) == 3
+        assert mock_http.sleeps == [0.5, 1.0]
+
+    @pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+    def test_transient_status_is_retried(self, mock_http, status_code):
+        """일시적 오류 상태 코드는 재시도하는지 테스트"""
+        from app.core.http import request
+
+        statuses = [status_code, 200]
+        mock_http.handler = lambda req: httpx.Response(statuses.pop(0))
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 200
+        assert len(mock_http.requests) == 2
+        assert mock_http.sleeps == [0.5]
+
+    def test_non_transient_status_is_not_retried(self, mock_http):
+        """일시적 오류가 아닌 상태 코드는 재시도하지 않는지 테스트"""
+        from app.core.http import request
+
+        mock_http.handler = lambda req: httpx.Response(500)
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 500
+        assert len(mock_http.requests) == 1
+        assert mock_http.sleeps == []
+
+    def test_numeric_retry_after_is_honoured(self, mock_http):
+        """숫자 Retry-After 헤더만큼 기다리고, 최대 대기 시간을 넘지 않는지 테스트"""
+        from app.core.http import request
+
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(503, headers={"Retry-After": "120"}),
+            httpx.Response(200),
+        ]
+        mock_http.handler = lambda req: responses.pop(0)
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 200
+        assert mock_http.sleeps == [3.0, 8.0]
+
+    def test_non_numeric_retry_after_falls_back_to_backoff(self, mock_http):
+        """날짜 형식 Retry-After는 무시하고 백오프로 대기하는지 테스트"""
+        from app.core.http import request
+
+        responses = [
+            httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+            httpx.Response(200),
+        ]
+        mock_http.handler = lambda req: responses.pop(0)
+
+        asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert mock_http.sleeps == [0.5]
+
+    def test_backoff_is_capped(self, mock_http, monkeypatch):
+        """백오프 대기 시간이 최대 대기 시간을 넘지 않는지 테스트"""
+        from app.core.http import client as http_client
+        from app.core.http import request
+
+        monkeypatch.setattr(http_client.settings, "HTTP_RETRY_ATTEMPTS", 6)
+        monkeypatch.setattr(http_client.settings, "HTTP_RETRY_MAX_BACKOFF_SECONDS", 3.0)
+        mock_http.handler = lambda req: httpx.Response(502)
+
+        asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert mock_http.sleeps == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    def test_last_transient_response_is_returned(self, mock_http):
+        """마지막 시도까지 일시적 오류면 그 응답을 반환하는지 테스트"""
+        from app.core.http import request
+
+        mock_http.handler = lambda req: httpx.Response(503, text="unavailable")
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 503
+        assert response.text == "unavailable"
+        assert len(mock_http.requests) == 3
+        # 마지막 시도 뒤에는 기다리지 않음
+        assert mock_http.sleeps == [0.5, 1.0]
+
+    def test_transport_error_is_raised_after_last_attempt(self, mock_http):
+        """마지막 시도까지 연결 오류면 예외를 그대로 전파하는지 테스트"""
+        from app.core.http import request
+
+        def handler(req):
+            raise httpx.ConnectError("connection refused")
+
+        mock_http.handler = handler
+
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert len(mock_http.requests) == 3
+        assert mock_http.sleeps == [0.5, 1.0]
+
+    def test_single_attempt_setting_disables_retry(self, mock_http, monkeypatch):
+        """시도 횟수가 1 이하면 재시도하지 않는지 테스트"""
+        from app.core.http import client as http_client
+        from app.core.http import request
+
+        monkeypatch.setattr(http_client.settings, "HTTP_RETRY_ATTEMPTS", 0)
+        mock_http.handler = lambda req: httpx.Response(503)
+
+        response = asyncio.run(request("GET", "https://api.example.com/data"))
+
+        assert response.status_code == 503
+        assert len(mock_http.requests) == 1
+        assert mock_http.sleeps == []
+
+
+@pytest.fixture
+def response_cache(mock_http, monkeypatch, tmp_path):
+    """임시 파일을 쓰는 응답 캐시로 바꿉니다."""
+    from app.core.http import cache as http_cache
+
+    path = str(tmp_path / "http-cache.sqlite3")
+    monkeypatch.setattr(http_cache.settings, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(http_cache.settings, "HTTP_CACHE_PATH", path)
+    cache = http_cache.ResponseCache(path=path, retention_seconds=http_cache.settings.HTTP_CACHE_RETENTION_SECONDS)
+    monkeypatch.setattr(http_cache, "response_cache", cache)
+    return cache
+
+
+class TestCachedGet:
+    """조건부 요청 응답 캐시 테스트"""
+
+    URL = "https://api.example.com/stations"
+    PARAMS = {"page": 1, "serviceKey": "secret-key"}
+
+    @staticmethod
+    def _fresh(body=b'{"data": [1]}'):
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"}
+        )
+
+    def test_response_within_ttl_is_served_from_cache(self, mock_http, response_cache):
+        """TTL 안에서는 요청 없이 캐시된 본문을 반환하는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+
+        first = asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+        second = asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.content == first.content
+        assert second.content_hash == first.content_hash
+        assert len(mock_http.requests) == 1
+
+    def test_other_params_are_cached_separately(self, mock_http, response_cache):
+        """파라미터가 다르면 캐시를 공유하지 않는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+
+        asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+        other = asyncio.run(cached_get(self.URL, params={**self.PARAMS, "page": 2}, ttl_seconds=60))
+
+        assert other.from_cache is False
+        assert len(mock_http.requests) == 2
+
+    def test_expired_entry_sends_conditional_request(self, mock_http, response_cache):
+        """TTL이 지나면 ETag/Last-Modified로 조건부 요청을 보내는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+        asyncio.run(cached_get(self.URL, params=self.PARAMS))
+
+        mock_http.handler = lambda req: httpx.Response(304)
+        asyncio.run(cached_get(self.URL, params=self.PARAMS))
+
+        first_request, conditional_request = mock_http.requests
+        assert "If-None-Match" not in first_request.headers
+        assert conditional_request.headers["If-None-Match"] == '"v1"'
+        assert conditional_request.headers["If-Modified-Since"] == "Wed, 01 Jan 2026 00:00:00 GMT"
+
+    def test_not_modified_reuses_cached_body(self, mock_http, response_cache):
+        """304 응답이면 캐시된 본문을 재사용하고 TTL을 다시 시작하는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+        first = asyncio.run(cached_get(self.URL, params=self.PARAMS))
+        fetched_at = response_cache.get(response_cache.make_key(self.URL, self.PARAMS))[4]
+
+        mock_http.handler = lambda req: httpx.Response(304)
+        revalidated = asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=0))
+
+        assert revalidated.status_code == 200
+        assert revalidated.revalidated is True
+        assert revalidated.content == first.content
+        assert revalidated.content_hash == first.content_hash
+        assert revalidated.json() == {"data": [1]}
+        assert response_cache.get(response_cache.make_key(self.URL, self.PARAMS))[4] >= fetched_at
+
+    def test_changed_response_replaces_cached_body(self, mock_http, response_cache):
+        """새 200 응답이면 캐시된 본문을 바꾸는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+        first = asyncio.run(cached_get(self.URL, params=self.PARAMS))
+
+        mock_http.handler = lambda req: self._fresh(b'{"data": [2]}')
+        changed = asyncio.run(cached_get(self.URL, params=self.PARAMS))
+
+        assert changed.revalidated is False
+        assert changed.content_hash != first.content_hash
+        assert response_cache.get(response_cache.make_key(self.URL, self.PARAMS))[2] == b'{"data": [2]}'
+
+    def test_error_response_is_not_cached(self, mock_http, response_cache):
+        """200이 아닌 응답은 캐시하지 않고 그대로 반환하는지 테스트"""
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: httpx.Response(500, content=b"error")
+        response = asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+
+        assert response.status_code == 500
+        assert response.content_hash is None
+        assert response_cache.get(response_cache.make_key(self.URL, self.PARAMS)) is None
+
+    def test_cache_key_does_not_contain_api_key(self, mock_http, response_cache):
+        """캐시 파일에 API 키가 그대로 저장되지 않는지 테스트"""
+        import sqlite3
+
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+        asyncio.run(cached_get(self.URL, params=self.PARAMS))
+
+        connection = sqlite3.connect(response_cache.path)
+        try:
+            rows = connection.execute("SELECT cache_key, url FROM http_responses").fetchall()
+        finally:
+            connection.close()
+        assert rows and all("secret-key" not in value for row in rows for value in row)
+
+    def test_entries_past_retention_are_pruned(self, mock_http, response_cache):
+        """보관 기간 동안 갱신되지 않은 항목은 다음 저장 때 삭제되는지 테스트"""
+        import sqlite3
+        import time
+
+        from app.core.http import cached_get
+
+        mock_http.handler = lambda req: self._fresh()
+        asyncio.run(cached_get(self.URL, params=self.PARAMS))
+        asyncio.run(cached_get(self.URL, params={**self.PARAMS, "page": 2}))
+
+        stale_key = response_cache.make_key(self.URL, self.PARAMS)
+        connection = sqlite3.connect(response_cache.path)
+        try:
+            connection.execute(
+                "UPDATE http_responses SET fetched_at = ? WHERE cache_key = ?",
+                (time.time() - response_cache.retention_seconds - 1, stale_key)
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        asyncio.run(cached_get(self.URL, params={**self.PARAMS, "page": 3}))
+
+        assert response_cache.get(stale_key) is None
+        assert response_cache.get(response_cache.make_key(self.URL, {**self.PARAMS, "page": 2})) is not None
+
+    def test_disabled_cache_always_requests(self, mock_http, response_cache, monkeypatch):
+        """캐시를 끄면 항상 요청하고 저장하지 않는지 테스트"""
+        from app.core.http import cache as http_cache
+        from app.core.http import cached_get
+
+        monkeypatch.setattr(http_cache.settings, "HTTP_CACHE_ENABLED", False)
+        mock_http.handler = lambda req: self._fresh()
+
+        asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+        response = asyncio.run(cached_get(self.URL, params=self.PARAMS, ttl_seconds=60))
+
+        assert response.from_cache is False
+        assert response.content_hash is not None
+        assert len(mock_http.requests) == 2
+        assert response_cache.get(response_cache.make_key(self.URL, self.PARAMS)) is None
@@ -28,3 +28,242 @@ class TestOcean:
         response = client.get("/api/ocean/99999")
 
         assert response.status_code == 404
+
+
+class TestOceanLocationIndex:
+    """해양 위치 인덱스 무효화 테스트"""
+
+    def _built_index(self, db_session):
+        from app.domain.ocean.domain.location_index import ocean_location_index
+
+        ocean_location_index.find_nearest_ocean_id(db_session, 35.0, 129.0, max_distance=1000)
+        assert ocean_location_index._tree is not None
+        return ocean_location_index
+
+    def test_invalidates_only_after_commit(self, db_session, test_ocean):
+        """좌표 변경은 flush 시점이 아니라 커밋된 뒤에 인덱스를 무효화하는지 테스트"""
+        index = self._built_index(db_session)
+
+        test_ocean.lat = 33.5
+        db_session.flush()
+        assert index._tree is not None
+
+        db_session.commit()
+        assert index._tree is None
+
+    def test_rollback_keeps_index(self, db_session, test_ocean):
+        """롤백된 좌표 변경은 인덱스를 무효화하지 않는지 테스트"""
+        index = self._built_index(db_session)
+
+        test_ocean.lat = 33.5
+        db_session.flush()
+        db_session.rollback()
+        assert index._tree is not None
+
+        # 롤백으로 지워진 표시가 이후 커밋에 남아 있지 않아야 한다
+        test_ocean.current_price = 1300
+        db_session.commit()
+        assert index._tree is not None
+
+
+def _seed_oceans(db_session, specs):
+    """(쓰레기 수집 횟수, 현재 시세) 목록으로 해양 생성"""
+    from app.domain.ocean.domain.entity import Ocean
+
+    oceans = []
+    for index, (garbage_count, price) in enumerate(specs):
+        ocean = Ocean(
+            ocean_name=f"테스트 해양 {index}",
+            lat=35.0 + index * 0.1,
+            lon=129.0,
+            region="부산광역시",
+            detail="해운대구",
+            base_price=1000,
+            current_price=price,
+            total_square_meters=100,
+            available_square_meters=100,
+            garbage_collection_count=garbage_count
+        )
+        db_session.add(ocean)
+        oceans.append(ocean)
+    db_session.commit()
+    return [ocean.ocean_id for ocean in oceans]
+
+
+class TestOceanPriceHistory:
+    """시세 이력 링 버퍼 테스트"""
+
+    def test_ring_buffer_keeps_latest_prices(self, db_session):
+        """유지 개수를 넘게 기록해도 슬롯을 덮어써 최근 시세만 순서대로 남는지 테스트"""
+        from app.domain.ocean.domain.entity import Ocean, OceanPriceHistory
+        from app.domain.ocean.domain.repository import OceanRepository
+
+        ocean_id, = _seed_oceans(db_session, [(0, 1000)])
+        repository = OceanRepository(db_session)
+        ocean = db_session.get(Ocean, ocean_id)
+
+        for price in range(1001, 1008):
+            ocean.current_price = price
+            repository.add_price_history(ocean, limit=3)
+        db_session.commit()
+
+        rows = db_session.query(OceanPriceHistory).filter_by(ocean_id=ocean_id).order_by(OceanPriceHistory.slot).all()
+        assert [(row.slot, row.sequence, row.price) for row in rows] == [(0, 6, 1006), (1, 7, 1007), (2, 5, 1005)]
+        assert ocean.price_history_sequence == 7
+        assert repository.find_recent_prices_by_ocean_ids([ocean_id], limit=3) == {ocean_id: [1007, 1006, 1005]}
+
+    def test_sequence_is_incremented_in_database(self, db_session):
+        """메모리의 순번이 뒤처져 있어도 DB 순번 기준으로 다음 슬롯에 기록하는지 테스트"""
+        from sqlalchemy import update
+        from app.domain.ocean.domain.entity import Ocean
+        from app.domain.ocean.domain.repository import OceanRepository
+
+        ocean_id, = _seed_oceans(db_session, [(0, 1000)])
+        repository = OceanRepository(db_session)
+        ocean = db_session.get(Ocean, ocean_id)
+
+        # 다른 트랜잭션이 먼저 순번을 올린 상황
+        db_session.execute(update(Ocean).where(Ocean.ocean_id == ocean_id).values(price_history_sequence=4))
+        repository.add_price_history(ocean, limit=10)
+        db_session.commit()
+
+        assert ocean.price_history_sequence == 5
+        assert repository.find_recent_prices_by_ocean_ids([ocean_id]) == {ocean_id: [1000]}
+
+    def test_bulk_price_update_matches_per_ocean_update(self, db_session, session_factory):
+        """CASE 기반 일괄 시세 갱신이 해양별 갱신과 같은 시세와 이력을 남기는지 테스트"""
+        from app.background import tasks
+        from app.domain.ocean.domain.entity import Ocean, OceanPriceHistory
+
+        specs = [(150, 1000), (60, 1000), (30, 1000), (5, 1000), (0, 1000), (0, 250), (0, 100)]
+
+        def run(update_prices):
+            ocean_ids = _seed_oceans(db_session, specs)
+            update_prices()
+            update_prices()
+            db_session.expire_all()
+            prices = [db_session.get(Ocean, ocean_id).current_price for ocean_id in ocean_ids]
+            histories = [
+                [
+                    (row.sequence, row.price)
+                    for row in db_session.query(OceanPriceHistory)
+                    .filter_by(ocean_id=ocean_id)
+                    .order_by(OceanPriceHistory.sequence)
+                ]
+                for ocean_id in ocean_ids
+            ]
+            db_session.query(OceanPriceHistory).delete()
+            db_session.query(Ocean).delete()
+            db_session.commit()
+            return prices, histories
+
+        per_ocean = run(tasks._update_ocean_prices_by_garbage)
+        bulk = run(tasks._update_ocean_prices_by_garbage_bulk)
+
+        assert bulk == per_ocean
+        assert per_ocean[0] == [2000, 1600, 1200, 1000, 600, 100, 100]
+
+
+class TestWaterQualityUpsert:
+    """수질 데이터 upsert 테스트"""
+
+    def test_upsert_keeps_one_row_per_ocean(self, db_session):
+        """같은 해양의 수질 데이터를 다시 저장하면 해양 ID 기준으로 덮어쓰는지 테스트"""
+        from app.domain.ocean.domain.entity import WaterQuality
+        from app.domain.ocean.domain.repository import WaterQualityRepository
+
+        first_id, second_id = _seed_oceans(db_session, [(0, 1000), (0, 1000)])
+        repository = WaterQualityRepository(db_session)
+
+        repository.upsert_all([
+            {"ocean_id": first_id, "ph_value": 8.0, "price_change": 50},
+            {"ocean_id": second_id, "ph_value": 7.5, "price_change": 100},
+        ])
+        db_session.commit()
+
+        changes = repository.find_price_changes_by_ocean_ids([first_id, second_id])
+        repository.upsert_all([
+            {"ocean_id": first_id, "ph_value": 8.2, "price_change": changes[first_id] + 150},
+        ])
+        db_session.commit()
+
+        rows = db_session.query(WaterQuality).order_by(WaterQuality.ocean_id).all()
+        assert [(row.ocean_id, row.ph_value, row.price_change) for row in rows] == [
+            (first_id, 8.2, 200),
+            (second_id, 7.5, 100),
+        ]
+
+
+class TestStationMatchCache:
+    """관측소 매칭 결과 재사용 테스트"""
+
+    STATIONS = [
+        {"관측소 명": "부산 부이", "관측소 유형": "해양관측부이", "위도": "35.1", "경도": "129.1"},
+        {"관측소 명": "제주 기지", "관측소 유형": "종합해양과학기지", "위도": "33.2", "경도": "126.5"},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        from app.background import tasks
+
+        monkeypatch.setattr(tasks, "_station_match_cache", {})
+
+    @staticmethod
+    def _oceans(lat=35.0, lon=129.0):
+        from app.domain.ocean.domain.entity import Ocean
+
+        return [
+            Ocean(ocean_id=1, ocean_name="해운대", lat=lat, lon=lon),
+            Ocean(ocean_id=2, ocean_name="좌표 없음", lat=None, lon=None),
+        ]
+
+    @staticmethod
+    def _response(stations, content_hash):
+        import json
+        from app.core.http import CachedResponse
+
+        return CachedResponse(200, json.dumps({"data": stations}).encode("utf-8"), content_hash)
+
+    def test_matches_nearest_station(self):
+        """200km 이내 가장 가까운 관측소와 매칭하는지 테스트"""
+        from app.background.tasks import _match_oceans_to_stations
+
+        matches = _match_oceans_to_stations(self._oceans(), self._response(self.STATIONS, "hash-1"))
+
+        assert len(matches) == 1
+        ocean_id, station_type, distance = matches[0]
+        assert (ocean_id, station_type) == (1, "해양관측부이")
+        assert distance < 20
+
+    def test_reuses_matches_when_response_and_locations_unchanged(self):
+        """응답 본문과 해양 좌표가 같으면 본문을 파싱하지 않고 지난 결과를 재사용하는지 테스트"""
+        from app.background.tasks import _match_oceans_to_stations
+        from app.core.http import CachedResponse
+
+        matches = _match_oceans_to_stations(self._oceans(), self._response(self.STATIONS, "hash-1"))
+
+        # 파싱하면 실패하는 본문이라도 해시가 같으면 재사용
+        reused = _match_oceans_to_stations(self._oceans(), CachedResponse(200, b"not json", "hash-1"))
+
+        assert reused == matches
+
+    def test_rematches_when_response_changes(self):
+        """관측소 응답이 바뀌면 다시 매칭하는지 테스트"""
+        from app.background.tasks import _match_oceans_to_stations
+
+        _match_oceans_to_stations(self._oceans(), self._response(self.STATIONS, "hash-1"))
+        stations = [dict(self.STATIONS[0], **{"관측소 유형": "조위관측소"})]
+
+        matches = _match_oceans_to_stations(self._oceans(), self._response(stations, "hash-2"))
+
+        assert [match[1] for match in matches] == ["조위관측소"]
+
+    def test_rematches_when_ocean_moves(self):
+        """해양 좌표가 바뀌면 같은 응답이라도 다시 매칭하는지 테스트"""
+        from app.background.tasks import _match_oceans_to_stations
+
+        _match_oceans_to_stations(self._oceans(), self._response(self.STATIONS, "hash-1"))
+
+        matches = _match_oceans_to_stations(self._oceans(lat=33.3, lon=126.6), self._response(self.STATIONS, "hash-1"))
+
+        assert [match[1] for match in matches] == ["종합해양과학기지"]
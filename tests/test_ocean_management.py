@@ -20,7 +20,7 @@ class TestOceanManagement:
     def test_get_my_oceans_with_ownership(self, client: TestClient, auth_headers, test_ocean, db_session):
         """보유 해양 조회 성공 테스트"""
         # 회원가입한 사용자 ID 가져오기
-        from app.global.security.jwt import decode_access_token
+        from app.core.security.jwt import decode_access_token
         token = auth_headers["Authorization"].replace("Bearer ", "")
         payload = decode_access_token(token)
         user_id = payload.get("sub")
@@ -45,7 +45,7 @@ class TestOceanManagement:
     def test_build_on_ocean_success(self, client: TestClient, auth_headers, test_ocean, db_session):
         """건물 짓기 성공 테스트"""
         # 소유권 생성
-        from app.global.security.jwt import decode_access_token
+        from app.core.security.jwt import decode_access_token
         token = auth_headers["Authorization"].replace("Bearer ", "")
         payload = decode_access_token(token)
         user_id = payload.get("sub")
@@ -86,3 +86,165 @@ class TestOceanManagement:
         )
 
         assert response.status_code == 401
+
+
+class TestBuildingIncomePayout:
+    """건물 수익금 일괄 지급 테스트"""
+
+    @staticmethod
+    def _seed(db_session, elapsed_seconds: float):
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean.domain.entity import Ocean
+
+        last_time = (datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(seconds=elapsed_seconds)).replace(tzinfo=None)
+        ocean = Ocean(ocean_name="수익 해양", lat=35.0, lon=129.0, region="부산광역시", detail="해운대구", base_price=1000, current_price=1000)
+        db_session.add(ocean)
+        db_session.flush()
+
+        buildings = {
+            "owner_a": [(BuildingType.STORE, 400), (BuildingType.BUILDING, 2000)],
+            "owner_b": [(BuildingType.STORE, 400)],
+            "owner_c": []
+        }
+        for user_id, owned in buildings.items():
+            db_session.add(User(
+                user_id=user_id,
+                password="x",
+                credits=1000,
+                total_income_rate=sum(rate for _, rate in owned),
+                income_settled_at=last_time if owned else None
+            ))
+            db_session.add(OceanOwnership(user_id=user_id, ocean_id=ocean.ocean_id, square_meters=10))
+            for building_type, rate in owned:
+                db_session.add(Building(
+                    ocean_id=ocean.ocean_id,
+                    user_id=user_id,
+                    building_type=building_type,
+                    income_rate=rate,
+                    last_income_generated_at=last_time
+                ))
+        db_session.commit()
+
+    @staticmethod
+    def _credits(session_factory):
+        from app.domain.auth.domain.entity import User
+
+        db = session_factory()
+        try:
+            return {user.user_id: user.credits for user in db.query(User).all()}
+        finally:
+            db.close()
+
+    @staticmethod
+    def _reset(db_session):
+        from app.database import Base
+
+        for table in reversed(Base.metadata.sorted_tables):
+            db_session.execute(table.delete())
+        db_session.commit()
+
+    def test_bulk_payout_matches_per_building_payout(self, db_session, session_factory):
+        """일괄 지급 결과가 건물별 지급(기존 방식)과 같은지 테스트"""
+        from app.background import tasks
+
+        self._seed(db_session, 100.5)
+        tasks._generate_building_income_per_building()
+        per_building = self._credits(session_factory)
+
+        self._reset(db_session)
+        self._seed(db_session, 100.5)
+        tasks._generate_building_income_bulk()
+        bulk = self._credits(session_factory)
+
+        assert per_building == bulk
+        assert bulk == {"owner_a": 1000 + 100 * 2400, "owner_b": 1000 + 100 * 400, "owner_c": 1000}
+
+    def test_settle_is_not_repeated_for_same_interval(self, db_session, session_factory):
+        """같은 구간을 두 번 정산해도 한 번만 지급되는지 테스트"""
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+        from app.domain.ocean_management.domain.repository import OceanManagementRepository
+
+        self._seed(db_session, 10.5)
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+
+        repository = OceanManagementRepository(db_session)
+        assert repository.settle_building_income(now) == (10 * 2400 + 10 * 400, 2)
+        db_session.commit()
+        assert repository.settle_building_income(now) == (0, 0)
+        db_session.commit()
+
+        assert self._credits(session_factory)["owner_a"] == 1000 + 10 * 2400
+
+    def test_settle_pays_pending_building_income_for_unsettled_users(self, db_session, session_factory):
+        """정산 시각이 없는 사용자는 건물별 마지막 지급 시각부터 정산되는지 테스트"""
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean_management.domain.repository import OceanManagementRepository
+
+        self._seed(db_session, 20.5)
+        db_session.query(User).update({User.income_settled_at: None})
+        db_session.commit()
+
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        repository = OceanManagementRepository(db_session)
+        assert repository.settle_building_income(now) == (20 * 2400 + 20 * 400, 2)
+        db_session.commit()
+
+        assert self._credits(session_factory) == {"owner_a": 1000 + 20 * 2400, "owner_b": 1000 + 20 * 400, "owner_c": 1000}
+        assert repository.settle_building_income(now) == (0, 0)
+
+    def test_rebuild_after_idle_period_does_not_pay_idle_time(self, db_session, session_factory):
+        """건물을 모두 팔고 오래 쉰 뒤 다시 지으면 쉬던 기간은 지급되지 않는지 테스트"""
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean.domain.entity import Ocean
+        from app.domain.ocean_management.domain.repository import OceanManagementRepository
+        from app.domain.ocean_trade.domain.repository import OceanTradeRepository
+
+        self._seed(db_session, 0)
+        ocean_id = db_session.query(Ocean.ocean_id).scalar()
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+
+        # 건물을 모두 잃어 수익률 합계가 0이 된 뒤 7일 동안 쉼
+        OceanTradeRepository(db_session).delete_buildings_by_user_and_ocean("owner_b", ocean_id)
+        db_session.query(User).filter_by(user_id="owner_b").update(
+            {User.income_settled_at: (now - timedelta(days=7)).replace(tzinfo=None)}
+        )
+        db_session.commit()
+
+        repository = OceanManagementRepository(db_session)
+        repository.add_income_rate("owner_b", ocean_id, 400, now)
+        db_session.commit()
+
+        paid, _ = repository.settle_building_income(now + timedelta(seconds=10.5), user_ids=["owner_b"])
+        db_session.commit()
+
+        assert paid == 10 * 400
+        assert self._credits(session_factory)["owner_b"] == 1000 + 10 * 400
+
+    def test_rollup_rebuild_moves_settle_time_of_idle_users(self, db_session, session_factory):
+        """수익률 합계가 0이던 사용자는 집계 재계산 시 정산 시각이 지금으로 옮겨지는지 테스트"""
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean_management.domain.repository import OceanManagementRepository
+
+        self._seed(db_session, 7 * 24 * 3600)
+        # 집계값이 어긋나 건물이 있는데도 수익률 합계가 0으로 남은 사용자
+        db_session.query(User).filter_by(user_id="owner_b").update({User.total_income_rate: 0})
+        db_session.commit()
+
+        now = datetime.now(ZoneInfo("Asia/Seoul"))
+        repository = OceanManagementRepository(db_session)
+        repository.rebuild_income_rate_rollups(now)
+        db_session.commit()
+
+        paid, _ = repository.settle_building_income(now + timedelta(seconds=10.5), user_ids=["owner_b"])
+        db_session.commit()
+
+        assert paid == 10 * 400
@@ -46,7 +46,7 @@ class TestOceanTrade:
         """크레딧 부족으로 해양 구매 실패 테스트"""
         # 크레딧이 부족한 사용자 생성
         from app.domain.auth.domain.entity import User
-        from app.global.security.password import hash_password
+        from app.core.security.password import hash_password
 
         poor_user = User(
             user_id="poor_user",
@@ -96,7 +96,7 @@ class TestOceanTrade:
     def test_register_sale_success(self, client: TestClient, auth_headers, test_ocean, db_session):
         """판매 등록 성공 테스트"""
         # 소유권 생성
-        from app.global.security.jwt import decode_access_token
+        from app.core.security.jwt import decode_access_token
         from app.domain.ocean_management.domain.entity import OceanOwnership
 
         token = auth_headers["Authorization"].replace("Bearer ", "")
@@ -126,7 +126,7 @@ class TestOceanTrade:
     def test_register_auction_success(self, client: TestClient, auth_headers, test_ocean, db_session):
         """경매 등록 성공 테스트"""
         # 소유권 생성
-        from app.global.security.jwt import decode_access_token
+        from app.core.security.jwt import decode_access_token
         from app.domain.ocean_management.domain.entity import OceanOwnership
 
         token = auth_headers["Authorization"].replace("Bearer ", "")
@@ -153,3 +153,248 @@ class TestOceanTrade:
         assert data["ocean_id"] == test_ocean.ocean_id
         # 시작가는 현재 시세의 80%
         assert data["starting_price"] == int(test_ocean.current_price * 0.8)
+
+
+class TestAuctionFinalization:
+    """경매 일괄 종료 처리 테스트"""
+
+    @staticmethod
+    def _seed(db_session):
+        from datetime import datetime, timedelta
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean.domain.entity import Ocean
+        from app.domain.ocean_management.domain.entity import OceanOwnership
+        from app.domain.ocean_trade.domain.entity import AuctionBid, OceanAuction
+
+        ocean = Ocean(ocean_name="경매 해양", lat=35.0, lon=129.0, region="부산광역시", detail="해운대구", base_price=1000, current_price=1000)
+        db_session.add(ocean)
+        db_session.flush()
+
+        for user_id in ("seller", "alice", "bob"):
+            db_session.add(User(user_id=user_id, password="x", credits=1000))
+        db_session.add(OceanOwnership(user_id="seller", ocean_id=ocean.ocean_id, square_meters=5))
+        db_session.add(OceanOwnership(user_id="alice", ocean_id=ocean.ocean_id, square_meters=2))
+
+        ended = datetime.now() - timedelta(minutes=1)
+        auctions = {}
+        for name, square_meters, end_time, bids in [
+            ("outbid", 10, ended, [("alice", 500), ("bob", 700), ("alice", 600)]),
+            ("tie", 4, ended, [("alice", 300), ("bob", 300)]),
+            ("no_bids", 3, ended, []),
+            ("running", 7, datetime.now() + timedelta(minutes=10), [("bob", 900)]),
+        ]:
+            auction = OceanAuction(
+                ocean_id=ocean.ocean_id,
+                seller_id="seller",
+                square_meters=square_meters,
+                starting_price=100,
+                current_price=max([amount for _, amount in bids], default=100),
+                end_time=end_time
+            )
+            db_session.add(auction)
+            db_session.flush()
+            for bidder_id, amount in bids:
+                db_session.add(AuctionBid(auction_id=auction.id, bidder_id=bidder_id, bid_amount=amount))
+                db_session.flush()
+            auctions[name] = auction.id
+
+        db_session.commit()
+        return ocean.ocean_id, auctions
+
+    @staticmethod
+    def _state(session_factory, ocean_id):
+        from app.domain.auth.domain.entity import User
+        from app.domain.ocean_management.domain.entity import OceanOwnership
+        from app.domain.ocean_trade.domain.entity import OceanAuction
+
+        db = session_factory()
+        try:
+            credits = {user.user_id: user.credits for user in db.query(User).all()}
+            square_meters = {
+                ownership.user_id: ownership.square_meters
+                for ownership in db.query(OceanOwnership).filter_by(ocean_id=ocean_id).all()
+            }
+            auctions = {
+                auction.id: (auction.status.value, auction.winner_id)
+                for auction in db.query(OceanAuction).all()
+            }
+            return credits, square_meters, auctions
+        finally:
+            db.close()
+
+    def test_batched_finalization_settles_winners_and_returns_unsold_area(self, db_session, session_factory, monkeypatch):
+        """여러 배치에 걸쳐 낙찰자 차감, 판매자 지급, 소유권 이전/복구가 정확한지 테스트"""
+        from app.background import tasks
+
+        monkeypatch.setattr(tasks.settings, "AUCTION_FINALIZE_BATCH_SIZE", 2)
+        ocean_id, auctions = self._seed(db_session)
+
+        tasks._finalize_expired_auctions()
+        credits, square_meters, statuses = self._state(session_factory, ocean_id)
+
+        # 낙찰 금액만 이동하고 낙찰받지 못한 입찰은 차감되지 않음
+        assert credits == {"seller": 2000, "alice": 700, "bob": 300}
+        # 낙찰 평수는 낙찰자에게, 유찰 평수는 판매자에게
+        assert square_meters == {"seller": 8, "alice": 6, "bob": 10}
+        assert statuses == {
+            auctions["outbid"]: ("SOLD", "bob"),
+            auctions["tie"]: ("SOLD", "alice"),
+            auctions["no_bids"]: ("CANCELLED", None),
+            auctions["running"]: ("ACTIVE", None),
+        }
+
+    def test_finalization_is_not_repeated(self, db_session, session_factory):
+        """이미 종료된 경매는 다시 정산하지 않는지 테스트"""
+        from app.background import tasks
+
+        ocean_id, _ = self._seed(db_session)
+
+        tasks._finalize_expired_auctions()
+        first = self._state(session_factory, ocean_id)
+        tasks._finalize_expired_auctions()
+
+        assert self._state(session_factory, ocean_id) == first
+
+
+class TestAuctionReload:
+    """새 경매 재조회 테스트"""
+
+    def test_recent_auctions_below_loaded_id_are_rechecked(self, db_session, test_ocean, test_user):
+        """ID 기준선보다 작은 ID라도 최근 등록된 활성 경매는 다시 조회하는지 테스트"""
+        from datetime import datetime, timedelta
+        from app.domain.ocean_trade.domain.entity import OceanAuction
+        from app.domain.ocean_trade.domain.repository import OceanTradeRepository
+
+        end_time = datetime.now() + timedelta(minutes=10)
+        late_committed = OceanAuction(
+            ocean_id=test_ocean.ocean_id,
+            seller_id=test_user.user_id,
+            square_meters=1,
+            starting_price=100,
+            current_price=100,
+            end_time=end_time
+        )
+        db_session.add(late_committed)
+        db_session.commit()
+
+        repository = OceanTradeRepository(db_session)
+        loaded_id = late_committed.id + 1
+
+        assert repository.find_active_auction_end_times(loaded_id) == []
+        assert [auction_id for auction_id, _ in repository.find_active_auction_end_times(loaded_id, 60)] == [late_committed.id]
+
+    def test_old_auctions_below_loaded_id_are_not_rechecked(self, db_session, test_ocean, test_user):
+        """재확인 구간보다 오래전에 등록된 경매는 다시 조회하지 않는지 테스트"""
+        from datetime import datetime, timedelta
+        from sqlalchemy import func, select
+        from app.domain.ocean_trade.domain.entity import OceanAuction
+        from app.domain.ocean_trade.domain.repository import OceanTradeRepository
+
+        db_now = db_session.execute(select(func.now())).scalar()
+        old_auction = OceanAuction(
+            ocean_id=test_ocean.ocean_id,
+            seller_id=test_user.user_id,
+            square_meters=1,
+            starting_price=100,
+            current_price=100,
+            end_time=datetime.now() + timedelta(minutes=10),
+            created_at=db_now - timedelta(hours=2)
+        )
+        db_session.add(old_auction)
+        db_session.commit()
+
+        repository = OceanTradeRepository(db_session)
+
+        assert repository.find_active_auction_end_times(old_auction.id + 1, 60) == []
+        assert [auction_id for auction_id, _ in repository.find_active_auction_end_times(0, 60)] == [old_auction.id]
+
+
+class TestAuctionExpiryScheduler:
+    """경매 종료 스케줄러 테스트"""
+
+    @staticmethod
+    def _run(monkeypatch, scenario):
+        """가짜 종료 처리 함수로 스케줄러를 실행하고 종료 처리된 경매 ID 묶음을 반환"""
+        import asyncio
+        from app.background import tasks
+        from app.background.auction_scheduler import AuctionExpiryScheduler
+
+        finalized = []
+
+        async def fake_finalize_auctions_by_ids(auction_ids):
+            finalized.append(list(auction_ids))
+
+        monkeypatch.setattr(tasks, "finalize_auctions_by_ids", fake_finalize_auctions_by_ids)
+
+        async def main():
+            scheduler = AuctionExpiryScheduler()
+            scheduler.start()
+            try:
+                await scenario(scheduler)
+            finally:
+                await scheduler.stop()
+
+        asyncio.run(main())
+        return finalized
+
+    def test_ignores_schedule_when_not_running(self):
+        """실행 중이 아니면 등록을 무시하는지 테스트"""
+        from datetime import datetime
+        from app.background.auction_scheduler import AuctionExpiryScheduler
+
+        scheduler = AuctionExpiryScheduler()
+        scheduler.schedule(1, datetime.now())
+
+        assert scheduler._heap == []
+        assert scheduler._seconds_until_next() is None
+
+    def test_finalizes_due_auctions_in_end_time_order(self, monkeypatch):
+        """종료 시간이 지난 경매를 종료 시간 순서로 한 번에 처리하는지 테스트"""
+        import asyncio
+        from datetime import datetime, timedelta
+
+        async def scenario(scheduler):
+            now = datetime.now()
+            scheduler.schedule_all([
+                (3, now - timedelta(seconds=1)),
+                (1, now - timedelta(seconds=3)),
+                (2, now - timedelta(seconds=2)),
+            ])
+            await asyncio.sleep(0.1)
+
+        assert self._run(monkeypatch, scenario) == [[1, 2, 3]]
+
+    def test_rescheduled_end_time_replaces_previous_entry(self, monkeypatch):
+        """종료 시간이 바뀌어 다시 등록된 경매는 이전 종료 시간에 처리되지 않는지 테스트"""
+        import asyncio
+        from datetime import datetime, timedelta
+
+        async def scenario(scheduler):
+            now = datetime.now()
+            scheduler.schedule(1, now + timedelta(seconds=0.05))
+            scheduler.schedule(1, now + timedelta(seconds=30))
+            scheduler.schedule(2, now + timedelta(seconds=30))
+            scheduler.schedule(2, now + timedelta(seconds=0.05))
+            await asyncio.sleep(0.3)
+
+        assert self._run(monkeypatch, scenario) == [[2]]
+
+    def test_wakes_up_for_earlier_auction(self, monkeypatch):
+        """먼 종료 시간을 기다리는 중에 더 이른 경매가 등록되면 깨어나 처리하는지 테스트"""
+        import asyncio
+        from datetime import datetime, timedelta
+
+        async def scenario(scheduler):
+            scheduler.schedule(1, datetime.now() + timedelta(seconds=30))
+            await asyncio.sleep(0.05)
+            scheduler.schedule(2, datetime.now() + timedelta(seconds=0.05))
+            await asyncio.sleep(0.3)
+
+        assert self._run(monkeypatch, scenario) == [[2]]
+
+    def test_registered_auctions_reach_scheduler_through_listener(self):
+        """경매 등록 알림이 경매 종료 스케줄러로 전달되는지 테스트"""
+        from app.background.auction_scheduler import auction_expiry_scheduler
+        from app.domain.ocean_trade.application.auction_events import _listeners
+
+        assert auction_expiry_scheduler.schedule in _listeners